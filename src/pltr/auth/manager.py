@@ -2,7 +2,8 @@
 Authentication manager for getting configured Foundry clients.
 """
 
-from typing import Optional, Any
+import json
+from typing import Any, Dict, Optional
 
 from .base import AuthProvider, ProfileNotFoundError, MissingCredentialsError
 from .storage import CredentialStorage
@@ -14,6 +15,11 @@ from ..config.profiles import ProfileManager
 class AuthManager:
     """Manages authentication and provides configured Foundry clients."""
 
+    # Clients built in this process, keyed by the credentials they were built
+    # from. Services for the same profile share one client, and so one
+    # connection pool; changed credentials produce a new key.
+    _clients: Dict[str, Any] = {}
+
     def __init__(self):
         """Initialize authentication manager."""
         self.storage = CredentialStorage()
@@ -51,11 +57,18 @@ class AuthManager:
                 f"Run 'pltr configure configure --profile {profile}' to set it up."
             )
 
-        # Create appropriate auth provider
-        provider = self._create_provider(credentials)
-
-        # Return authenticated client
-        return provider.get_client()
+        # Reuse the client already built from these credentials, if any
+        key = json.dumps(credentials, sort_keys=True)
+        client = self._clients.get(key)
+        if client is None:
+            provider = self._create_provider(credentials)
+            client = self._clients[key] = provider.get_client()
+        return client
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all clients built in this process."""
+        cls._clients.clear()
 
     def _create_provider(self, credentials: dict) -> AuthProvider:
         """
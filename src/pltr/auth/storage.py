@@ -4,7 +4,7 @@ Secure credential storage using keyring.
 
 import json
 import keyring
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import ProfileNotFoundError
 
@@ -14,6 +14,11 @@ class CredentialStorage:
 
     SERVICE_NAME = "pltr-cli"
 
+    # Credentials already read from the keyring in this process, by profile.
+    # Keyring lookups can be slow (and may prompt to unlock), while one
+    # command can need the same profile several times.
+    _cache: Dict[str, Dict[str, Any]] = {}
+
     def __init__(self):
         """Initialize credential storage."""
         self.keyring = keyring
@@ -29,6 +34,7 @@ class CredentialStorage:
         # Convert credentials to JSON string for storage
         credentials_json = json.dumps(credentials)
         self.keyring.set_password(self.SERVICE_NAME, profile, credentials_json)
+        self._forget(profile)
 
     def get_profile(self, profile: str) -> Dict[str, Any]:
         """
@@ -43,11 +49,14 @@ class CredentialStorage:
         Raises:
             ProfileNotFoundError: If profile doesn't exist
         """
-        credentials_json = self.keyring.get_password(self.SERVICE_NAME, profile)
-        if not credentials_json:
-            raise ProfileNotFoundError(f"Profile '{profile}' not found")
+        cached = self._cache.get(profile)
+        if cached is None:
+            credentials_json = self.keyring.get_password(self.SERVICE_NAME, profile)
+            if not credentials_json:
+                raise ProfileNotFoundError(f"Profile '{profile}' not found")
+            cached = self._cache[profile] = json.loads(credentials_json)
 
-        return json.loads(credentials_json)
+        return dict(cached)
 
     def delete_profile(self, profile: str) -> None:
         """
@@ -56,11 +65,34 @@ class CredentialStorage:
         Args:
             profile: Profile name
         """
+        self._forget(profile)
         try:
             self.keyring.delete_password(self.SERVICE_NAME, profile)
         except keyring.errors.PasswordDeleteError:
             raise ProfileNotFoundError(f"Profile '{profile}' not found")
 
+    def _forget(self, profile: str) -> None:
+        """Drop everything this process built from a profile's old credentials."""
+        # Imported here: services depend on auth, not the other way round
+        from ..services.base import clear_service_cache
+
+        self._cache.pop(profile, None)
+        # Cached services hold the client they authenticated with
+        clear_service_cache()
+
+    @classmethod
+    def clear_cache(cls, profile: Optional[str] = None) -> None:
+        """
+        Forget credentials cached in this process.
+
+        Args:
+            profile: Profile to forget (all profiles if not specified)
+        """
+        if profile is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(profile, None)
+
     def list_profiles(self) -> list:
         """
         List all available profiles.
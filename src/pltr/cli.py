@@ -2,123 +2,153 @@
 Main CLI entry point for pltr.
 """
 
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
 import typer
+from typer.core import TyperGroup
 from typing_extensions import Annotated
 
 from pltr import __version__
-from pltr.commands import (
-    configure,
-    verify,
-    dataset,
-    folder,
-    project,
-    resource,
-    resource_role,
-    space,
-    ontology,
-    orchestration,
-    sql,
-    admin,
-    shell,
-    completion,
-    alias,
-    mediasets,
-    connectivity,
-    third_party_applications,
-    aip_agents,
-    functions,
-    streams,
-    language_models,
-    models,
-    data_health,
-    audit,
-    widgets,
-)
-from pltr.commands.cp import cp_command
+
+# Sub-apps are imported only when Click looks them up, so running one command
+# (or asking for its --help) doesn't import every other command module and the
+# Foundry SDK models they pull in. Each entry maps the command name to
+# (module, attribute, help), in the order the commands were registered.
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    "configure": ("pltr.commands.configure", "app", "Manage authentication profiles"),
+    "verify": ("pltr.commands.verify", "app", "Verify authentication"),
+    "dataset": ("pltr.commands.dataset", "app", "Manage datasets"),
+    "folder": ("pltr.commands.folder", "app", "Manage folders"),
+    "project": ("pltr.commands.project", "app", "Manage projects"),
+    "resource": ("pltr.commands.resource", "app", "Manage resources"),
+    "resource-role": (
+        "pltr.commands.resource_role",
+        "app",
+        "Manage resource permissions",
+    ),
+    "space": ("pltr.commands.space", "app", "Manage spaces"),
+    "ontology": ("pltr.commands.ontology", "app", "Ontology operations"),
+    "orchestration": (
+        "pltr.commands.orchestration",
+        "app",
+        "Manage builds, jobs, and schedules",
+    ),
+    "sql": ("pltr.commands.sql", "app", "Execute SQL queries"),
+    "media-sets": (
+        "pltr.commands.mediasets",
+        "app",
+        "Manage media sets and media content",
+    ),
+    "connectivity": (
+        "pltr.commands.connectivity",
+        "app",
+        "Manage connections and data imports",
+    ),
+    "third-party-apps": (
+        "pltr.commands.third_party_applications",
+        "app",
+        "Manage third-party applications",
+    ),
+    "aip-agents": (
+        "pltr.commands.aip_agents",
+        "app",
+        "Manage AIP Agents, sessions, and versions",
+    ),
+    "functions": (
+        "pltr.commands.functions",
+        "app",
+        "Manage Functions queries and value types",
+    ),
+    "streams": (
+        "pltr.commands.streams",
+        "app",
+        "Manage streaming datasets and streams",
+    ),
+    "language-models": (
+        "pltr.commands.language_models",
+        "app",
+        "Interact with language models (Claude, OpenAI embeddings)",
+    ),
+    "models": ("pltr.commands.models", "app", "Manage ML models and versions"),
+    "data-health": (
+        "pltr.commands.data_health",
+        "app",
+        "Manage data health checks and reports",
+    ),
+    "audit": (
+        "pltr.commands.audit",
+        "app",
+        "Audit log operations for compliance and security monitoring",
+    ),
+    "widgets": (
+        "pltr.commands.widgets",
+        "app",
+        "Manage widget sets, releases, and repositories",
+    ),
+    "admin": (
+        "pltr.commands.admin",
+        "app",
+        "Admin operations for user, group, and organization management",
+    ),
+    "shell": ("pltr.commands.shell", "shell_app", "Interactive shell mode"),
+    "completion": ("pltr.commands.completion", "app", "Manage shell completions"),
+    "alias": ("pltr.commands.alias", "app", "Manage command aliases"),
+    "cp": (
+        "pltr.commands.cp",
+        "cp_command",
+        "Copy datasets or folders into another Compass folder",
+    ),
+}
+
+# LAZY_COMMANDS entries that are plain commands rather than sub-apps
+LAZY_PLAIN_COMMANDS = frozenset({"cp"})
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports LAZY_COMMANDS entries on first lookup."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Return every command in the order eager registration listed them."""
+        eager = [
+            name for name in super().list_commands(ctx) if name not in LAZY_COMMANDS
+        ]
+        # Typer lists plain commands ahead of sub-apps, whichever was
+        # registered first; the order must not change once a command loads
+        plain = [name for name in LAZY_COMMANDS if name in LAZY_PLAIN_COMMANDS]
+        groups = [name for name in LAZY_COMMANDS if name not in LAZY_PLAIN_COMMANDS]
+        return plain + eager + groups
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        """Return a command, importing and registering it if it is lazy."""
+        if name not in self.commands and name in LAZY_COMMANDS:
+            self.add_command(_load_command(name), name)
+        return super().get_command(ctx, name)
+
+
+def _load_command(name: str) -> click.Command:
+    """Import a LAZY_COMMANDS entry and build its Click command."""
+    module_name, attr, help_text = LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+
+    # Register on a throwaway Typer exactly as add_typer/command would on the
+    # main app, so names, help and rich formatting match eager registration
+    holder = typer.Typer()
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name, help=help_text)
+        group = typer.main.get_command(holder)
+        assert isinstance(group, click.Group)
+        return group.commands[name]
+    holder.command(name, help=help_text)(target)
+    return typer.main.get_command(holder)
+
 
 app = typer.Typer(
     name="pltr",
     help="Command-line interface for Palantir Foundry APIs",
     no_args_is_help=True,
-)
-
-# Add subcommands
-app.add_typer(configure.app, name="configure", help="Manage authentication profiles")
-app.add_typer(verify.app, name="verify", help="Verify authentication")
-app.add_typer(dataset.app, name="dataset", help="Manage datasets")
-app.add_typer(folder.app, name="folder", help="Manage folders")
-app.add_typer(project.app, name="project", help="Manage projects")
-app.add_typer(resource.app, name="resource", help="Manage resources")
-app.add_typer(
-    resource_role.app, name="resource-role", help="Manage resource permissions"
-)
-app.add_typer(space.app, name="space", help="Manage spaces")
-app.add_typer(ontology.app, name="ontology", help="Ontology operations")
-app.add_typer(
-    orchestration.app, name="orchestration", help="Manage builds, jobs, and schedules"
-)
-app.add_typer(sql.app, name="sql", help="Execute SQL queries")
-app.add_typer(
-    mediasets.app, name="media-sets", help="Manage media sets and media content"
-)
-app.add_typer(
-    connectivity.app, name="connectivity", help="Manage connections and data imports"
-)
-app.add_typer(
-    third_party_applications.app,
-    name="third-party-apps",
-    help="Manage third-party applications",
-)
-app.add_typer(
-    aip_agents.app,
-    name="aip-agents",
-    help="Manage AIP Agents, sessions, and versions",
-)
-app.add_typer(
-    functions.app,
-    name="functions",
-    help="Manage Functions queries and value types",
-)
-app.add_typer(
-    streams.app,
-    name="streams",
-    help="Manage streaming datasets and streams",
-)
-app.add_typer(
-    language_models.app,
-    name="language-models",
-    help="Interact with language models (Claude, OpenAI embeddings)",
-)
-app.add_typer(
-    models.app,
-    name="models",
-    help="Manage ML models and versions",
-)
-app.add_typer(
-    data_health.app,
-    name="data-health",
-    help="Manage data health checks and reports",
-)
-app.add_typer(
-    audit.app,
-    name="audit",
-    help="Audit log operations for compliance and security monitoring",
-)
-app.add_typer(
-    widgets.app,
-    name="widgets",
-    help="Manage widget sets, releases, and repositories",
-)
-app.add_typer(
-    admin.app,
-    name="admin",
-    help="Admin operations for user, group, and organization management",
-)
-app.add_typer(shell.shell_app, name="shell", help="Interactive shell mode")
-app.add_typer(completion.app, name="completion", help="Manage shell completions")
-app.add_typer(alias.app, name="alias", help="Manage command aliases")
-app.command("cp", help="Copy datasets or folders into another Compass folder")(
-    cp_command
+    cls=LazyGroup,
 )
 
 
@@ -3,16 +3,37 @@ Admin commands for the pltr CLI.
 Provides commands for user, group, role, and organization management.
 """
 
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
+import click
 import typer
-from rich.console import Console
 
-from ..services.admin import AdminService
-from ..utils.formatting import OutputFormatter
-from ..utils.progress import SpinnerProgressTracker
-from ..utils.pagination import PaginationConfig
+from ..utils.concurrency import MAX_CONCURRENT_REQUESTS, run_each
+from ..utils.pagination import PaginationConfig, PaginationMetadata, prefetch
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.admin import AdminService
+    from ..utils.formatting import OutputFormatter
 
 # Create the main admin app
 app = typer.Typer(
@@ -34,18 +55,264 @@ app.add_typer(org_app, name="org")
 app.add_typer(marking_app, name="marking")
 
 
+# Options shared by most admin commands
+PROFILE_OPT = typer.Option(None, "--profile", help="Auth profile to use")
+FORMAT_OPT = typer.Option("table", "--format", help="Output format (table, json, csv)")
+OUTPUT_OPT = typer.Option(None, "--output", help="Save results to file")
+PAGE_TOKEN_OPT = typer.Option(
+    None, "--page-token", help="Pagination token from previous response"
+)
+CONFIRM_OPT = typer.Option(False, "--confirm", help="Skip confirmation prompt")
+IDS_FILE_OPT = typer.Option(
+    None, "--ids-file", help="Read additional IDs from a file, one per line"
+)
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+def _print_error(message: str) -> None:
+    """Print an error message to stderr."""
+    typer.secho("Error:", fg=typer.colors.RED, err=True, nl=False)
+    typer.echo(f" {message}", err=True)
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all admin commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+@contextmanager
+def _exit_on_error() -> Iterator[None]:
+    """Report any error raised in the block and exit with status 1."""
+    from ..auth.base import AuthError
+
+    try:
+        yield
+    except AuthError as e:
+        _print_error(f"Authentication error: {e}")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        _print_error(str(e))
+        raise typer.Exit(code=1)
+
+
+def _admin_service(profile: Optional[str]) -> AdminService:
+    """
+    Return the cached AdminService for a profile, authenticated up front.
+
+    Authenticating here means credential problems are reported as such
+    rather than wrapped in the failure message of the first API call.
+    """
+    from ..services.admin import AdminService
+    from ..services.base import get_service
+
+    service = get_service(AdminService, profile)
+    service.authenticate()
+    return service
+
+
+def _run(
+    profile: Optional[str],
+    spinner_msg: Union[str, Callable[[], str]],
+    call: Callable[[AdminService], Any],
+) -> Any:
+    """
+    Call the admin service behind a spinner.
+
+    Args:
+        profile: Auth profile to use (the active profile is looked up only
+            when this is None)
+        spinner_msg: Message shown while the call is in progress, or a
+            callable building it (only evaluated when the spinner renders)
+        call: Function invoked with the AdminService instance
+
+    Returns:
+        Result of the service call
+    """
+    from ..utils.progress import spinner
+
+    with _exit_on_error():
+        service = _admin_service(profile)
+        with spinner(spinner_msg):
+            return call(service)
+
+
+NON_INTERACTIVE_CONFIRM_MSG = "--confirm is required when not running interactively"
+
+
+def _confirm(confirmed: bool, message: str) -> bool:
+    """
+    Ask the user to confirm a destructive operation.
+
+    Args:
+        confirmed: True when --confirm was passed, which skips the prompt
+        message: Question shown to the user
+
+    Returns:
+        True if the operation should proceed
+
+    Raises:
+        typer.Exit: If there is no stdin to read an answer from
+    """
+    if confirmed:
+        return True
+    # With stdin closed (e.g. `<&-` in scripts) nothing can answer the
+    # prompt, so fail straight away instead of setting it up
+    if sys.stdin is None or sys.stdin.closed:
+        _print_error(NON_INTERACTIVE_CONFIRM_MSG)
+        raise typer.Exit(1)
+    try:
+        answer = typer.confirm(message)
+    except click.Abort:
+        # EOF on a pipe means the caller is a script, not a user pressing
+        # Ctrl-D at a terminal; tell it how to skip the prompt
+        if sys.stdin.isatty():
+            raise
+        _print_error(NON_INTERACTIVE_CONFIRM_MSG)
+        raise typer.Exit(1)
+    if answer:
+        return True
+    typer.echo("Operation cancelled.")
+    return False
+
+
+def _confirm_many(confirmed: bool, action: str, ids: List[str], kind: str) -> bool:
+    """
+    Ask once before applying a destructive operation to many IDs.
+
+    Args:
+        confirmed: True when --confirm was passed, which skips the prompt
+        action: Verb describing the operation (e.g. "delete")
+        ids: IDs the operation will be applied to
+        kind: Plural name of the resource, used in the prompt
+
+    Returns:
+        True if the operation should proceed
+    """
+    return _confirm(confirmed, f"Are you sure you want to {action} {len(ids)} {kind}?")
+
+
+def _emit(
+    result: Any,
+    output_file: Optional[Path],
+    output_format: str,
+    success_msg: Optional[str] = None,
+) -> None:
+    """
+    Save a result to a file or display it.
+
+    Args:
+        result: Data returned by the service
+        output_file: File to save results to (displays when not provided)
+        output_format: Output format (table, json, csv)
+        success_msg: Message printed after displaying the result
+    """
+    with _exit_on_error():
+        if output_file:
+            _formatter().save_to_file(result, output_file, output_format)
+            _console().print(f"Results saved to {output_file}")
+        else:
+            _formatter().display(result, output_format)
+            if success_msg:
+                _console().print(success_msg, style="green", markup=False)
+
+
+# Maximum number of IDs accepted by a single batch-get API request
+BATCH_SIZE_LIMIT = 500
+
+
+def _validate_ids(
+    ids: Optional[List[str]], ids_file: Optional[Path], kind: str
+) -> List[str]:
+    """
+    Collect and normalize batch-get IDs before any service is constructed.
+
+    IDs come from the command line and, if given, from --ids-file (one per
+    line, read lazily). Surrounding whitespace is stripped, blank entries
+    are dropped and duplicates are removed (keeping first-seen order), so
+    obviously bad input fails fast and no ID is requested twice.
+
+    Args:
+        ids: IDs as given on the command line
+        ids_file: Optional file with one ID per line
+        kind: Name of the resource, used in the error message
+
+    Returns:
+        Cleaned list of IDs
+    """
+    with _exit_on_error(), ExitStack() as stack:
+        sources: List[Iterable[str]] = [ids or []]
+        if ids_file:
+            sources.append(stack.enter_context(open(ids_file)))
+        cleaned = list(
+            dict.fromkeys(i.strip() for i in chain.from_iterable(sources) if i.strip())
+        )
+    if not cleaned:
+        _print_error(f"No {kind} IDs provided")
+        raise typer.Exit(code=1)
+    return cleaned
+
+
+def _run_batched(
+    ids: List[str],
+    fn: Callable[[List[str]], Dict[str, Any]],
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+) -> Dict[str, Any]:
+    """
+    Fetch IDs in API-sized batches, issuing the batch requests concurrently.
+
+    Each batch-get endpoint resolves up to BATCH_SIZE_LIMIT IDs in a single
+    round trip, so larger inputs are split into batches that are fetched in
+    parallel and merged into one response.
+
+    Args:
+        ids: IDs to fetch
+        fn: Service method taking a list of IDs and returning {"data": {...}}
+        concurrency: Maximum number of batch requests in flight
+
+    Returns:
+        Dictionary containing the merged batch responses
+    """
+    batches = [
+        ids[i : i + BATCH_SIZE_LIMIT] for i in range(0, len(ids), BATCH_SIZE_LIMIT)
+    ]
+    if len(batches) == 1:
+        return fn(batches[0])
+
+    merged: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+        for response in executor.map(fn, batches):
+            merged.update(response.get("data", {}))
+    return {"data": merged}
+
+
+def _report_each(
+    action: str, ids: List[str], kind: str, failures: Dict[str, str]
+) -> None:
+    """Summarize a run_each result, exiting with an error if any ID failed."""
+    done = len(ids) - len(failures)
+    typer.secho(f"{action} {done} of {len(ids)} {kind}", fg=typer.colors.GREEN)
+    if failures:
+        for item_id, error in failures.items():
+            _print_error(f"{item_id}: {error}")
+        raise typer.Exit(code=1)
+
+
 # User Management Commands
 @user_app.command("list")
 def list_users(
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of users per page (default: from settings)"
     ),
@@ -78,1007 +345,590 @@ def list_users(
         # Resume from a specific page
         pltr admin user list --page-token abc123
     """
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        # Create pagination config
-        config = PaginationConfig(
-            page_size=page_size,
-            max_pages=max_pages,
-            page_token=page_token,
-            fetch_all=all,
+    config = PaginationConfig(
+        page_size=page_size,
+        max_pages=max_pages,
+        page_token=page_token,
+        fetch_all=all,
+    )
+
+    if output_file and output_format in ("json", "csv"):
+        # Write each page as it arrives instead of collecting every user first
+        metadata = PaginationMetadata()
+        _run(
+            profile,
+            "Fetching users...",
+            lambda s: _formatter().stream_paginated_to_file(
+                # Fetch the next page while the current one is written out
+                prefetch(s.iter_users_pages(config, metadata)),
+                metadata,
+                output_file,
+                output_format,
+            ),
         )
+        _console().print(f"Results saved to {output_file}", style="green", markup=False)
+        return
 
-        with SpinnerProgressTracker().track_spinner("Fetching users..."):
-            result = service.list_users_paginated(config)
+    result = _run(
+        profile, "Fetching users...", lambda s: s.list_users_paginated(config)
+    )
 
-        # Format and display paginated results
+    # Format and display paginated results
+    with _exit_on_error():
         if output_file:
-            formatter.format_paginated_output(result, output_format, str(output_file))
-            console.print(f"[green]Results saved to {output_file}[/green]")
+            _formatter().format_paginated_output(
+                result, output_format, str(output_file)
+            )
+            _console().print(
+                f"Results saved to {output_file}", style="green", markup=False
+            )
         else:
-            formatter.format_paginated_output(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+            _formatter().format_paginated_output(result, output_format)
 
 
 @user_app.command("get")
 def get_user(
     user_id: str = typer.Argument(..., help="User ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about a specific user."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Fetching user {user_id}..."):
-            result = service.get_user(user_id)
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile, lambda: f"Fetching user {user_id}...", lambda s: s.get_user(user_id)
+    )
+    _emit(result, output_file, output_format)
 
 
 @user_app.command("current")
 def get_current_user(
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about the current authenticated user."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Fetching current user info..."):
-            result = service.get_current_user()
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile, "Fetching current user info...", lambda s: s.get_current_user()
+    )
+    _emit(result, output_file, output_format)
 
 
 @user_app.command("search")
 def search_users(
     query: str = typer.Argument(..., help="Search query string"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of users per page"
     ),
-    page_token: Optional[str] = typer.Option(
-        None, "--page-token", help="Pagination token from previous response"
-    ),
+    page_token: Optional[str] = PAGE_TOKEN_OPT,
 ) -> None:
     """Search for users by query string."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Searching users for '{query}'..."
-        ):
-            result = service.search_users(
-                query=query, page_size=page_size, page_token=page_token
-            )
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Searching users for '{query}'...",
+        lambda s: s.search_users(
+            query=query, page_size=page_size, page_token=page_token
+        ),
+    )
+    _emit(result, output_file, output_format)
 
 
 @user_app.command("markings")
 def get_user_markings(
     user_id: str = typer.Argument(..., help="User ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get markings/permissions for a specific user."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching markings for user {user_id}..."
-        ):
-            result = service.get_user_markings(user_id)
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Fetching markings for user {user_id}...",
+        lambda s: s.get_user_markings(user_id),
+    )
+    _emit(result, output_file, output_format)
 
 
 @user_app.command("revoke-tokens")
 def revoke_user_tokens(
     user_id: str = typer.Argument(..., help="User ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    profile: Optional[str] = PROFILE_OPT,
+    confirm: bool = CONFIRM_OPT,
 ) -> None:
     """Revoke all tokens for a specific user."""
-    console = Console()
-
-    # Confirmation prompt
-    if not confirm:
-        user_confirm = typer.confirm(
-            f"Are you sure you want to revoke all tokens for user {user_id}?"
-        )
-        if not user_confirm:
-            console.print("Operation cancelled.")
-            return
-
-    try:
-        service = AdminService(profile=profile)
+    if not _confirm(
+        confirm, f"Are you sure you want to revoke all tokens for user {user_id}?"
+    ):
+        return
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Revoking tokens for user {user_id}..."
-        ):
-            result = service.revoke_user_tokens(user_id)
-
-        console.print(f"[green]{result['message']}[/green]")
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Revoking tokens for user {user_id}...",
+        lambda s: s.revoke_user_tokens(user_id),
+    )
+    typer.secho(result["message"], fg=typer.colors.GREEN)
 
 
 @user_app.command("delete")
 def delete_user(
     user_id: str = typer.Argument(..., help="User ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    profile: Optional[str] = PROFILE_OPT,
+    confirm: bool = CONFIRM_OPT,
 ) -> None:
     """Delete a specific user."""
-    console = Console()
+    if not _confirm(confirm, f"Are you sure you want to delete user {user_id}?"):
+        return
 
-    # Confirmation prompt
-    if not confirm:
-        user_confirm = typer.confirm(f"Are you sure you want to delete user {user_id}?")
-        if not user_confirm:
-            console.print("Operation cancelled.")
-            return
-
-    try:
-        service = AdminService(profile=profile)
+    result = _run(
+        profile, lambda: f"Deleting user {user_id}...", lambda s: s.delete_user(user_id)
+    )
+    typer.secho(result["message"], fg=typer.colors.GREEN)
 
-        with SpinnerProgressTracker().track_spinner(f"Deleting user {user_id}..."):
-            result = service.delete_user(user_id)
 
-        console.print(f"[green]{result['message']}[/green]")
+@user_app.command("batch-delete")
+def batch_delete_users(
+    user_ids: Optional[List[str]] = typer.Argument(None, help="User IDs or RIDs"),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    confirm: bool = CONFIRM_OPT,
+) -> None:
+    """Delete multiple users after a single confirmation."""
+    user_ids = _validate_ids(user_ids, ids_file, "user")
+    if not _confirm_many(confirm, "delete", user_ids, "users"):
+        return
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    failures = _run(
+        profile,
+        lambda: f"Deleting {len(user_ids)} users...",
+        lambda s: run_each(user_ids, s.delete_user),
+    )
+    _report_each("Deleted", user_ids, "users", failures)
 
 
 @user_app.command("batch-get")
 def batch_get_users(
-    user_ids: List[str] = typer.Argument(
-        ..., help="User IDs or RIDs (space-separated, max 500)"
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
+    user_ids: Optional[List[str]] = typer.Argument(
+        None, help="User IDs or RIDs (space-separated, fetched in batches of 500)"
     ),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
-    """Batch retrieve multiple users (max 500)."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching {len(user_ids)} users..."
-        ):
-            result = service.get_batch_users(user_ids)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    """Batch retrieve multiple users."""
+    user_ids = _validate_ids(user_ids, ids_file, "user")
+    result = _run(
+        profile,
+        lambda: f"Fetching {len(user_ids)} users...",
+        lambda s: _run_batched(user_ids, s.get_batch_users),
+    )
+    _emit(result, output_file, output_format)
 
 
 # Group Management Commands
 @group_app.command("list")
 def list_groups(
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of groups per page"
     ),
-    page_token: Optional[str] = typer.Option(
-        None, "--page-token", help="Pagination token from previous response"
-    ),
+    page_token: Optional[str] = PAGE_TOKEN_OPT,
 ) -> None:
     """List all groups in the organization."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Fetching groups..."):
-            result = service.list_groups(page_size=page_size, page_token=page_token)
-
-        # Extract data from result (service returns {data: [...], next_page_token: ...})
-        groups = result.get("data", [])
-        next_token = result.get("next_page_token")
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(groups, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(groups, output_format)
-
-        # Show pagination info
-        if next_token:
-            console.print(
-                f"\n[dim]More results available. Use --page-token {next_token} to continue[/dim]"
-            )
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        "Fetching groups...",
+        lambda s: s.list_groups(page_size=page_size, page_token=page_token),
+    )
+
+    # Extract data from result (service returns {data: [...], next_page_token: ...})
+    groups = result.get("data", [])
+    next_token = result.get("next_page_token")
+    _emit(groups, output_file, output_format)
+
+    # Show pagination info
+    if next_token:
+        _console().print(
+            f"\nMore results available. Use --page-token {next_token} to continue",
+            style="dim",
+            markup=False,
+        )
 
 
 @group_app.command("get")
 def get_group(
     group_id: str = typer.Argument(..., help="Group ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about a specific group."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Fetching group {group_id}..."):
-            result = service.get_group(group_id)
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Fetching group {group_id}...",
+        lambda s: s.get_group(group_id),
+    )
+    _emit(result, output_file, output_format)
 
 
 @group_app.command("search")
 def search_groups(
     query: str = typer.Argument(..., help="Search query string"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of groups per page"
     ),
-    page_token: Optional[str] = typer.Option(
-        None, "--page-token", help="Pagination token from previous response"
-    ),
+    page_token: Optional[str] = PAGE_TOKEN_OPT,
 ) -> None:
     """Search for groups by query string."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Searching groups for '{query}'..."
-        ):
-            result = service.search_groups(
-                query=query, page_size=page_size, page_token=page_token
-            )
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Searching groups for '{query}'...",
+        lambda s: s.search_groups(
+            query=query, page_size=page_size, page_token=page_token
+        ),
+    )
+    _emit(result, output_file, output_format)
 
 
 @group_app.command("create")
 def create_group(
     name: str = typer.Argument(..., help="Group name"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
     description: Optional[str] = typer.Option(
         None, "--description", help="Group description"
     ),
     organization_rid: Optional[str] = typer.Option(
         None, "--org-rid", help="Organization RID"
     ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Create a new group."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Creating group '{name}'..."):
-            result = service.create_group(
-                name=name, description=description, organization_rid=organization_rid
-            )
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-            console.print(f"[green]Group '{name}' created successfully[/green]")
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Creating group '{name}'...",
+        lambda s: s.create_group(
+            name=name, description=description, organization_rid=organization_rid
+        ),
+    )
+    _emit(
+        result,
+        output_file,
+        output_format,
+        success_msg=f"Group '{name}' created successfully",
+    )
 
 
 @group_app.command("delete")
 def delete_group(
     group_id: str = typer.Argument(..., help="Group ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    profile: Optional[str] = PROFILE_OPT,
+    confirm: bool = CONFIRM_OPT,
 ) -> None:
     """Delete a specific group."""
-    console = Console()
-
-    # Confirmation prompt
-    if not confirm:
-        user_confirm = typer.confirm(
-            f"Are you sure you want to delete group {group_id}?"
-        )
-        if not user_confirm:
-            console.print("Operation cancelled.")
-            return
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Deleting group {group_id}..."):
-            result = service.delete_group(group_id)
-
-        console.print(f"[green]{result['message']}[/green]")
+    if not _confirm(confirm, f"Are you sure you want to delete group {group_id}?"):
+        return
+
+    result = _run(
+        profile,
+        lambda: f"Deleting group {group_id}...",
+        lambda s: s.delete_group(group_id),
+    )
+    typer.secho(result["message"], fg=typer.colors.GREEN)
+
+
+@group_app.command("batch-delete")
+def batch_delete_groups(
+    group_ids: Optional[List[str]] = typer.Argument(None, help="Group IDs or RIDs"),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    confirm: bool = CONFIRM_OPT,
+) -> None:
+    """Delete multiple groups after a single confirmation."""
+    group_ids = _validate_ids(group_ids, ids_file, "group")
+    if not _confirm_many(confirm, "delete", group_ids, "groups"):
+        return
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    failures = _run(
+        profile,
+        lambda: f"Deleting {len(group_ids)} groups...",
+        lambda s: run_each(group_ids, s.delete_group),
+    )
+    _report_each("Deleted", group_ids, "groups", failures)
 
 
 @group_app.command("batch-get")
 def batch_get_groups(
-    group_ids: List[str] = typer.Argument(
-        ..., help="Group IDs or RIDs (space-separated, max 500)"
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
+    group_ids: Optional[List[str]] = typer.Argument(
+        None, help="Group IDs or RIDs (space-separated, fetched in batches of 500)"
     ),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
-    """Batch retrieve multiple groups (max 500)."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching {len(group_ids)} groups..."
-        ):
-            result = service.get_batch_groups(group_ids)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    """Batch retrieve multiple groups."""
+    group_ids = _validate_ids(group_ids, ids_file, "group")
+    result = _run(
+        profile,
+        lambda: f"Fetching {len(group_ids)} groups...",
+        lambda s: _run_batched(group_ids, s.get_batch_groups),
+    )
+    _emit(result, output_file, output_format)
 
 
 # Role Management Commands
 @role_app.command("get")
 def get_role(
     role_id: str = typer.Argument(..., help="Role ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about a specific role."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Fetching role {role_id}..."):
-            result = service.get_role(role_id)
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile, lambda: f"Fetching role {role_id}...", lambda s: s.get_role(role_id)
+    )
+    _emit(result, output_file, output_format)
 
 
 @role_app.command("batch-get")
 def batch_get_roles(
-    role_ids: List[str] = typer.Argument(
-        ..., help="Role IDs or RIDs (space-separated, max 500)"
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
+    role_ids: Optional[List[str]] = typer.Argument(
+        None, help="Role IDs or RIDs (space-separated, fetched in batches of 500)"
     ),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
-    """Batch retrieve multiple roles (max 500)."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching {len(role_ids)} roles..."
-        ):
-            result = service.get_batch_roles(role_ids)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    """Batch retrieve multiple roles."""
+    role_ids = _validate_ids(role_ids, ids_file, "role")
+    result = _run(
+        profile,
+        lambda: f"Fetching {len(role_ids)} roles...",
+        lambda s: _run_batched(role_ids, s.get_batch_roles),
+    )
+    _emit(result, output_file, output_format)
 
 
 # Organization Management Commands
 @org_app.command("get")
 def get_organization(
     organization_id: str = typer.Argument(..., help="Organization ID or RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about a specific organization."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching organization {organization_id}..."
-        ):
-            result = service.get_organization(organization_id)
-
-        # Format and display results
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Fetching organization {organization_id}...",
+        lambda s: s.get_organization(organization_id),
+    )
+    _emit(result, output_file, output_format)
 
 
 @org_app.command("create")
 def create_organization(
     name: str = typer.Argument(..., help="Organization name"),
     enrollment_rid: str = typer.Option(..., "--enrollment-rid", help="Enrollment RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
     admin_ids: Optional[List[str]] = typer.Option(
         None, "--admin-id", help="Admin user IDs (can specify multiple)"
     ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Create a new organization."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Creating organization '{name}'..."
-        ):
-            result = service.create_organization(
-                name=name, enrollment_rid=enrollment_rid, admin_ids=admin_ids
-            )
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-            console.print(f"[green]Organization '{name}' created successfully[/green]")
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Creating organization '{name}'...",
+        lambda s: s.create_organization(
+            name=name, enrollment_rid=enrollment_rid, admin_ids=admin_ids
+        ),
+    )
+    _emit(
+        result,
+        output_file,
+        output_format,
+        success_msg=f"Organization '{name}' created successfully",
+    )
 
 
 @org_app.command("replace")
 def replace_organization(
     organization_rid: str = typer.Argument(..., help="Organization RID"),
     name: str = typer.Argument(..., help="New organization name"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
     description: Optional[str] = typer.Option(
         None, "--description", help="New organization description"
     ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
-    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
+    confirm: bool = CONFIRM_OPT,
 ) -> None:
     """Replace/update an existing organization."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    if not confirm:
-        user_confirm = typer.confirm(
-            f"Are you sure you want to replace organization {organization_rid}?"
-        )
-        if not user_confirm:
-            console.print("Operation cancelled.")
-            return
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Replacing organization {organization_rid}..."
-        ):
-            result = service.replace_organization(
-                organization_rid=organization_rid, name=name, description=description
-            )
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-            console.print(
-                f"[green]Organization '{organization_rid}' replaced successfully[/green]"
-            )
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    if not _confirm(
+        confirm, f"Are you sure you want to replace organization {organization_rid}?"
+    ):
+        return
+
+    result = _run(
+        profile,
+        lambda: f"Replacing organization {organization_rid}...",
+        lambda s: s.replace_organization(
+            organization_rid=organization_rid, name=name, description=description
+        ),
+    )
+    _emit(
+        result,
+        output_file,
+        output_format,
+        success_msg=f"Organization '{organization_rid}' replaced successfully",
+    )
 
 
 @org_app.command("available-roles")
 def list_available_roles(
     organization_rid: str = typer.Argument(..., help="Organization RID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of roles per page"
     ),
-    page_token: Optional[str] = typer.Option(
-        None, "--page-token", help="Pagination token from previous response"
-    ),
+    page_token: Optional[str] = PAGE_TOKEN_OPT,
 ) -> None:
     """List available roles for an organization."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching available roles for organization {organization_rid}..."
-        ):
-            result = service.list_available_roles(
-                organization_rid, page_size=page_size, page_token=page_token
-            )
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Fetching available roles for organization {organization_rid}...",
+        lambda s: s.list_available_roles(
+            organization_rid, page_size=page_size, page_token=page_token
+        ),
+    )
+    _emit(result, output_file, output_format)
 
 
 # Marking Management Commands
 @marking_app.command("list")
 def list_markings(
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
     page_size: Optional[int] = typer.Option(
         None, "--page-size", help="Number of markings per page"
     ),
-    page_token: Optional[str] = typer.Option(
-        None, "--page-token", help="Pagination token from previous response"
-    ),
+    page_token: Optional[str] = PAGE_TOKEN_OPT,
 ) -> None:
     """List all markings."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Fetching markings..."):
-            result = service.list_markings(page_size=page_size, page_token=page_token)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        "Fetching markings...",
+        lambda s: s.list_markings(page_size=page_size, page_token=page_token),
+    )
+    _emit(result, output_file, output_format)
 
 
 @marking_app.command("get")
 def get_marking(
     marking_id: str = typer.Argument(..., help="Marking ID"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Get information about a specific marking."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching marking {marking_id}..."
-        ):
-            result = service.get_marking(marking_id)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Fetching marking {marking_id}...",
+        lambda s: s.get_marking(marking_id),
+    )
+    _emit(result, output_file, output_format)
 
 
 @marking_app.command("batch-get")
 def batch_get_markings(
-    marking_ids: List[str] = typer.Argument(
-        ..., help="Marking IDs (space-separated, max 500)"
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
+    marking_ids: Optional[List[str]] = typer.Argument(
+        None, help="Marking IDs (space-separated, fetched in batches of 500)"
     ),
+    ids_file: Optional[Path] = IDS_FILE_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
-    """Batch retrieve multiple markings (max 500)."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching {len(marking_ids)} markings..."
-        ):
-            result = service.get_batch_markings(marking_ids)
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    """Batch retrieve multiple markings."""
+    marking_ids = _validate_ids(marking_ids, ids_file, "marking")
+    result = _run(
+        profile,
+        lambda: f"Fetching {len(marking_ids)} markings...",
+        lambda s: _run_batched(marking_ids, s.get_batch_markings),
+    )
+    _emit(result, output_file, output_format)
 
 
 @marking_app.command("create")
 def create_marking(
     name: str = typer.Argument(..., help="Marking name"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
     description: Optional[str] = typer.Option(
         None, "--description", help="Marking description"
     ),
     category_id: Optional[str] = typer.Option(
         None, "--category-id", help="Category ID for the marking"
     ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
 ) -> None:
     """Create a new marking."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(f"Creating marking '{name}'..."):
-            result = service.create_marking(
-                name=name, description=description, category_id=category_id
-            )
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-            console.print(f"[green]Marking '{name}' created successfully[/green]")
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    result = _run(
+        profile,
+        lambda: f"Creating marking '{name}'...",
+        lambda s: s.create_marking(
+            name=name, description=description, category_id=category_id
+        ),
+    )
+    _emit(
+        result,
+        output_file,
+        output_format,
+        success_msg=f"Marking '{name}' created successfully",
+    )
 
 
 @marking_app.command("replace")
 def replace_marking(
     marking_id: str = typer.Argument(..., help="Marking ID"),
     name: str = typer.Argument(..., help="New marking name"),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", help="Auth profile to use"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
     description: Optional[str] = typer.Option(
         None, "--description", help="New marking description"
     ),
-    output_format: str = typer.Option(
-        "table", "--format", help="Output format (table, json, csv)"
-    ),
-    output_file: Optional[Path] = typer.Option(
-        None, "--output", help="Save results to file"
-    ),
-    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    output_format: str = FORMAT_OPT,
+    output_file: Optional[Path] = OUTPUT_OPT,
+    confirm: bool = CONFIRM_OPT,
 ) -> None:
     """Replace/update an existing marking."""
-    console = Console()
-    formatter = OutputFormatter()
-
-    if not confirm:
-        user_confirm = typer.confirm(
-            f"Are you sure you want to replace marking {marking_id}?"
-        )
-        if not user_confirm:
-            console.print("Operation cancelled.")
-            return
-
-    try:
-        service = AdminService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Replacing marking {marking_id}..."
-        ):
-            result = service.replace_marking(
-                marking_id=marking_id, name=name, description=description
-            )
-
-        if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"Results saved to {output_file}")
-        else:
-            formatter.display(result, output_format)
-            console.print(
-                f"[green]Marking '{marking_id}' replaced successfully[/green]"
-            )
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+    if not _confirm(confirm, f"Are you sure you want to replace marking {marking_id}?"):
+        return
+
+    result = _run(
+        profile,
+        lambda: f"Replacing marking {marking_id}...",
+        lambda s: s.replace_marking(
+            marking_id=marking_id, name=name, description=description
+        ),
+    )
+    _emit(
+        result,
+        output_file,
+        output_format,
+        success_msg=f"Marking '{marking_id}' replaced successfully",
+    )
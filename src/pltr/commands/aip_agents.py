@@ -3,21 +3,27 @@ AIP Agents management commands for Foundry.
 Provides commands for agent inspection, session management, and version control.
 """
 
+from __future__ import annotations
+
 import typer
-from typing import Optional
-from rich.console import Console
+from functools import lru_cache
+from typing import TYPE_CHECKING, ContextManager, Optional
 
-from ..services.aip_agents import AipAgentsService
-from ..utils.formatting import OutputFormatter
-from ..utils.progress import SpinnerProgressTracker
 from ..utils.pagination import PaginationConfig
-from ..auth.base import ProfileNotFoundError, MissingCredentialsError
 from ..utils.completion import (
     complete_rid,
     complete_profile,
     complete_output_format,
     cache_rid,
+    cache_rids,
 )
+from ..utils.errors import handle_cli_errors
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.aip_agents import AipAgentsService
+    from ..utils.formatting import OutputFormatter
 
 # Create main app and sub-apps
 app = typer.Typer(help="Manage AIP Agents, sessions, and versions")
@@ -28,11 +34,40 @@ versions_app = typer.Typer(help="Manage agent versions")
 app.add_typer(sessions_app, name="sessions")
 app.add_typer(versions_app, name="versions")
 
-console = Console()
-formatter = OutputFormatter(console)
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all AIP agents commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+def _service(profile: Optional[str]) -> AipAgentsService:
+    """Return the cached AipAgentsService for a profile."""
+    from ..services.aip_agents import AipAgentsService
+    from ..services.base import get_service
+
+    return get_service(AipAgentsService, profile)
+
+
+def _spinner(description: str) -> ContextManager[None]:
+    """Show a spinner while the block runs, if output is a terminal."""
+    from ..utils.progress import spinner
+
+    return spinner(description)
 
 
 @app.command("get")
+@handle_cli_errors("Failed to get agent", _formatter)
 def get_agent(
     agent_rid: str = typer.Argument(
         ...,
@@ -80,32 +115,22 @@ def get_agent(
         # Output as JSON
         pltr aip-agents get ri.foundry.main.agent.abc123 --format json
     """
-    try:
-        cache_rid(agent_rid)
-
-        service = AipAgentsService(profile=profile)
+    cache_rid(agent_rid)
 
-        with SpinnerProgressTracker().track_spinner(f"Fetching agent {agent_rid}..."):
-            agent = service.get_agent(agent_rid, version=version)
+    service = _service(profile)
 
-        if output:
-            formatter.save_to_file(agent, output, format)
-            formatter.print_success(f"Agent information saved to {output}")
-        else:
-            formatter.display(agent, format)
+    with _spinner(f"Fetching agent {agent_rid}..."):
+        agent = service.get_agent(agent_rid, version=version)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except ValueError as e:
-        formatter.print_error(f"Invalid request: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get agent: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().save_to_file(agent, output, format)
+        _formatter().print_success(f"Agent information saved to {output}")
+    else:
+        _formatter().display(agent, format)
 
 
 @sessions_app.command("list")
+@handle_cli_errors("Failed to list sessions", _formatter)
 def list_sessions(
     agent_rid: str = typer.Argument(
         ...,
@@ -153,40 +178,31 @@ def list_sessions(
         pltr aip-agents sessions list ri.foundry.main.agent.abc123 \\
             --page-size 50 --max-pages 3
     """
-    try:
-        cache_rid(agent_rid)
-
-        service = AipAgentsService(profile=profile)
-        config = PaginationConfig(
-            page_size=page_size,
-            max_pages=max_pages,
-            fetch_all=all,
-        )
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching sessions for agent {agent_rid}..."
-        ):
-            result = service.list_sessions(agent_rid, config)
-
-        if not result.data:
-            console.print("[yellow]No sessions found for this agent[/yellow]")
-            return
-
-        if output:
-            formatter.format_paginated_output(result, format, output)
-            console.print(f"[green]Results saved to {output}[/green]")
-        else:
-            formatter.format_paginated_output(result, format)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list sessions: {e}")
-        raise typer.Exit(1)
+    cache_rid(agent_rid)
+
+    service = _service(profile)
+    config = PaginationConfig(
+        page_size=page_size,
+        max_pages=max_pages,
+        fetch_all=all,
+    )
+
+    with _spinner(f"Fetching sessions for agent {agent_rid}..."):
+        result = service.list_sessions(agent_rid, config)
+
+    if not result.data:
+        _console().print("[yellow]No sessions found for this agent[/yellow]")
+        return
+
+    if output:
+        _formatter().format_paginated_output(result, format, output)
+        _console().print(f"[green]Results saved to {output}[/green]")
+    else:
+        _formatter().format_paginated_output(result, format)
 
 
 @sessions_app.command("get")
+@handle_cli_errors("Failed to get session", _formatter)
 def get_session(
     agent_rid: str = typer.Argument(
         ...,
@@ -228,32 +244,22 @@ def get_session(
             ri.foundry.main.session.xyz789 \\
             --format json --output session.json
     """
-    try:
-        cache_rid(agent_rid)
-        cache_rid(session_rid)
-
-        service = AipAgentsService(profile=profile)
+    cache_rids(agent_rid, session_rid)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching session {session_rid}..."
-        ):
-            session = service.get_session(agent_rid, session_rid)
+    service = _service(profile)
 
-        if output:
-            formatter.save_to_file(session, output, format)
-            formatter.print_success(f"Session information saved to {output}")
-        else:
-            formatter.display(session, format)
+    with _spinner(f"Fetching session {session_rid}..."):
+        session = service.get_session(agent_rid, session_rid)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get session: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().save_to_file(session, output, format)
+        _formatter().print_success(f"Session information saved to {output}")
+    else:
+        _formatter().display(session, format)
 
 
 @versions_app.command("list")
+@handle_cli_errors("Failed to list versions", _formatter)
 def list_versions(
     agent_rid: str = typer.Argument(
         ...,
@@ -300,34 +306,24 @@ def list_versions(
         pltr aip-agents versions list ri.foundry.main.agent.abc123 \\
             --all --format csv --output versions.csv
     """
-    try:
-        cache_rid(agent_rid)
-
-        service = AipAgentsService(profile=profile)
-        config = PaginationConfig(
-            page_size=page_size,
-            max_pages=max_pages,
-            fetch_all=all,
-        )
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching versions for agent {agent_rid}..."
-        ):
-            result = service.list_versions(agent_rid, config)
-
-        if not result.data:
-            console.print("[yellow]No versions found for this agent[/yellow]")
-            return
-
-        if output:
-            formatter.format_paginated_output(result, format, output)
-            console.print(f"[green]Results saved to {output}[/green]")
-        else:
-            formatter.format_paginated_output(result, format)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list versions: {e}")
-        raise typer.Exit(1)
+    cache_rid(agent_rid)
+
+    service = _service(profile)
+    config = PaginationConfig(
+        page_size=page_size,
+        max_pages=max_pages,
+        fetch_all=all,
+    )
+
+    with _spinner(f"Fetching versions for agent {agent_rid}..."):
+        result = service.list_versions(agent_rid, config)
+
+    if not result.data:
+        _console().print("[yellow]No versions found for this agent[/yellow]")
+        return
+
+    if output:
+        _formatter().format_paginated_output(result, format, output)
+        _console().print(f"[green]Results saved to {output}[/green]")
+    else:
+        _formatter().format_paginated_output(result, format)
@@ -3,38 +3,115 @@ Audit log file management commands for Foundry.
 Provides access to audit logs for compliance and security monitoring.
 """
 
-from datetime import date, datetime
-from pathlib import Path
-from typing import Optional
+from __future__ import annotations
+
+import codecs
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, ContextManager, Iterator, Optional
 
 import typer
-from rich.console import Console
 
-from ..auth.base import MissingCredentialsError, ProfileNotFoundError
-from ..services.audit import AuditService
 from ..utils.completion import (
     complete_output_format,
     complete_profile,
     complete_rid,
     cache_rid,
 )
-from ..utils.formatting import OutputFormatter
-from ..utils.progress import SpinnerProgressTracker
+from ..utils.errors import handle_cli_errors
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.audit import AuditService
+    from ..utils.formatting import OutputFormatter
 
 app = typer.Typer(help="Audit log operations for compliance and security monitoring")
-console = Console()
-formatter = OutputFormatter(console)
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all audit commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+def _service(profile: Optional[str]) -> AuditService:
+    """Return the cached AuditService for a profile."""
+    from ..services.audit import AuditService
+    from ..services.base import get_service
+
+    return get_service(AuditService, profile)
+
+
+def _spinner(description: str) -> ContextManager[None]:
+    """Show a spinner while the block runs, if output is a terminal."""
+    from ..utils.progress import spinner
+
+    return spinner(description)
+
+
+# Leading bytes of compressed/archive formats audit logs are commonly stored in
+# (gzip, zstd, zip, bzip2); these are never worth a trial UTF-8 decode.
+BINARY_MAGIC = (b"\x1f\x8b", b"\x28\xb5\x2f\xfd", b"PK\x03\x04", b"BZh")
+DISPLAY_CHUNK_SIZE = 1 << 16
+
+
+def _looks_binary(content: bytes) -> bool:
+    """Sniff the first bytes of a log file for binary formats or NUL bytes."""
+    return content.startswith(BINARY_MAGIC) or b"\x00" in content[:1024]
+
+
+def _decode_chunks(content: bytes) -> Iterator[str]:
+    """Decode UTF-8 content chunk by chunk, raising at the first invalid byte."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(content)
+    for start in range(0, len(view), DISPLAY_CHUNK_SIZE):
+        yield decoder.decode(view[start : start + DISPLAY_CHUNK_SIZE])
+    yield decoder.decode(b"", final=True)
+
+
+def _print_text(content: bytes) -> None:
+    """
+    Decode UTF-8 content chunk by chunk and write it to the console.
+
+    Avoids materializing a second full-size copy of the log as a str. The
+    whole content is checked before anything is printed, so an invalid
+    byte sequence anywhere raises UnicodeDecodeError without partial output.
+    """
+    for _ in _decode_chunks(content):
+        pass
+
+    console = _console()
+    for text in _decode_chunks(content):
+        if text:
+            console.out(text, end="", highlight=False)
+    console.out("", highlight=False)
 
 
 def parse_date(date_str: str) -> date:
     """Parse a date string in YYYY-MM-DD format (not full ISO 8601)."""
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        # fromisoformat is implemented in C, but on Python 3.11+ it also
+        # accepts other ISO forms (20240115, 2024-W03-1), so check the shape
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError(date_str)
+        return date.fromisoformat(date_str)
     except ValueError:
         raise typer.BadParameter(f"Invalid date format: {date_str}. Use YYYY-MM-DD.")
 
 
 @app.command("list")
+@handle_cli_errors("Failed to list audit log files", _formatter)
 def list_log_files(
     organization_rid: str = typer.Argument(
         ...,
@@ -75,50 +152,38 @@ def list_log_files(
     ),
 ) -> None:
     """List audit log files for an organization."""
-    try:
-        # Cache the RID for future completions
-        cache_rid(organization_rid)
+    # Cache the RID for future completions
+    cache_rid(organization_rid)
 
-        # Parse dates
-        start = parse_date(start_date)
-        end = parse_date(end_date) if end_date else None
+    # Parse dates
+    start = parse_date(start_date)
+    end = parse_date(end_date) if end_date else None
 
-        service = AuditService(profile=profile)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner("Fetching audit log files..."):
-            logs = service.list_log_files(
-                organization_rid=organization_rid,
-                start_date=start,
-                end_date=end,
-                page_size=page_size,
-            )
-
-        if not logs:
-            formatter.print_info("No audit log files found for the specified criteria")
-            return
+    with _spinner("Fetching audit log files..."):
+        logs = service.list_log_files(
+            organization_rid=organization_rid,
+            start_date=start,
+            end_date=end,
+            page_size=page_size,
+        )
 
-        formatter.print_info(f"Found {len(logs)} audit log files")
+    if not logs:
+        _formatter().print_info("No audit log files found for the specified criteria")
+        return
 
-        if output:
-            formatter.save_to_file(logs, output, format)
-            formatter.print_success(f"Audit log files saved to {output}")
-        else:
-            formatter.display(logs, format)
+    _formatter().print_info(f"Found {len(logs)} audit log files")
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except typer.BadParameter:
-        raise
-    except ValueError as e:
-        formatter.print_error(f"Invalid request: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list audit log files: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().save_to_file(logs, output, format)
+        _formatter().print_success(f"Audit log files saved to {output}")
+    else:
+        _formatter().display(logs, format)
 
 
 @app.command("get")
+@handle_cli_errors("Failed to get audit log file", _formatter)
 def get_log_file_content(
     organization_rid: str = typer.Argument(
         ...,
@@ -144,43 +209,36 @@ def get_log_file_content(
     ),
 ) -> None:
     """Get the content of a specific audit log file."""
-    try:
-        # Cache the RID for future completions
-        cache_rid(organization_rid)
+    # Cache the RID for future completions
+    cache_rid(organization_rid)
 
-        service = AuditService(profile=profile)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching audit log file {log_file_id}..."
-        ):
+    if output:
+        # Stream binary content straight to the file
+        with _spinner(f"Downloading audit log file {log_file_id}..."):
+            size = service.download_log_file(
+                organization_rid=organization_rid,
+                log_file_id=log_file_id,
+                output_path=output,
+            )
+        _formatter().print_success(f"Audit log file saved to {output} ({size} bytes)")
+    else:
+        with _spinner(f"Fetching audit log file {log_file_id}..."):
             content = service.get_log_file_content(
                 organization_rid=organization_rid,
                 log_file_id=log_file_id,
             )
 
-        if output:
-            # Write binary content to file
-            Path(output).write_bytes(content)
-            formatter.print_success(
-                f"Audit log file saved to {output} ({len(content)} bytes)"
-            )
-        else:
-            # Try to decode as text for display
+        # Display as text unless the content is clearly binary
+        binary = _looks_binary(content)
+        if not binary:
             try:
-                text_content = content.decode("utf-8")
-                console.print(text_content)
+                _print_text(content)
             except UnicodeDecodeError:
-                formatter.print_error(
-                    "Log file contains binary content. Use --output to save to a file."
-                )
-                raise typer.Exit(1)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except ValueError as e:
-        formatter.print_error(f"Invalid request: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get audit log file: {e}")
-        raise typer.Exit(1)
+                binary = True
+        if binary:
+            _formatter().print_error(
+                "Log file contains binary content. Use --output to save to a file."
+            )
+            raise typer.Exit(1)
@@ -2,37 +2,261 @@
 Connectivity management commands for Foundry connections and imports.
 """
 
-import typer
+from __future__ import annotations
+
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
+
+import typer
 
-from ..services.connectivity import ConnectivityService
-from ..utils.formatting import OutputFormatter
-from ..utils.progress import SpinnerProgressTracker
-from ..auth.base import ProfileNotFoundError, MissingCredentialsError
 from ..utils.completion import (
     complete_rid,
     complete_profile,
     complete_output_format,
     cache_rid,
+    cache_rids,
 )
+from ..utils.errors import handle_cli_errors
+from ..utils.json_compat import loads
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.connectivity import ConnectivityService
+    from ..utils.errors import F
+    from ..utils.formatting import OutputFormatter
 
 app = typer.Typer()
 connection_app = typer.Typer()
 import_app = typer.Typer()
-console = Console()
-formatter = OutputFormatter(console)
 
 # Add sub-apps
 app.add_typer(connection_app, name="connection", help="Manage connections")
 app.add_typer(import_app, name="import", help="Manage data imports")
 
 
+# Options shared by most connectivity commands
+PROFILE_OPT = typer.Option(
+    None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
+)
+FORMAT_OPT = typer.Option(
+    "table",
+    "--format",
+    "-f",
+    help="Output format (table, json, csv)",
+    autocompletion=complete_output_format,
+)
+JSON_FORMAT_OPT = typer.Option(
+    "json",
+    "--format",
+    "-f",
+    help="Output format (table, json, csv)",
+    autocompletion=complete_output_format,
+)
+OUTPUT_OPT = typer.Option(None, "--output", "-o", help="Output file path")
+CONNECTION_RID_ARG = typer.Argument(
+    ..., help="Connection Resource Identifier", autocompletion=complete_rid
+)
+
+# Options shared by the import commands
+TARGET_DATASET_RID_ARG = typer.Argument(
+    ..., help="Target dataset RID", autocompletion=complete_rid
+)
+IMPORT_CONFIG_OPT = typer.Option(
+    None, "--config", "-c", help="Import configuration in JSON format"
+)
+IMPORT_CONFIG_FILE_OPT = typer.Option(
+    None, "--config-file", help="Path to JSON file with import configuration"
+)
+EXECUTE_OPT = typer.Option(
+    False, "--execute", help="Execute the import immediately after creation"
+)
+CONNECTION_FILTER_OPT = typer.Option(
+    None,
+    "--connection",
+    "-c",
+    help="Filter by connection RID",
+    autocompletion=complete_rid,
+)
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all connectivity commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+def _print_error(message: str) -> None:
+    """Print an error message; plain click output, so rich is not needed."""
+    typer.secho(message, fg=typer.colors.RED)
+
+
+def _print_warning(message: str) -> None:
+    """Print a warning message."""
+    typer.secho(message, fg=typer.colors.YELLOW)
+
+
+def _print_success(message: str) -> None:
+    """Print a success message."""
+    typer.secho(message, fg=typer.colors.GREEN)
+
+
+def _service(profile: Optional[str]) -> ConnectivityService:
+    """Return the cached ConnectivityService for a profile."""
+    from ..services.connectivity import ConnectivityService
+    from ..services.base import get_service
+
+    return get_service(ConnectivityService, profile)
+
+
+def _handle_errors(failure_message: str) -> Callable[[F], F]:
+    """
+    Report command errors via handle_cli_errors.
+
+    ValueErrors keep the failing action in the message ("Error creating
+    connection: ...") rather than the generic "Invalid request" prefix.
+    """
+    return handle_cli_errors(failure_message, _formatter, invalid_request_message=None)
+
+
+# Cap on concurrent JDBC driver uploads issued by a single command
+MAX_PARALLEL_UPLOADS = 8
+
+
+def _spinner(description: str) -> ContextManager[None]:
+    """Show a spinner while the block runs, if output is a terminal."""
+    from ..utils.progress import spinner
+
+    return spinner(description)
+
+
+def _show_list(
+    description: str,
+    fetch: Callable[[], List[Any]],
+    empty_message: str,
+    format: str,
+    output: Optional[str],
+) -> None:
+    """Fetch a list of resources under a spinner and print it."""
+    with _spinner(description):
+        items = fetch()
+
+    if not items:
+        _print_warning(empty_message)
+        return
+
+    _formatter().format_output(items, format, output)
+
+
+def _show_one(
+    description: str,
+    fetch: Callable[[], Any],
+    format: str,
+    output: Optional[str],
+) -> None:
+    """Fetch a single resource under a spinner and print it."""
+    with _spinner(description):
+        item = fetch()
+
+    _formatter().format_output([item], format, output)
+
+
+def _create_import(
+    kind: str,
+    create: Callable[[], Dict[str, Any]],
+    execute: Optional[Callable[[str], Any]],
+    connection_rid: str,
+    target_dataset_rid: str,
+    format: str,
+    output: Optional[str],
+) -> None:
+    """
+    Create an import, optionally execute it, and print the results.
+
+    Execution needs the RID returned by the create call, so the two calls
+    run back to back under one spinner that is relabelled between them.
+
+    Args:
+        kind: Import kind used in messages ('file' or 'table')
+        create: Callable creating the import and returning its info
+        execute: Callable executing an import by RID, or None to skip
+        connection_rid: Connection the import reads from
+        target_dataset_rid: Dataset the import writes to
+        format: Output format
+        output: Optional output file path
+    """
+    from ..utils.progress import SpinnerProgressTracker
+
+    tracker = SpinnerProgressTracker()
+    execution_result = None
+    with tracker.track_spinner(f"Creating {kind} import..."):
+        created = create()
+        # One cache write for the inputs and the new import
+        import_rid = created.get("rid")
+        cache_rids(connection_rid, target_dataset_rid, import_rid or "")
+
+        if execute is not None and import_rid:
+            tracker.update(f"Executing {kind} import...")
+            execution_result = execute(import_rid)
+
+    result_data = [created]
+    if execute is not None:
+        if import_rid:
+            result_data.append({"execution": execution_result})
+            _print_success(f"{kind.capitalize()} import executed: {import_rid}")
+        else:
+            _print_warning("Warning: Could not execute - missing import RID")
+
+    _formatter().format_output(result_data, format, output)
+
+
+@overload
+def _load_json_param(
+    json_str: Optional[str],
+    file_path: Optional[str],
+    param_name: str,
+    required: Literal[True] = ...,
+) -> dict: ...
+
+
+@overload
 def _load_json_param(
-    json_str: Optional[str], file_path: Optional[str], param_name: str
-) -> dict:
+    json_str: Optional[str],
+    file_path: Optional[str],
+    param_name: str,
+    required: bool,
+) -> Optional[dict]: ...
+
+
+def _load_json_param(
+    json_str: Optional[str],
+    file_path: Optional[str],
+    param_name: str,
+    required: bool = True,
+) -> Optional[dict]:
     """
     Load JSON from either a string or a file.
 
@@ -40,119 +264,86 @@ def _load_json_param(
         json_str: JSON string (optional)
         file_path: Path to JSON file (optional)
         param_name: Name of parameter for error messages
+        required: Whether one of the two sources must be given
 
     Returns:
-        Parsed JSON dictionary
+        Parsed JSON dictionary, or None if neither source was given and the
+        parameter is not required
 
     Raises:
-        typer.Exit: If neither or both are provided, or if parsing fails
+        typer.Exit: If both are provided, neither is provided for a required
+            parameter, or if parsing fails
     """
-    if json_str and file_path:
-        console.print(
-            f"[red]Cannot specify both {param_name} and {param_name}-file[/red]"
-        )
+    if not required and not json_str and not file_path:
+        return None
+
+    # Exactly one source must be given
+    if bool(json_str) == bool(file_path):
+        if json_str:
+            _print_error(f"Cannot specify both {param_name} and {param_name}-file")
+        else:
+            _print_error(f"Must specify either {param_name} or --{param_name}-file")
         raise typer.Exit(1)
 
-    if not json_str and not file_path:
-        console.print(
-            f"[red]Must specify either {param_name} or --{param_name}-file[/red]"
-        )
-        raise typer.Exit(1)
-
-    if file_path:
-        path = Path(file_path)
-        if not path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            raise typer.Exit(1)
+    data: Union[str, bytes]
+    if json_str:
+        data = json_str
+    else:
         try:
-            json_str = path.read_text()
+            # Parse the raw bytes; both JSON parsers decode UTF-8 themselves
+            data = Path(file_path).read_bytes()  # type: ignore[arg-type]
+        except FileNotFoundError:
+            _print_error(f"File not found: {file_path}")
+            raise typer.Exit(1) from None
         except Exception as e:
-            console.print(f"[red]Error reading {file_path}: {e}[/red]")
-            raise typer.Exit(1)
+            _print_error(f"Error reading {file_path}: {e}")
+            raise typer.Exit(1) from None
 
     try:
-        return json.loads(json_str)  # type: ignore[arg-type]
+        return loads(data)
     except json.JSONDecodeError as e:
-        console.print(f"[red]Invalid JSON for {param_name}: {e}[/red]")
-        raise typer.Exit(1)
+        _print_error(f"Invalid JSON for {param_name}: {e}")
+        raise typer.Exit(1) from None
 
 
 @connection_app.command("list")
+@_handle_errors("Error listing connections")
 def list_connections(
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """List available connections."""
-    try:
-        with SpinnerProgressTracker().track_spinner("Fetching connections..."):
-            service = ConnectivityService(profile=profile)
-            connections = service.list_connections()
-
-        if not connections:
-            console.print("[yellow]No connections found[/yellow]")
-            return
-
-        formatter.format_output(connections, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error listing connections: {e}[/red]")
-        raise typer.Exit(1)
+    _show_list(
+        "Fetching connections...",
+        lambda: _service(profile).list_connections(),
+        "No connections found",
+        format,
+        output,
+    )
 
 
 @connection_app.command("get")
+@_handle_errors("Error getting connection")
 def get_connection(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Get detailed information about a specific connection."""
-    try:
-        cache_rid(connection_rid)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching connection {connection_rid}..."
-        ):
-            service = ConnectivityService(profile=profile)
-            connection = service.get_connection(connection_rid)
+    cache_rid(connection_rid)
 
-        formatter.format_output([connection], format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error getting connection: {e}[/red]")
-        raise typer.Exit(1)
+    _show_one(
+        f"Fetching connection {connection_rid}...",
+        lambda: _service(profile).get_connection(connection_rid),
+        format,
+        output,
+    )
 
 
 @connection_app.command("create")
+@_handle_errors("Error creating connection")
 def create_connection(
     display_name: str = typer.Argument(..., help="Display name for the connection"),
     parent_folder_rid: str = typer.Argument(
@@ -170,571 +361,342 @@ def create_connection(
     worker_file: Optional[str] = typer.Option(
         None, "--worker-file", help="Path to JSON file with worker configuration"
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Create a new connection.
 
     Configuration and worker can be provided as JSON strings or via file options.
     """
-    try:
-        cache_rid(parent_folder_rid)
-
-        # Load configuration from string or file
-        config_dict = _load_json_param(configuration, config_file, "configuration")
-        worker_dict = _load_json_param(worker, worker_file, "worker")
-
-        service = ConnectivityService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Creating connection..."):
-            connection = service.create_connection(
-                display_name=display_name,
-                parent_folder_rid=parent_folder_rid,
-                configuration=config_dict,
-                worker=worker_dict,
-            )
-
-        cache_rid(connection.get("rid", ""))
-        console.print(f"[green]Connection created: {connection.get('rid')}[/green]")
-        formatter.format_output([connection], format, output)
+    # Load configuration from string or file
+    config_dict = _load_json_param(configuration, config_file, "configuration")
+    worker_dict = _load_json_param(worker, worker_file, "worker")
+
+    service = _service(profile)
+
+    with _spinner("Creating connection..."):
+        connection = service.create_connection(
+            display_name=display_name,
+            parent_folder_rid=parent_folder_rid,
+            configuration=config_dict,
+            worker=worker_dict,
+        )
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error creating connection: {e}[/red]")
-        raise typer.Exit(1)
+    connection_rid = connection.get("rid")
+    cache_rids(parent_folder_rid, connection_rid or "")
+    _print_success(f"Connection created: {connection_rid}")
+    _formatter().format_output([connection], format, output)
 
 
 @connection_app.command("get-config")
+@_handle_errors("Error getting connection configuration")
 def get_connection_configuration(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "json",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = JSON_FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Get connection configuration."""
-    try:
-        cache_rid(connection_rid)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching configuration for {connection_rid}..."
-        ):
-            service = ConnectivityService(profile=profile)
-            config = service.get_connection_configuration(connection_rid)
-
-        formatter.format_output([config], format, output)
+    cache_rid(connection_rid)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error getting connection configuration: {e}[/red]")
-        raise typer.Exit(1)
+    _show_one(
+        f"Fetching configuration for {connection_rid}...",
+        lambda: _service(profile).get_connection_configuration(connection_rid),
+        format,
+        output,
+    )
 
 
 @connection_app.command("update-secrets")
+@_handle_errors("Error updating secrets")
 def update_connection_secrets(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
     secrets_file: str = typer.Option(
         ...,
         "--secrets-file",
         "-s",
         help="Path to JSON file containing secrets (mapping secret names to values)",
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
+    profile: Optional[str] = PROFILE_OPT,
 ):
     """Update connection secrets.
 
     Secrets must be provided via a file for security (to avoid exposure in shell
     history or process listings).
     """
-    try:
-        cache_rid(connection_rid)
+    cache_rid(connection_rid)
 
-        # Load secrets from file
-        path = Path(secrets_file)
-        if not path.exists():
-            console.print(f"[red]Secrets file not found: {secrets_file}[/red]")
-            raise typer.Exit(1)
+    # Load secrets from file
+    try:
+        secrets_dict = loads(Path(secrets_file).read_bytes())
+    except FileNotFoundError:
+        _print_error(f"Secrets file not found: {secrets_file}")
+        raise typer.Exit(1) from None
+    except json.JSONDecodeError as e:
+        _print_error(f"Invalid JSON in secrets file: {e}")
+        raise typer.Exit(1) from None
+    except Exception as e:
+        _print_error(f"Error reading secrets file: {e}")
+        raise typer.Exit(1) from None
 
-        try:
-            secrets_content = path.read_text()
-            secrets_dict = json.loads(secrets_content)
-        except json.JSONDecodeError as e:
-            console.print(f"[red]Invalid JSON in secrets file: {e}[/red]")
-            raise typer.Exit(1)
-        except Exception as e:
-            console.print(f"[red]Error reading secrets file: {e}[/red]")
-            raise typer.Exit(1)
+    service = _service(profile)
 
-        service = ConnectivityService(profile=profile)
+    with _spinner("Updating secrets..."):
+        service.update_secrets(connection_rid, secrets_dict)
 
-        with SpinnerProgressTracker().track_spinner("Updating secrets..."):
-            service.update_secrets(connection_rid, secrets_dict)
-
-        console.print(
-            f"[green]Secrets updated for connection: {connection_rid}[/green]"
-        )
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error updating secrets: {e}[/red]")
-        raise typer.Exit(1)
+    _print_success(f"Secrets updated for connection: {connection_rid}")
 
 
 @connection_app.command("update-export-settings")
+@_handle_errors("Error updating export settings")
 def update_export_settings(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
     settings: Optional[str] = typer.Argument(
         None, help="Export settings in JSON format"
     ),
     settings_file: Optional[str] = typer.Option(
         None, "--settings-file", help="Path to JSON file with export settings"
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
+    profile: Optional[str] = PROFILE_OPT,
 ):
     """Update connection export settings.
 
     Settings can be provided as a JSON string or via --settings-file.
     """
-    try:
-        cache_rid(connection_rid)
+    cache_rid(connection_rid)
 
-        # Load settings from string or file
-        settings_dict = _load_json_param(settings, settings_file, "settings")
+    # Load settings from string or file
+    settings_dict = _load_json_param(settings, settings_file, "settings")
 
-        service = ConnectivityService(profile=profile)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner("Updating export settings..."):
-            service.update_export_settings(connection_rid, settings_dict)
+    with _spinner("Updating export settings..."):
+        service.update_export_settings(connection_rid, settings_dict)
 
-        console.print(
-            f"[green]Export settings updated for connection: {connection_rid}[/green]"
-        )
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error updating export settings: {e}[/red]")
-        raise typer.Exit(1)
+    _print_success(f"Export settings updated for connection: {connection_rid}")
 
 
 @connection_app.command("upload-jdbc-drivers")
+@_handle_errors("Error uploading JDBC drivers")
 def upload_jdbc_drivers(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
     driver_files: List[str] = typer.Argument(
         ..., help="Path(s) to JAR file(s) to upload"
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel",
+        "-j",
+        min=1,
+        help=f"Number of concurrent uploads (default: up to {MAX_PARALLEL_UPLOADS})",
     ),
 ):
     """Upload custom JDBC drivers to a connection.
 
     Only JAR files are supported.
     """
-    try:
-        cache_rid(connection_rid)
+    cache_rid(connection_rid)
 
-        # Validate files exist and are JAR files before uploading
-        for driver_file in driver_files:
-            path = Path(driver_file)
-            if not path.exists():
-                console.print(f"[red]File not found: {driver_file}[/red]")
-                raise typer.Exit(1)
-            if path.suffix.lower() != ".jar":
-                console.print(f"[red]File must be a JAR file: {driver_file}[/red]")
-                raise typer.Exit(1)
-
-        service = ConnectivityService(profile=profile)
-        results = []
-
-        for driver_file in driver_files:
-            with SpinnerProgressTracker().track_spinner(f"Uploading {driver_file}..."):
-                result = service.upload_custom_jdbc_drivers(connection_rid, driver_file)
-                results.append(result)
-            console.print(f"[green]Uploaded: {driver_file}[/green]")
-
-        formatter.format_output(results, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error uploading JDBC drivers: {e}[/red]")
-        raise typer.Exit(1)
+    # Validate files exist and are non-empty JAR files before uploading
+    for driver_file in driver_files:
+        path = Path(driver_file)
+        if path.suffix.lower() != ".jar":
+            _print_error(f"File must be a JAR file: {driver_file}")
+            raise typer.Exit(1)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            _print_error(f"File not found: {driver_file}")
+            raise typer.Exit(1) from None
+        if not size:
+            _print_error(f"File is empty: {driver_file}")
+            raise typer.Exit(1)
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from ..utils.progress import SpinnerProgressTracker
+
+    service = _service(profile)
+    total = len(driver_files)
+    results: List[Any] = [None] * total
+    workers = min(parallel or MAX_PARALLEL_UPLOADS, total)
+
+    # Uploads are network-bound, so threads overlap the transfers.
+    # Results keep the order the drivers were given in.
+    tracker = SpinnerProgressTracker()
+    with tracker.track_spinner(f"Uploading {total} JDBC drivers..."):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    service.upload_custom_jdbc_drivers, connection_rid, driver_file
+                ): index
+                for index, driver_file in enumerate(driver_files)
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    results[index] = future.result()
+                    tracker.update(f"Uploaded {done}/{total} JDBC drivers...")
+                    _print_success(f"Uploaded: {driver_files[index]}")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    _formatter().format_output(results, format, output)
 
 
 @import_app.command("file")
+@_handle_errors("Error creating file import")
 def import_file(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
     source_path: str = typer.Argument(..., help="Source file path in the connection"),
-    target_dataset_rid: str = typer.Argument(
-        ..., help="Target dataset RID", autocompletion=complete_rid
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    config: Optional[str] = typer.Option(
-        None, "--config", "-c", help="Import configuration in JSON format"
-    ),
-    execute: bool = typer.Option(
-        False, "--execute", help="Execute the import immediately after creation"
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    target_dataset_rid: str = TARGET_DATASET_RID_ARG,
+    profile: Optional[str] = PROFILE_OPT,
+    config: Optional[str] = IMPORT_CONFIG_OPT,
+    config_file: Optional[str] = IMPORT_CONFIG_FILE_OPT,
+    execute: bool = EXECUTE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Create and optionally execute a file import via connection."""
-    try:
-        cache_rid(connection_rid)
-        cache_rid(target_dataset_rid)
-
-        # Parse import configuration if provided
-        import_config = None
-        if config:
-            try:
-                import_config = json.loads(config)
-            except json.JSONDecodeError as e:
-                console.print(f"[red]Invalid JSON configuration: {e}[/red]")
-                raise typer.Exit(1)
-
-        service = ConnectivityService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Creating file import..."):
-            file_import = service.create_file_import(
-                connection_rid=connection_rid,
-                source_path=source_path,
-                target_dataset_rid=target_dataset_rid,
-                import_config=import_config,
-            )
-
-        result_data = [file_import]
-
-        # Execute import if requested
-        if execute:
-            import_rid = file_import.get("rid")
-            if import_rid:
-                with SpinnerProgressTracker().track_spinner("Executing file import..."):
-                    execution_result = service.execute_file_import(import_rid)
-                result_data.append({"execution": execution_result})
-                console.print(f"[green]File import executed: {import_rid}[/green]")
-            else:
-                console.print(
-                    "[yellow]Warning: Could not execute - missing import RID[/yellow]"
-                )
-
-        formatter.format_output(result_data, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error creating file import: {e}[/red]")
-        raise typer.Exit(1)
+    # Parse import configuration if provided
+    import_config = _load_json_param(config, config_file, "config", required=False)
+
+    service = _service(profile)
+    _create_import(
+        "file",
+        lambda: service.create_file_import(
+            connection_rid=connection_rid,
+            source_path=source_path,
+            target_dataset_rid=target_dataset_rid,
+            import_config=import_config,
+        ),
+        service.execute_file_import if execute else None,
+        connection_rid,
+        target_dataset_rid,
+        format,
+        output,
+    )
 
 
 @import_app.command("table")
+@_handle_errors("Error creating table import")
 def import_table(
-    connection_rid: str = typer.Argument(
-        ..., help="Connection Resource Identifier", autocompletion=complete_rid
-    ),
+    connection_rid: str = CONNECTION_RID_ARG,
     source_table: str = typer.Argument(..., help="Source table name in the connection"),
-    target_dataset_rid: str = typer.Argument(
-        ..., help="Target dataset RID", autocompletion=complete_rid
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    config: Optional[str] = typer.Option(
-        None, "--config", "-c", help="Import configuration in JSON format"
-    ),
-    execute: bool = typer.Option(
-        False, "--execute", help="Execute the import immediately after creation"
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    target_dataset_rid: str = TARGET_DATASET_RID_ARG,
+    profile: Optional[str] = PROFILE_OPT,
+    config: Optional[str] = IMPORT_CONFIG_OPT,
+    config_file: Optional[str] = IMPORT_CONFIG_FILE_OPT,
+    execute: bool = EXECUTE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Create and optionally execute a table import via connection."""
-    try:
-        cache_rid(connection_rid)
-        cache_rid(target_dataset_rid)
+    # Parse import configuration if provided
+    import_config = _load_json_param(config, config_file, "config", required=False)
 
-        # Parse import configuration if provided
-        import_config = None
-        if config:
-            try:
-                import_config = json.loads(config)
-            except json.JSONDecodeError as e:
-                console.print(f"[red]Invalid JSON configuration: {e}[/red]")
-                raise typer.Exit(1)
-
-        service = ConnectivityService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner("Creating table import..."):
-            table_import = service.create_table_import(
-                connection_rid=connection_rid,
-                source_table=source_table,
-                target_dataset_rid=target_dataset_rid,
-                import_config=import_config,
-            )
-
-        result_data = [table_import]
-
-        # Execute import if requested
-        if execute:
-            import_rid = table_import.get("rid")
-            if import_rid:
-                with SpinnerProgressTracker().track_spinner(
-                    "Executing table import..."
-                ):
-                    execution_result = service.execute_table_import(import_rid)
-                result_data.append({"execution": execution_result})
-                console.print(f"[green]Table import executed: {import_rid}[/green]")
-            else:
-                console.print(
-                    "[yellow]Warning: Could not execute - missing import RID[/yellow]"
-                )
-
-        formatter.format_output(result_data, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error creating table import: {e}[/red]")
-        raise typer.Exit(1)
+    service = _service(profile)
+    _create_import(
+        "table",
+        lambda: service.create_table_import(
+            connection_rid=connection_rid,
+            source_table=source_table,
+            target_dataset_rid=target_dataset_rid,
+            import_config=import_config,
+        ),
+        service.execute_table_import if execute else None,
+        connection_rid,
+        target_dataset_rid,
+        format,
+        output,
+    )
 
 
 @import_app.command("list-file")
+@_handle_errors("Error listing file imports")
 def list_file_imports(
-    connection_rid: Optional[str] = typer.Option(
-        None,
-        "--connection",
-        "-c",
-        help="Filter by connection RID",
-        autocompletion=complete_rid,
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    connection_rid: Optional[str] = CONNECTION_FILTER_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """List file imports, optionally filtered by connection."""
-    try:
-        if connection_rid:
-            cache_rid(connection_rid)
-
-        with SpinnerProgressTracker().track_spinner("Fetching file imports..."):
-            service = ConnectivityService(profile=profile)
-            imports = service.list_file_imports(connection_rid=connection_rid)
+    if connection_rid:
+        cache_rid(connection_rid)
 
-        if not imports:
-            console.print("[yellow]No file imports found[/yellow]")
-            return
-
-        formatter.format_output(imports, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error listing file imports: {e}[/red]")
-        raise typer.Exit(1)
+    _show_list(
+        "Fetching file imports...",
+        lambda: _service(profile).list_file_imports(connection_rid=connection_rid),
+        "No file imports found",
+        format,
+        output,
+    )
 
 
 @import_app.command("list-table")
+@_handle_errors("Error listing table imports")
 def list_table_imports(
-    connection_rid: Optional[str] = typer.Option(
-        None,
-        "--connection",
-        "-c",
-        help="Filter by connection RID",
-        autocompletion=complete_rid,
-    ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    connection_rid: Optional[str] = CONNECTION_FILTER_OPT,
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """List table imports, optionally filtered by connection."""
-    try:
-        if connection_rid:
-            cache_rid(connection_rid)
-
-        with SpinnerProgressTracker().track_spinner("Fetching table imports..."):
-            service = ConnectivityService(profile=profile)
-            imports = service.list_table_imports(connection_rid=connection_rid)
-
-        if not imports:
-            console.print("[yellow]No table imports found[/yellow]")
-            return
+    if connection_rid:
+        cache_rid(connection_rid)
 
-        formatter.format_output(imports, format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error listing table imports: {e}[/red]")
-        raise typer.Exit(1)
+    _show_list(
+        "Fetching table imports...",
+        lambda: _service(profile).list_table_imports(connection_rid=connection_rid),
+        "No table imports found",
+        format,
+        output,
+    )
 
 
 @import_app.command("get-file")
+@_handle_errors("Error getting file import")
 def get_file_import(
     import_rid: str = typer.Argument(
         ..., help="File import Resource Identifier", autocompletion=complete_rid
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Get detailed information about a specific file import."""
-    try:
-        cache_rid(import_rid)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching file import {import_rid}..."
-        ):
-            service = ConnectivityService(profile=profile)
-            file_import = service.get_file_import(import_rid)
+    cache_rid(import_rid)
 
-        formatter.format_output([file_import], format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error getting file import: {e}[/red]")
-        raise typer.Exit(1)
+    _show_one(
+        f"Fetching file import {import_rid}...",
+        lambda: _service(profile).get_file_import(import_rid),
+        format,
+        output,
+    )
 
 
 @import_app.command("get-table")
+@_handle_errors("Error getting table import")
 def get_table_import(
     import_rid: str = typer.Argument(
         ..., help="Table import Resource Identifier", autocompletion=complete_rid
     ),
-    profile: Optional[str] = typer.Option(
-        None, "--profile", "-p", help="Profile name", autocompletion=complete_profile
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, csv)",
-        autocompletion=complete_output_format,
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file path"
-    ),
+    profile: Optional[str] = PROFILE_OPT,
+    format: str = FORMAT_OPT,
+    output: Optional[str] = OUTPUT_OPT,
 ):
     """Get detailed information about a specific table import."""
-    try:
-        cache_rid(import_rid)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching table import {import_rid}..."
-        ):
-            service = ConnectivityService(profile=profile)
-            table_import = service.get_table_import(import_rid)
-
-        formatter.format_output([table_import], format, output)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error getting table import: {e}[/red]")
-        raise typer.Exit(1)
+    cache_rid(import_rid)
+
+    _show_one(
+        f"Fetching table import {import_rid}...",
+        lambda: _service(profile).get_table_import(import_rid),
+        format,
+        output,
+    )
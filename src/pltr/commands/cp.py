@@ -4,15 +4,34 @@ Copy resources between Compass folders.
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 
 from ..auth.base import MissingCredentialsError, ProfileNotFoundError
-from ..services.copy import CopyService
 from ..utils.completion import complete_profile, complete_rid
-from ..utils.formatting import OutputFormatter
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..utils.formatting import OutputFormatter
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by every copy."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
 
 
 def cp_command(
@@ -71,8 +90,11 @@ def cp_command(
     ),
 ):
     """Copy a resource identified by RID into another Compass folder."""
-    console = Console()
-    formatter = OutputFormatter(console)
+    # Imported here so loading the command (e.g. for --help) skips the SDK
+    from ..services.copy import CopyService
+
+    console = _console()
+    formatter = _formatter()
 
     try:
         service = CopyService(
@@ -3,20 +3,30 @@ DataHealth management commands for Foundry.
 Provides commands for managing data quality checks and reports.
 """
 
+from __future__ import annotations
+
 import typer
 import json
-from typing import Optional
-from rich.console import Console
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, ContextManager, List, Optional
 
-from ..services.data_health import DataHealthService
-from ..utils.formatting import OutputFormatter
-from ..utils.progress import SpinnerProgressTracker
 from ..auth.base import ProfileNotFoundError, MissingCredentialsError
 from ..utils.completion import (
     complete_rid,
     complete_profile,
     complete_output_format,
 )
+from ..utils.concurrency import run_each
+from ..utils.errors import handle_cli_errors
+from ..utils.json_compat import loads
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.data_health import DataHealthService
+    from ..utils.errors import F
+    from ..utils.formatting import OutputFormatter
 
 # Create main app and sub-apps
 app = typer.Typer(help="Manage data health checks and reports")
@@ -27,11 +37,56 @@ report_app = typer.Typer(help="View data health check reports")
 app.add_typer(check_app, name="check")
 app.add_typer(report_app, name="report")
 
-console = Console()
-formatter = OutputFormatter(console)
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all data health commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+def _service(profile: Optional[str]) -> DataHealthService:
+    """Return the cached DataHealthService for a profile."""
+    from ..services.data_health import DataHealthService
+    from ..services.base import get_service
+
+    return get_service(DataHealthService, profile)
+
+
+def _spinner(description: str) -> ContextManager[None]:
+    """Show a spinner while the block runs, if output is a terminal."""
+    from ..utils.progress import spinner
+
+    return spinner(description)
+
+
+def _handle_errors(failure_message: str) -> Callable[[F], F]:
+    """Wrap handle_cli_errors, reporting ValueErrors under the command's own message."""
+    return handle_cli_errors(failure_message, _formatter, invalid_request_message=None)
+
+
+# Rich styles for check report statuses; anything else is shown in white
+REPORT_STATUS_COLORS = {
+    "PASSED": "green",
+    "FAILED": "red",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "NOT_APPLICABLE": "dim",
+    "NOT_COMPUTABLE": "dim",
+}
 
 
 @check_app.command("get")
+@_handle_errors("Error getting check")
 def get_check(
     check_rid: str = typer.Argument(
         ...,
@@ -81,28 +136,21 @@ def get_check(
             --format json \\
             --output check-details.json
     """
-    try:
-        with SpinnerProgressTracker().track_spinner("Fetching check information"):
-            service = DataHealthService(profile=profile)
-            result = service.get_check(
-                check_rid=check_rid,
-                preview=preview,
-            )
+    with _spinner("Fetching check information"):
+        service = _service(profile)
+        result = service.get_check(
+            check_rid=check_rid,
+            preview=preview,
+        )
 
-        formatter.format_output(result, format, output)
+    _formatter().format_output(result, format, output)
 
-        if output:
-            console.print(f"[green]✓[/green] Check information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication Error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    if output:
+        _console().print(f"[green]✓[/green] Check information saved to {output}")
 
 
 @check_app.command("create")
+@_handle_errors("Error creating check")
 def create_check(
     config: str = typer.Argument(
         ...,
@@ -171,37 +219,26 @@ def create_check(
         # Create with JSON output
         pltr data-health check create @config.json --format json
     """
-    try:
-        # Parse config from JSON string or file
-        config_dict = _parse_json_config(config)
-
-        with SpinnerProgressTracker().track_spinner("Creating check"):
-            service = DataHealthService(profile=profile)
-            result = service.create_check(
-                config=config_dict,
-                intent=intent,
-                preview=preview,
-            )
+    config_dict = _load_check_config(config)
 
-        console.print(f"[green]✓[/green] Created check: {result.get('rid')}")
+    with _spinner("Creating check"):
+        service = _service(profile)
+        result = service.create_check(
+            config=config_dict,
+            intent=intent,
+            preview=preview,
+        )
 
-        formatter.format_output(result, format, output)
+    _console().print(f"[green]✓[/green] Created check: {result.get('rid')}")
 
-        if output:
-            console.print(f"[green]✓[/green] Check information saved to {output}")
+    _formatter().format_output(result, format, output)
 
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Invalid JSON configuration: {e}[/red]")
-        raise typer.Exit(1)
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication Error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    if output:
+        _console().print(f"[green]✓[/green] Check information saved to {output}")
 
 
 @check_app.command("replace")
+@_handle_errors("Error replacing check")
 def replace_check(
     check_rid: str = typer.Argument(
         ...,
@@ -259,42 +296,31 @@ def replace_check(
         pltr data-health check replace ri.data-health.main.check.abc123 \\
             @updated-config.json
     """
-    try:
-        # Parse config from JSON string or file
-        config_dict = _parse_json_config(config)
-
-        with SpinnerProgressTracker().track_spinner("Updating check"):
-            service = DataHealthService(profile=profile)
-            result = service.replace_check(
-                check_rid=check_rid,
-                config=config_dict,
-                intent=intent,
-                preview=preview,
-            )
+    config_dict = _load_check_config(config)
 
-        console.print(f"[green]✓[/green] Updated check: {result.get('rid')}")
+    with _spinner("Updating check"):
+        service = _service(profile)
+        result = service.replace_check(
+            check_rid=check_rid,
+            config=config_dict,
+            intent=intent,
+            preview=preview,
+        )
 
-        formatter.format_output(result, format, output)
+    _console().print(f"[green]✓[/green] Updated check: {result.get('rid')}")
 
-        if output:
-            console.print(f"[green]✓[/green] Check information saved to {output}")
+    _formatter().format_output(result, format, output)
 
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Invalid JSON configuration: {e}[/red]")
-        raise typer.Exit(1)
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication Error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    if output:
+        _console().print(f"[green]✓[/green] Check information saved to {output}")
 
 
 @check_app.command("delete")
+@_handle_errors("Error deleting check")
 def delete_check(
-    check_rid: str = typer.Argument(
+    check_rids: List[str] = typer.Argument(
         ...,
-        help="Check RID (e.g., ri.data-health.main.check.xxx)",
+        help="Check RIDs (e.g., ri.data-health.main.check.xxx)",
         autocompletion=complete_rid,
     ),
     profile: Optional[str] = typer.Option(
@@ -317,7 +343,10 @@ def delete_check(
     ),
 ):
     """
-    Delete a data health check.
+    Delete one or more data health checks.
+
+    Several checks are deleted concurrently; a failure does not stop the
+    remaining deletes, and the command exits with an error if any failed.
 
     Examples:
 
@@ -326,33 +355,48 @@ def delete_check(
 
         # Delete without confirmation
         pltr data-health check delete ri.data-health.main.check.abc123 --force
+
+        # Delete several checks at once
+        pltr data-health check delete ri.data-health.main.check.abc123 \\
+            ri.data-health.main.check.def456 --force
     """
-    # Handle confirmation outside try-except to avoid catching typer.Exit
+    check_rids = list(dict.fromkeys(check_rids))
+
     if not force:
-        confirm = typer.confirm(f"Are you sure you want to delete check '{check_rid}'?")
+        if len(check_rids) == 1:
+            target = f"check '{check_rids[0]}'"
+        else:
+            target = f"{len(check_rids)} checks"
+        confirm = typer.confirm(f"Are you sure you want to delete {target}?")
         if not confirm:
-            console.print("[yellow]Cancelled[/yellow]")
+            _console().print("[yellow]Cancelled[/yellow]")
             raise typer.Exit(0)
 
-    try:
-        with SpinnerProgressTracker().track_spinner("Deleting check"):
-            service = DataHealthService(profile=profile)
-            service.delete_check(
-                check_rid=check_rid,
-                preview=preview,
+    with _spinner("Deleting checks" if len(check_rids) > 1 else "Deleting check"):
+        service = _service(profile)
+        # Authentication errors would fail every delete alike, so raise them
+        failures = run_each(
+            check_rids,
+            lambda check_rid: service.delete_check(
+                check_rid=check_rid, preview=preview
+            ),
+            reraise=(ProfileNotFoundError, MissingCredentialsError),
+        )
+
+    for check_rid in check_rids:
+        if check_rid in failures:
+            _formatter().print_error(
+                f"Error deleting {check_rid}: {failures[check_rid]}"
             )
+        else:
+            _console().print(f"[green]✓[/green] Deleted check: {check_rid}")
 
-        console.print(f"[green]✓[/green] Deleted check: {check_rid}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication Error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+    if failures:
         raise typer.Exit(1)
 
 
 @report_app.command("get")
+@_handle_errors("Error getting report")
 def get_report(
     check_report_rid: str = typer.Argument(
         ...,
@@ -411,43 +455,36 @@ def get_report(
             --format json \\
             --output report.json
     """
-    try:
-        with SpinnerProgressTracker().track_spinner("Fetching check report"):
-            service = DataHealthService(profile=profile)
-            result = service.get_check_report(
-                check_report_rid=check_report_rid,
-                preview=preview,
-            )
+    with _spinner("Fetching check report"):
+        service = _service(profile)
+        result = service.get_check_report(
+            check_report_rid=check_report_rid,
+            preview=preview,
+        )
 
-        # Display status prominently
-        status = result.get("result", {}).get("status", "UNKNOWN")
-        status_colors = {
-            "PASSED": "green",
-            "FAILED": "red",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "NOT_APPLICABLE": "dim",
-            "NOT_COMPUTABLE": "dim",
-        }
-        color = status_colors.get(status, "white")
-        console.print(f"Status: [{color}]{status}[/{color}]")
-
-        message = result.get("result", {}).get("message")
-        if message:
-            console.print(f"Message: {message}")
-
-        console.print()
-        formatter.format_output(result, format, output)
-
-        if output:
-            console.print(f"[green]✓[/green] Report information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        console.print(f"[red]Authentication Error: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    # Display status prominently
+    status = result.get("result", {}).get("status", "UNKNOWN")
+    color = REPORT_STATUS_COLORS.get(status, "white")
+    _console().print(f"Status: [{color}]{status}[/{color}]")
+
+    message = result.get("result", {}).get("message")
+    if message:
+        _console().print(f"Message: {message}")
+
+    _console().print()
+    _formatter().format_output(result, format, output)
+
+    if output:
+        _console().print(f"[green]✓[/green] Report information saved to {output}")
+
+
+def _load_check_config(config: str) -> dict:
+    """Parse a check config argument, exiting with an error if it is invalid."""
+    try:
+        return _parse_json_config(config)
+    except json.JSONDecodeError as e:
+        _formatter().print_error(f"Invalid JSON configuration: {e}")
+        raise typer.Exit(1) from None
 
 
 def _parse_json_config(config: str) -> dict:
@@ -465,10 +502,8 @@ def _parse_json_config(config: str) -> dict:
         FileNotFoundError: If file doesn't exist
     """
     if config.startswith("@"):
-        # Load from file
-        filepath = config[1:]
-        with open(filepath, "r") as f:
-            return json.load(f)
+        # Load from file; bytes go straight to the parser without decoding
+        return loads(Path(config[1:]).read_bytes())
     else:
         # Parse JSON string
-        return json.loads(config)
+        return loads(config)
@@ -2,14 +2,15 @@
 Simplified dataset commands that work with foundry-platform-sdk v1.27.0.
 """
 
+from __future__ import annotations
+
+import os
+import stat
 import typer
-from typing import Optional
-from rich.console import Console
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, ContextManager, Optional
 
-from ..services.dataset import DatasetService
-from ..utils.formatting import OutputFormatter
-from ..utils.pagination import PaginationConfig
-from ..utils.progress import SpinnerProgressTracker
+from ..utils.pagination import PaginationConfig, PaginationMetadata, prefetch
 from ..auth.base import ProfileNotFoundError, MissingCredentialsError
 from ..utils.completion import (
     complete_rid,
@@ -17,6 +18,14 @@ from ..utils.completion import (
     complete_output_format,
     cache_rid,
 )
+from ..utils.errors import handle_cli_errors
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..services.dataset import DatasetService
+    from ..utils.errors import F
+    from ..utils.formatting import OutputFormatter
 
 app = typer.Typer()
 branches_app = typer.Typer()
@@ -26,11 +35,46 @@ views_app = typer.Typer()
 schema_app = typer.Typer()
 schedules_app = typer.Typer()
 jobs_app = typer.Typer()
-console = Console()
-formatter = OutputFormatter(console)
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all dataset commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
+def _service(profile: Optional[str]) -> DatasetService:
+    """Return the cached DatasetService for a profile."""
+    from ..services.dataset import DatasetService
+    from ..services.base import get_service
+
+    return get_service(DatasetService, profile)
+
+
+def _spinner(description: str) -> ContextManager[None]:
+    """Show a spinner while the block runs, if output is a terminal."""
+    from ..utils.progress import spinner
+
+    return spinner(description)
+
+
+def _handle_errors(failure_message: str) -> Callable[[F], F]:
+    """Wrap handle_cli_errors so ValueErrors also read "Failed to <op>: ..."."""
+    return handle_cli_errors(failure_message, _formatter, invalid_request_message=None)
 
 
 @app.command("get")
+@_handle_errors("Failed to get dataset")
 def get_dataset(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -50,31 +94,22 @@ def get_dataset(
     ),
 ):
     """Get detailed information about a specific dataset."""
-    try:
-        # Cache the RID for future completions
-        cache_rid(dataset_rid)
+    # Cache the RID for future completions
+    cache_rid(dataset_rid)
 
-        service = DatasetService(profile=profile)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching dataset {dataset_rid}..."
-        ):
-            dataset = service.get_dataset(dataset_rid)
+    with _spinner(f"Fetching dataset {dataset_rid}..."):
+        dataset = service.get_dataset(dataset_rid)
 
-        formatter.format_dataset_detail(dataset, format, output)
+    _formatter().format_dataset_detail(dataset, format, output)
 
-        if output:
-            formatter.print_success(f"Dataset information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get dataset: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Dataset information saved to {output}")
 
 
 @app.command("preview")
+@_handle_errors("Failed to preview dataset")
 def preview_dataset(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -97,30 +132,20 @@ def preview_dataset(
     ),
 ):
     """Preview dataset contents."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching preview of {dataset_rid} (limit: {limit})..."
-        ):
-            data = service.preview_data(dataset_rid, limit=limit)
+    with _spinner(f"Fetching preview of {dataset_rid} (limit: {limit})..."):
+        data = service.preview_data(dataset_rid, limit=limit)
 
-        if not data:
-            formatter.print_warning("Dataset is empty or has no readable data")
-            return
+    if not data:
+        _formatter().print_warning("Dataset is empty or has no readable data")
+        return
 
-        formatter.format_output(data, format, output)
+    _formatter().format_output(data, format, output)
 
-        if output:
-            formatter.print_success(f"Preview saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to preview dataset: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Preview saved to {output}")
 
 
 # Schema commands
@@ -146,47 +171,46 @@ def get_schema(
     """Get the schema of a dataset (requires API preview access)."""
     try:
         cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+        service = _service(profile)
 
-        formatter.print_warning(
+        _formatter().print_warning(
             "Note: This command requires API preview access. "
             "If you encounter an 'ApiFeaturePreviewUsageOnly' error, "
             "use 'pltr dataset schema apply' instead to infer/apply schema."
         )
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching schema for {dataset_rid}..."
-        ):
+        with _spinner(f"Fetching schema for {dataset_rid}..."):
             schema = service.get_schema(dataset_rid)
 
         # Format schema for display
         if format == "json":
-            formatter._format_json(schema, output)
+            _formatter()._format_json(schema, output)
         else:
-            formatter.print_info(f"Dataset: {dataset_rid}")
-            formatter.print_info(f"Status: {schema.get('status', 'Unknown')}")
+            _formatter().print_info(f"Dataset: {dataset_rid}")
+            _formatter().print_info(f"Status: {schema.get('status', 'Unknown')}")
             if schema.get("schema"):
-                formatter.print_info("\nSchema:")
-                formatter._format_json(schema.get("schema"))
+                _formatter().print_info("\nSchema:")
+                _formatter()._format_json(schema.get("schema"))
 
         if output:
-            formatter.print_success(f"Schema saved to {output}")
+            _formatter().print_success(f"Schema saved to {output}")
 
     except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
+        _formatter().print_error(f"Authentication error: {e}")
         raise typer.Exit(1)
     except Exception as e:
         if "ApiFeaturePreviewUsageOnly" in str(e):
-            formatter.print_error(
+            _formatter().print_error(
                 "This command requires API preview access. "
                 "Please use 'pltr dataset schema apply' instead."
             )
         else:
-            formatter.print_error(f"Failed to get schema: {e}")
+            _formatter().print_error(f"Failed to get schema: {e}")
         raise typer.Exit(1)
 
 
 @schema_app.command("apply")
+@_handle_errors("Failed to apply schema")
 def apply_schema(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -204,27 +228,17 @@ def apply_schema(
     ),
 ):
     """Apply/infer schema for a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Applying schema to dataset {dataset_rid} on branch '{branch}'..."
-        ):
-            result = service.apply_schema(dataset_rid, branch)
+    with _spinner(f"Applying schema to dataset {dataset_rid} on branch '{branch}'..."):
+        result = service.apply_schema(dataset_rid, branch)
 
-        formatter.print_success(f"Schema applied successfully to branch '{branch}'")
+    _formatter().print_success(f"Schema applied successfully to branch '{branch}'")
 
-        # Display result if available
-        if result.get("result"):
-            formatter._format_json(result.get("result"))
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to apply schema: {e}")
-        raise typer.Exit(1)
+    # Display result if available
+    if result.get("result"):
+        _formatter()._format_json(result.get("result"))
 
 
 @schema_app.command("set")
@@ -252,12 +266,12 @@ def set_schema(
     """Set or update the schema of a dataset."""
     try:
         cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+        service = _service(profile)
 
         # Validate that exactly one input method is provided
         input_methods = [from_csv, json_schema, json_file]
         if sum(x is not None for x in input_methods) != 1:
-            formatter.print_error(
+            _formatter().print_error(
                 "Exactly one of --from-csv, --json, or --json-file must be provided"
             )
             raise typer.Exit(1)
@@ -266,15 +280,13 @@ def set_schema(
 
         # Infer schema from CSV
         if from_csv:
-            with SpinnerProgressTracker().track_spinner(
-                f"Inferring schema from {from_csv}..."
-            ):
+            with _spinner(f"Inferring schema from {from_csv}..."):
                 schema = service.infer_schema_from_csv(from_csv)
-                formatter.print_info(
+                _formatter().print_info(
                     f"Inferred schema from CSV with {len(schema.field_schema_list)} fields"
                 )
                 for field in schema.field_schema_list:
-                    formatter.print_info(
+                    _formatter().print_info(
                         f"  - {field.name}: {field.type} (nullable={field.nullable})"
                     )
 
@@ -296,7 +308,7 @@ def set_schema(
                     )
                 schema = DatasetSchema(field_schema_list=fields)
             except (json.JSONDecodeError, KeyError) as e:
-                formatter.print_error(f"Invalid JSON schema: {e}")
+                _formatter().print_error(f"Invalid JSON schema: {e}")
                 raise typer.Exit(1)
 
         # Load schema from JSON file
@@ -318,13 +330,11 @@ def set_schema(
                     )
                 schema = DatasetSchema(field_schema_list=fields)
             except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                formatter.print_error(f"Failed to load schema from file: {e}")
+                _formatter().print_error(f"Failed to load schema from file: {e}")
                 raise typer.Exit(1)
 
         # Apply the schema
-        with SpinnerProgressTracker().track_spinner(
-            f"Setting schema on dataset {dataset_rid}..."
-        ):
+        with _spinner(f"Setting schema on dataset {dataset_rid}..."):
             service.put_schema(
                 dataset_rid=dataset_rid,
                 schema=schema,
@@ -332,22 +342,23 @@ def set_schema(
                 transaction_rid=transaction_rid,
             )
 
-        formatter.print_success(f"Successfully set schema on dataset {dataset_rid}")
+        _formatter().print_success(f"Successfully set schema on dataset {dataset_rid}")
         if transaction_rid:
-            formatter.print_info(f"Transaction RID: {transaction_rid}")
+            _formatter().print_info(f"Transaction RID: {transaction_rid}")
 
     except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
+        _formatter().print_error(f"Authentication error: {e}")
         raise typer.Exit(1)
     except FileNotFoundError as e:
-        formatter.print_error(f"File not found: {e}")
+        _formatter().print_error(f"File not found: {e}")
         raise typer.Exit(1)
     except Exception as e:
-        formatter.print_error(f"Failed to set schema: {e}")
+        _formatter().print_error(f"Failed to set schema: {e}")
         raise typer.Exit(1)
 
 
 @app.command("create")
+@_handle_errors("Failed to create dataset")
 def create_dataset(
     name: str = typer.Argument(..., help="Dataset name"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile name"),
@@ -361,28 +372,21 @@ def create_dataset(
     ),
 ):
     """Create a new dataset."""
-    try:
-        service = DatasetService(profile=profile)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(f"Creating dataset '{name}'..."):
-            dataset = service.create_dataset(name=name, parent_folder_rid=parent_folder)
+    with _spinner(f"Creating dataset '{name}'..."):
+        dataset = service.create_dataset(name=name, parent_folder_rid=parent_folder)
 
-        formatter.print_success(f"Successfully created dataset '{name}'")
-        formatter.print_info(f"Dataset RID: {dataset.get('rid', 'unknown')}")
+    _formatter().print_success(f"Successfully created dataset '{name}'")
+    _formatter().print_info(f"Dataset RID: {dataset.get('rid', 'unknown')}")
 
-        # Show dataset details
-        formatter.format_dataset_detail(dataset, format)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to create dataset: {e}")
-        raise typer.Exit(1)
+    # Show dataset details
+    _formatter().format_dataset_detail(dataset, format)
 
 
 # Branch commands
 @branches_app.command("list")
+@_handle_errors("Failed to get branches")
 def list_branches(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -402,29 +406,20 @@ def list_branches(
     ),
 ):
     """List branches for a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching branches for {dataset_rid}..."
-        ):
-            branches = service.get_branches(dataset_rid)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.format_branches(branches, format, output)
+    with _spinner(f"Fetching branches for {dataset_rid}..."):
+        branches = service.get_branches(dataset_rid)
 
-        if output:
-            formatter.print_success(f"Branches information saved to {output}")
+    _formatter().format_branches(branches, format, output)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get branches: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Branches information saved to {output}")
 
 
 @branches_app.command("create")
+@_handle_errors("Failed to create branch")
 def create_branch(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -445,27 +440,18 @@ def create_branch(
     ),
 ):
     """Create a new branch for a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Creating branch '{branch_name}' from '{parent_branch}'..."
-        ):
-            branch = service.create_branch(dataset_rid, branch_name, parent_branch)
+    with _spinner(f"Creating branch '{branch_name}' from '{parent_branch}'..."):
+        branch = service.create_branch(dataset_rid, branch_name, parent_branch)
 
-        formatter.print_success(f"Successfully created branch '{branch_name}'")
-        formatter.format_branch_detail(branch, format)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to create branch: {e}")
-        raise typer.Exit(1)
+    _formatter().print_success(f"Successfully created branch '{branch_name}'")
+    _formatter().format_branch_detail(branch, format)
 
 
 @branches_app.command("delete")
+@_handle_errors("Failed to delete branch")
 def delete_branch(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -477,42 +463,33 @@ def delete_branch(
     ),
 ):
     """Delete a branch from a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Prevent deleting master branch
-        if branch_name.lower() == "master":
-            formatter.print_error("Cannot delete the master branch")
-            raise typer.Exit(1)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        # Confirmation prompt
-        if not confirm:
-            confirmed = typer.confirm(
-                f"Are you sure you want to delete branch '{branch_name}' from dataset {dataset_rid}? "
-                f"This action cannot be undone."
-            )
-            if not confirmed:
-                formatter.print_info("Branch deletion cancelled")
-                raise typer.Exit(0)
+    # Prevent deleting master branch
+    if branch_name.lower() == "master":
+        _formatter().print_error("Cannot delete the master branch")
+        raise typer.Exit(1)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Deleting branch '{branch_name}' from {dataset_rid}..."
-        ):
-            service.delete_branch(dataset_rid, branch_name)
+    # Confirmation prompt
+    if not confirm:
+        confirmed = typer.confirm(
+            f"Are you sure you want to delete branch '{branch_name}' from dataset {dataset_rid}? "
+            f"This action cannot be undone."
+        )
+        if not confirmed:
+            _formatter().print_info("Branch deletion cancelled")
+            raise typer.Exit(0)
 
-        formatter.print_success(f"Branch '{branch_name}' deleted successfully")
-        formatter.print_info(f"Dataset: {dataset_rid}")
+    with _spinner(f"Deleting branch '{branch_name}' from {dataset_rid}..."):
+        service.delete_branch(dataset_rid, branch_name)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to delete branch: {e}")
-        raise typer.Exit(1)
+    _formatter().print_success(f"Branch '{branch_name}' deleted successfully")
+    _formatter().print_info(f"Dataset: {dataset_rid}")
 
 
 @branches_app.command("get")
+@_handle_errors("Failed to get branch")
 def get_branch(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -533,29 +510,20 @@ def get_branch(
     ),
 ):
     """Get detailed information about a specific branch."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching branch '{branch_name}' from {dataset_rid}..."
-        ):
-            branch = service.get_branch(dataset_rid, branch_name)
+    with _spinner(f"Fetching branch '{branch_name}' from {dataset_rid}..."):
+        branch = service.get_branch(dataset_rid, branch_name)
 
-        formatter.format_branch_detail(branch, format, output)
+    _formatter().format_branch_detail(branch, format, output)
 
-        if output:
-            formatter.print_success(f"Branch information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get branch: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Branch information saved to {output}")
 
 
 @branches_app.command("transactions")
+@_handle_errors("Failed to get branch transactions")
 def list_branch_transactions(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -576,30 +544,23 @@ def list_branch_transactions(
     ),
 ):
     """Get transaction history for a specific branch."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching transaction history for branch '{branch_name}' in {dataset_rid}..."
-        ):
-            transactions = service.get_branch_transactions(dataset_rid, branch_name)
+    with _spinner(
+        f"Fetching transaction history for branch '{branch_name}' in {dataset_rid}..."
+    ):
+        transactions = service.get_branch_transactions(dataset_rid, branch_name)
 
-        formatter.format_transactions(transactions, format, output)
+    _formatter().format_transactions(transactions, format, output)
 
-        if output:
-            formatter.print_success(f"Branch transactions saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get branch transactions: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Branch transactions saved to {output}")
 
 
 # Files commands
 @files_app.command("list")
+@_handle_errors("Failed to list files")
 def list_files(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -647,49 +608,53 @@ def list_files(
         # List first 3 pages
         pltr dataset files list DATASET_RID --max-pages 3
     """
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Create pagination config
-        config = PaginationConfig(
-            page_size=page_size,
-            max_pages=max_pages,
-            page_token=page_token,
-            fetch_all=all,
+    cache_rid(dataset_rid)
+    service = _service(profile)
+
+    # Create pagination config
+    config = PaginationConfig(
+        page_size=page_size,
+        max_pages=max_pages,
+        page_token=page_token,
+        fetch_all=all,
+    )
+    description = f"Fetching files from {dataset_rid} (branch: {branch})..."
+
+    if output and format in ("json", "csv"):
+        # Write each page as it arrives instead of collecting every page first
+        metadata = PaginationMetadata()
+        pages = prefetch(
+            service.iter_files_pages(dataset_rid, branch, config, metadata)
+        )
+        if format == "csv":
+            pages = (_formatter().file_rows(page) for page in pages)
+        with _spinner(description):
+            _formatter().stream_paginated_to_file(pages, metadata, output, format)
+        _formatter().print_success(f"Files information saved to {output}")
+        return
+
+    with _spinner(description):
+        result = service.list_files_paginated(dataset_rid, branch, config)
+
+    # Format and display paginated results
+    if output:
+        _formatter().format_paginated_output(
+            result,
+            format,
+            output,
+            formatter_fn=lambda data, fmt, out: _formatter().format_files(
+                data, fmt, out
+            ),
+        )
+        _formatter().print_success(f"Files information saved to {output}")
+    else:
+        _formatter().format_paginated_output(
+            result,
+            format,
+            formatter_fn=lambda data, fmt, out: _formatter().format_files(
+                data, fmt, out
+            ),
         )
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching files from {dataset_rid} (branch: {branch})..."
-        ):
-            result = service.list_files_paginated(dataset_rid, branch, config)
-
-        # Format and display paginated results
-        if output:
-            formatter.format_paginated_output(
-                result,
-                format,
-                output,
-                formatter_fn=lambda data, fmt, out: formatter.format_files(
-                    data, fmt, out
-                ),
-            )
-            formatter.print_success(f"Files information saved to {output}")
-        else:
-            formatter.format_paginated_output(
-                result,
-                format,
-                formatter_fn=lambda data, fmt, out: formatter.format_files(
-                    data, fmt, out
-                ),
-            )
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list files: {e}")
-        raise typer.Exit(1)
 
 
 @files_app.command("upload")
@@ -707,67 +672,70 @@ def upload_file(
     ),
 ):
     """Upload a file to a dataset."""
+    # Checked with a single stat, before the try so the exit is not
+    # reported a second time as an upload failure
     try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Check if file exists
-        from pathlib import Path
+        is_file = stat.S_ISREG(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        _formatter().print_error(f"File not found: {file_path}")
+        raise typer.Exit(1)
+    if not is_file:
+        _formatter().print_error(f"Not a regular file: {file_path}")
+        raise typer.Exit(1)
 
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            formatter.print_error(f"File not found: {file_path}")
-            raise typer.Exit(1)
+    try:
+        cache_rid(dataset_rid)
+        service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Uploading {file_path_obj.name} to {dataset_rid}..."
-        ):
+        file_name = os.path.basename(file_path)
+        with _spinner(f"Uploading {file_name} to {dataset_rid}..."):
             result = service.upload_file(
                 dataset_rid, file_path, branch, transaction_rid
             )
 
-        formatter.print_success("File uploaded successfully")
-        formatter.print_info(f"File: {result.get('file_path', file_path)}")
-        formatter.print_info(f"Dataset: {dataset_rid}")
-        formatter.print_info(f"Branch: {branch}")
-        formatter.print_info(f"Size: {result.get('size_bytes', 'unknown')} bytes")
+        _formatter().print_success("File uploaded successfully")
+        _formatter().print_info(f"File: {result.get('file_path', file_path)}")
+        _formatter().print_info(f"Dataset: {dataset_rid}")
+        _formatter().print_info(f"Branch: {branch}")
+        _formatter().print_info(f"Size: {result.get('size_bytes', 'unknown')} bytes")
 
         if result.get("transaction_rid"):
-            formatter.print_info(f"Transaction: {result['transaction_rid']}")
-            formatter.print_warning(
+            _formatter().print_info(f"Transaction: {result['transaction_rid']}")
+            _formatter().print_warning(
                 "Remember to commit the transaction to make changes permanent"
             )
 
     except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
+        _formatter().print_error(f"Authentication error: {e}")
         raise typer.Exit(1)
     except FileNotFoundError as e:
-        formatter.print_error(f"File error: {e}")
+        _formatter().print_error(f"File error: {e}")
         raise typer.Exit(1)
     except RuntimeError as e:
         # RuntimeError from our service layer contains detailed error info
         error_msg = str(e)
-        formatter.print_error(f"Upload failed: {error_msg}")
+        _formatter().print_error(f"Upload failed: {error_msg}")
 
         # If it looks like our enhanced error message, extract the suggestion part
         if ". Suggestions: " in error_msg:
             main_error, suggestions = error_msg.split(". Suggestions: ", 1)
-            formatter.print_error(main_error)
-            formatter.print_info(f"💡 Suggestions: {suggestions}")
+            _formatter().print_error(main_error)
+            _formatter().print_info(f"💡 Suggestions: {suggestions}")
 
         raise typer.Exit(1)
     except Exception as e:
         # Fallback for any other exceptions
-        formatter.print_error(
+        _formatter().print_error(
             f"Unexpected error during file upload: {type(e).__name__}: {e}"
         )
-        formatter.print_info(
+        _formatter().print_info(
             "💡 Try running the command again or check your connection"
         )
         raise typer.Exit(1)
 
 
 @files_app.command("get")
+@_handle_errors("Failed to download file")
 def get_file(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -780,27 +748,18 @@ def get_file(
     ),
 ):
     """Download a file from a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Downloading {file_path} from {dataset_rid}..."
-        ):
-            result = service.download_file(dataset_rid, file_path, output_path, branch)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.print_success(f"File downloaded to {result['output_path']}")
-        formatter.print_info(f"Size: {result.get('size_bytes', 'unknown')} bytes")
+    with _spinner(f"Downloading {file_path} from {dataset_rid}..."):
+        result = service.download_file(dataset_rid, file_path, output_path, branch)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to download file: {e}")
-        raise typer.Exit(1)
+    _formatter().print_success(f"File downloaded to {result['output_path']}")
+    _formatter().print_info(f"Size: {result.get('size_bytes', 'unknown')} bytes")
 
 
 @files_app.command("delete")
+@_handle_errors("Failed to delete file")
 def delete_file(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -813,37 +772,28 @@ def delete_file(
     ),
 ):
     """Delete a file from a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Confirmation prompt
-        if not confirm:
-            confirmed = typer.confirm(
-                f"Are you sure you want to delete '{file_path}' from dataset {dataset_rid}?"
-            )
-            if not confirmed:
-                formatter.print_info("File deletion cancelled")
-                raise typer.Exit(0)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Deleting {file_path} from {dataset_rid}..."
-        ):
-            service.delete_file(dataset_rid, file_path, branch)
+    # Confirmation prompt
+    if not confirm:
+        confirmed = typer.confirm(
+            f"Are you sure you want to delete '{file_path}' from dataset {dataset_rid}?"
+        )
+        if not confirmed:
+            _formatter().print_info("File deletion cancelled")
+            raise typer.Exit(0)
 
-        formatter.print_success(f"File '{file_path}' deleted successfully")
-        formatter.print_info(f"Dataset: {dataset_rid}")
-        formatter.print_info(f"Branch: {branch}")
+    with _spinner(f"Deleting {file_path} from {dataset_rid}..."):
+        service.delete_file(dataset_rid, file_path, branch)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to delete file: {e}")
-        raise typer.Exit(1)
+    _formatter().print_success(f"File '{file_path}' deleted successfully")
+    _formatter().print_info(f"Dataset: {dataset_rid}")
+    _formatter().print_info(f"Branch: {branch}")
 
 
 @files_app.command("info")
+@_handle_errors("Failed to get file info")
 def get_file_info(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -865,30 +815,21 @@ def get_file_info(
     ),
 ):
     """Get metadata information about a file in a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Getting file info for {file_path} in {dataset_rid}..."
-        ):
-            file_info = service.get_file_info(dataset_rid, file_path, branch)
+    with _spinner(f"Getting file info for {file_path} in {dataset_rid}..."):
+        file_info = service.get_file_info(dataset_rid, file_path, branch)
 
-        formatter.format_file_info(file_info, format, output)
+    _formatter().format_file_info(file_info, format, output)
 
-        if output:
-            formatter.print_success(f"File information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get file info: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"File information saved to {output}")
 
 
 # Transaction commands
 @transactions_app.command("start")
+@_handle_errors("Failed to start transaction")
 def start_transaction(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -909,60 +850,51 @@ def start_transaction(
     ),
 ):
     """Start a new transaction for a dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Validate transaction type
-        valid_types = ["APPEND", "UPDATE", "SNAPSHOT", "DELETE"]
-        if transaction_type not in valid_types:
-            formatter.print_error(
-                f"Invalid transaction type. Must be one of: {', '.join(valid_types)}"
-            )
-            raise typer.Exit(1)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Starting {transaction_type} transaction for {dataset_rid} (branch: {branch})..."
-        ):
-            transaction = service.create_transaction(
-                dataset_rid, branch, transaction_type
-            )
+    cache_rid(dataset_rid)
+    service = _service(profile)
+
+    # Validate transaction type
+    valid_types = ["APPEND", "UPDATE", "SNAPSHOT", "DELETE"]
+    if transaction_type not in valid_types:
+        _formatter().print_error(
+            f"Invalid transaction type. Must be one of: {', '.join(valid_types)}"
+        )
+        raise typer.Exit(1)
 
-        formatter.print_success("Transaction started successfully")
-        formatter.print_info(
-            f"Transaction RID: {transaction.get('transaction_rid', 'unknown')}"
+    with _spinner(
+        f"Starting {transaction_type} transaction for {dataset_rid} (branch: {branch})..."
+    ):
+        transaction = service.create_transaction(dataset_rid, branch, transaction_type)
+
+    _formatter().print_success("Transaction started successfully")
+    _formatter().print_info(
+        f"Transaction RID: {transaction.get('transaction_rid', 'unknown')}"
+    )
+    _formatter().print_info(f"Status: {transaction.get('status', 'OPEN')}")
+    _formatter().print_info(
+        f"Type: {transaction.get('transaction_type', transaction_type)}"
+    )
+
+    # Show transaction details
+    _formatter().format_transaction_detail(transaction, format)
+
+    # Show usage hint
+    transaction_rid = transaction.get("transaction_rid", "unknown")
+    if transaction_rid != "unknown":
+        _formatter().print_info("\nNext steps:")
+        _formatter().print_info(
+            f"  Upload files: pltr dataset files upload <file-path> {dataset_rid} --transaction-rid {transaction_rid}"
         )
-        formatter.print_info(f"Status: {transaction.get('status', 'OPEN')}")
-        formatter.print_info(
-            f"Type: {transaction.get('transaction_type', transaction_type)}"
+        _formatter().print_info(
+            f"  Commit: pltr dataset transactions commit {dataset_rid} {transaction_rid}"
+        )
+        _formatter().print_info(
+            f"  Abort: pltr dataset transactions abort {dataset_rid} {transaction_rid}"
         )
-
-        # Show transaction details
-        formatter.format_transaction_detail(transaction, format)
-
-        # Show usage hint
-        transaction_rid = transaction.get("transaction_rid", "unknown")
-        if transaction_rid != "unknown":
-            formatter.print_info("\nNext steps:")
-            formatter.print_info(
-                f"  Upload files: pltr dataset files upload <file-path> {dataset_rid} --transaction-rid {transaction_rid}"
-            )
-            formatter.print_info(
-                f"  Commit: pltr dataset transactions commit {dataset_rid} {transaction_rid}"
-            )
-            formatter.print_info(
-                f"  Abort: pltr dataset transactions abort {dataset_rid} {transaction_rid}"
-            )
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to start transaction: {e}")
-        raise typer.Exit(1)
 
 
 @transactions_app.command("commit")
+@_handle_errors("Failed to commit transaction")
 def commit_transaction(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -980,32 +912,23 @@ def commit_transaction(
     ),
 ):
     """Commit an open transaction."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Committing transaction {transaction_rid}..."
-        ):
-            result = service.commit_transaction(dataset_rid, transaction_rid)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.print_success("Transaction committed successfully")
-        formatter.print_info(f"Transaction RID: {transaction_rid}")
-        formatter.print_info(f"Dataset RID: {dataset_rid}")
-        formatter.print_info(f"Status: {result.get('status', 'COMMITTED')}")
+    with _spinner(f"Committing transaction {transaction_rid}..."):
+        result = service.commit_transaction(dataset_rid, transaction_rid)
 
-        # Show result details
-        formatter.format_transaction_result(result, format)
+    _formatter().print_success("Transaction committed successfully")
+    _formatter().print_info(f"Transaction RID: {transaction_rid}")
+    _formatter().print_info(f"Dataset RID: {dataset_rid}")
+    _formatter().print_info(f"Status: {result.get('status', 'COMMITTED')}")
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to commit transaction: {e}")
-        raise typer.Exit(1)
+    # Show result details
+    _formatter().format_transaction_result(result, format)
 
 
 @transactions_app.command("abort")
+@_handle_errors("Failed to abort transaction")
 def abort_transaction(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1024,45 +947,36 @@ def abort_transaction(
     ),
 ):
     """Abort an open transaction."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        # Confirmation prompt
-        if not confirm:
-            confirmed = typer.confirm(
-                f"Are you sure you want to abort transaction {transaction_rid}? "
-                f"This will discard all changes made in this transaction."
-            )
-            if not confirmed:
-                formatter.print_info("Transaction abort cancelled")
-                raise typer.Exit(0)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Aborting transaction {transaction_rid}..."
-        ):
-            result = service.abort_transaction(dataset_rid, transaction_rid)
-
-        formatter.print_success("Transaction aborted successfully")
-        formatter.print_info(f"Transaction RID: {transaction_rid}")
-        formatter.print_info(f"Dataset RID: {dataset_rid}")
-        formatter.print_info(f"Status: {result.get('status', 'ABORTED')}")
-        formatter.print_warning(
-            "All changes made in this transaction have been discarded"
+    cache_rid(dataset_rid)
+    service = _service(profile)
+
+    # Confirmation prompt
+    if not confirm:
+        confirmed = typer.confirm(
+            f"Are you sure you want to abort transaction {transaction_rid}? "
+            f"This will discard all changes made in this transaction."
         )
+        if not confirmed:
+            _formatter().print_info("Transaction abort cancelled")
+            raise typer.Exit(0)
 
-        # Show result details
-        formatter.format_transaction_result(result, format)
+    with _spinner(f"Aborting transaction {transaction_rid}..."):
+        result = service.abort_transaction(dataset_rid, transaction_rid)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to abort transaction: {e}")
-        raise typer.Exit(1)
+    _formatter().print_success("Transaction aborted successfully")
+    _formatter().print_info(f"Transaction RID: {transaction_rid}")
+    _formatter().print_info(f"Dataset RID: {dataset_rid}")
+    _formatter().print_info(f"Status: {result.get('status', 'ABORTED')}")
+    _formatter().print_warning(
+        "All changes made in this transaction have been discarded"
+    )
+
+    # Show result details
+    _formatter().format_transaction_result(result, format)
 
 
 @transactions_app.command("status")
+@_handle_errors("Failed to get transaction status")
 def get_transaction_status(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1080,29 +994,20 @@ def get_transaction_status(
     ),
 ):
     """Get the status of a specific transaction."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching transaction status for {transaction_rid}..."
-        ):
-            transaction = service.get_transaction_status(dataset_rid, transaction_rid)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.print_success("Transaction status retrieved")
+    with _spinner(f"Fetching transaction status for {transaction_rid}..."):
+        transaction = service.get_transaction_status(dataset_rid, transaction_rid)
 
-        # Show transaction details
-        formatter.format_transaction_detail(transaction, format)
+    _formatter().print_success("Transaction status retrieved")
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get transaction status: {e}")
-        raise typer.Exit(1)
+    # Show transaction details
+    _formatter().format_transaction_detail(transaction, format)
 
 
 @transactions_app.command("list")
+@_handle_errors("Failed to list transactions")
 def list_transactions(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1125,30 +1030,23 @@ def list_transactions(
     """List transactions for a dataset branch."""
     try:
         cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+        service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching transactions for {dataset_rid} (branch: {branch})..."
-        ):
+        with _spinner(f"Fetching transactions for {dataset_rid} (branch: {branch})..."):
             transactions = service.get_transactions(dataset_rid, branch)
 
-        formatter.format_transactions(transactions, format, output)
+        _formatter().format_transactions(transactions, format, output)
 
         if output:
-            formatter.print_success(f"Transactions information saved to {output}")
+            _formatter().print_success(f"Transactions information saved to {output}")
 
     except NotImplementedError as e:
-        formatter.print_warning(f"Feature not available: {e}")
+        _formatter().print_warning(f"Feature not available: {e}")
         raise typer.Exit(0)
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list transactions: {e}")
-        raise typer.Exit(1)
 
 
 @transactions_app.command("build")
+@_handle_errors("Failed to get transaction build")
 def get_transaction_build(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1169,30 +1067,21 @@ def get_transaction_build(
     ),
 ):
     """Get build information for a transaction."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching build information for transaction {transaction_rid}..."
-        ):
-            build_info = service.get_transaction_build(dataset_rid, transaction_rid)
+    with _spinner(f"Fetching build information for transaction {transaction_rid}..."):
+        build_info = service.get_transaction_build(dataset_rid, transaction_rid)
 
-        formatter.format_transaction_build(build_info, format, output)
+    _formatter().format_transaction_build(build_info, format, output)
 
-        if output:
-            formatter.print_success(f"Build information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get transaction build: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Build information saved to {output}")
 
 
 # Views commands
 @views_app.command("list")
+@_handle_errors("Failed to list views")
 def list_views(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1214,30 +1103,23 @@ def list_views(
     """List views for a dataset."""
     try:
         cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+        service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching views for {dataset_rid}..."
-        ):
+        with _spinner(f"Fetching views for {dataset_rid}..."):
             views = service.get_views(dataset_rid)
 
-        formatter.format_views(views, format, output)
+        _formatter().format_views(views, format, output)
 
         if output:
-            formatter.print_success(f"Views information saved to {output}")
+            _formatter().print_success(f"Views information saved to {output}")
 
     except NotImplementedError as e:
-        formatter.print_warning(f"Feature not available: {e}")
+        _formatter().print_warning(f"Feature not available: {e}")
         raise typer.Exit(0)
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to list views: {e}")
-        raise typer.Exit(1)
 
 
 @views_app.command("get")
+@_handle_errors("Failed to get view")
 def get_view(
     view_rid: str = typer.Argument(
         ..., help="View Resource Identifier", autocompletion=complete_rid
@@ -1258,27 +1140,20 @@ def get_view(
     ),
 ):
     """Get detailed information about a view."""
-    try:
-        cache_rid(view_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(view_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(f"Fetching view {view_rid}..."):
-            view = service.get_view(view_rid, branch)
+    with _spinner(f"Fetching view {view_rid}..."):
+        view = service.get_view(view_rid, branch)
 
-        formatter.format_view_detail(view, format, output)
+    _formatter().format_view_detail(view, format, output)
 
-        if output:
-            formatter.print_success(f"View information saved to {output}")
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get view: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"View information saved to {output}")
 
 
 @views_app.command("add-datasets")
+@_handle_errors("Failed to add backing datasets")
 def add_backing_datasets(
     view_rid: str = typer.Argument(
         ..., help="View Resource Identifier", autocompletion=complete_rid
@@ -1298,31 +1173,22 @@ def add_backing_datasets(
     ),
 ):
     """Add backing datasets to a view."""
-    try:
-        cache_rid(view_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(view_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Adding {len(dataset_rids)} backing datasets to view {view_rid}..."
-        ):
-            result = service.add_backing_datasets(view_rid, dataset_rids)
+    with _spinner(f"Adding {len(dataset_rids)} backing datasets to view {view_rid}..."):
+        result = service.add_backing_datasets(view_rid, dataset_rids)
 
-        formatter.print_success("Successfully added backing datasets to view")
-        formatter.print_info(f"View RID: {view_rid}")
-        formatter.print_info(f"Added datasets: {', '.join(dataset_rids)}")
+    _formatter().print_success("Successfully added backing datasets to view")
+    _formatter().print_info(f"View RID: {view_rid}")
+    _formatter().print_info(f"Added datasets: {', '.join(dataset_rids)}")
 
-        if format == "json":
-            formatter._format_json(result)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to add backing datasets: {e}")
-        raise typer.Exit(1)
+    if format == "json":
+        _formatter()._format_json(result)
 
 
 @views_app.command("remove-datasets")
+@_handle_errors("Failed to remove backing datasets")
 def remove_backing_datasets(
     view_rid: str = typer.Argument(
         ..., help="View Resource Identifier", autocompletion=complete_rid
@@ -1342,31 +1208,24 @@ def remove_backing_datasets(
     ),
 ):
     """Remove backing datasets from a view."""
-    try:
-        cache_rid(view_rid)
-        service = DatasetService(profile=profile)
+    cache_rid(view_rid)
+    service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Removing {len(dataset_rids)} backing datasets from view {view_rid}..."
-        ):
-            result = service.remove_backing_datasets(view_rid, dataset_rids)
+    with _spinner(
+        f"Removing {len(dataset_rids)} backing datasets from view {view_rid}..."
+    ):
+        result = service.remove_backing_datasets(view_rid, dataset_rids)
 
-        formatter.print_success("Successfully removed backing datasets from view")
-        formatter.print_info(f"View RID: {view_rid}")
-        formatter.print_info(f"Removed datasets: {', '.join(dataset_rids)}")
+    _formatter().print_success("Successfully removed backing datasets from view")
+    _formatter().print_info(f"View RID: {view_rid}")
+    _formatter().print_info(f"Removed datasets: {', '.join(dataset_rids)}")
 
-        if format == "json":
-            formatter._format_json(result)
-
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to remove backing datasets: {e}")
-        raise typer.Exit(1)
+    if format == "json":
+        _formatter()._format_json(result)
 
 
 @views_app.command("replace-datasets")
+@_handle_errors("Failed to replace backing datasets")
 def replace_backing_datasets(
     view_rid: str = typer.Argument(
         ..., help="View Resource Identifier", autocompletion=complete_rid
@@ -1386,31 +1245,24 @@ def replace_backing_datasets(
     ),
 ):
     """Replace all backing datasets in a view."""
-    try:
-        cache_rid(view_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Replacing backing datasets in view {view_rid} with {len(dataset_rids)} new datasets..."
-        ):
-            result = service.replace_backing_datasets(view_rid, dataset_rids)
+    cache_rid(view_rid)
+    service = _service(profile)
 
-        formatter.print_success("Successfully replaced backing datasets in view")
-        formatter.print_info(f"View RID: {view_rid}")
-        formatter.print_info(f"New datasets: {', '.join(dataset_rids)}")
+    with _spinner(
+        f"Replacing backing datasets in view {view_rid} with {len(dataset_rids)} new datasets..."
+    ):
+        result = service.replace_backing_datasets(view_rid, dataset_rids)
 
-        if format == "json":
-            formatter._format_json(result)
+    _formatter().print_success("Successfully replaced backing datasets in view")
+    _formatter().print_info(f"View RID: {view_rid}")
+    _formatter().print_info(f"New datasets: {', '.join(dataset_rids)}")
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to replace backing datasets: {e}")
-        raise typer.Exit(1)
+    if format == "json":
+        _formatter()._format_json(result)
 
 
 @views_app.command("add-primary-key")
+@_handle_errors("Failed to add primary key")
 def add_primary_key(
     view_rid: str = typer.Argument(
         ..., help="View Resource Identifier", autocompletion=complete_rid
@@ -1430,31 +1282,22 @@ def add_primary_key(
     ),
 ):
     """Add a primary key to a view."""
-    try:
-        cache_rid(view_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Adding primary key to view {view_rid}..."
-        ):
-            result = service.add_primary_key(view_rid, key_fields)
+    cache_rid(view_rid)
+    service = _service(profile)
 
-        formatter.print_success("Successfully added primary key to view")
-        formatter.print_info(f"View RID: {view_rid}")
-        formatter.print_info(f"Primary key fields: {', '.join(key_fields)}")
+    with _spinner(f"Adding primary key to view {view_rid}..."):
+        result = service.add_primary_key(view_rid, key_fields)
 
-        if format == "json":
-            formatter._format_json(result)
+    _formatter().print_success("Successfully added primary key to view")
+    _formatter().print_info(f"View RID: {view_rid}")
+    _formatter().print_info(f"Primary key fields: {', '.join(key_fields)}")
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to add primary key: {e}")
-        raise typer.Exit(1)
+    if format == "json":
+        _formatter()._format_json(result)
 
 
 @views_app.command("create")
+@_handle_errors("Failed to create view")
 def create_view(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1477,29 +1320,22 @@ def create_view(
     """Create a new view for a dataset."""
     try:
         cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
+        service = _service(profile)
 
-        with SpinnerProgressTracker().track_spinner(
-            f"Creating view '{view_name}' for {dataset_rid}..."
-        ):
+        with _spinner(f"Creating view '{view_name}' for {dataset_rid}..."):
             view = service.create_view(dataset_rid, view_name, description)
 
-        formatter.print_success(f"Successfully created view '{view_name}'")
-        formatter.format_view_detail(view, format)
+        _formatter().print_success(f"Successfully created view '{view_name}'")
+        _formatter().format_view_detail(view, format)
 
     except NotImplementedError as e:
-        formatter.print_warning(f"Feature not available: {e}")
+        _formatter().print_warning(f"Feature not available: {e}")
         raise typer.Exit(0)
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to create view: {e}")
-        raise typer.Exit(1)
 
 
 # Schedules commands
 @schedules_app.command("list")
+@_handle_errors("Failed to get schedules")
 def list_schedules(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1519,30 +1355,21 @@ def list_schedules(
     ),
 ):
     """List schedules that target a specific dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching schedules for dataset {dataset_rid}..."
-        ):
-            schedules = service.get_schedules(dataset_rid)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.format_schedules(schedules, format, output)
+    with _spinner(f"Fetching schedules for dataset {dataset_rid}..."):
+        schedules = service.get_schedules(dataset_rid)
 
-        if output:
-            formatter.print_success(f"Schedules information saved to {output}")
+    _formatter().format_schedules(schedules, format, output)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get schedules: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Schedules information saved to {output}")
 
 
 # Jobs commands
 @jobs_app.command("list")
+@_handle_errors("Failed to get jobs")
 def list_jobs(
     dataset_rid: str = typer.Argument(
         ..., help="Dataset Resource Identifier", autocompletion=complete_rid
@@ -1563,26 +1390,16 @@ def list_jobs(
     ),
 ):
     """List jobs for a specific dataset."""
-    try:
-        cache_rid(dataset_rid)
-        service = DatasetService(profile=profile)
-
-        with SpinnerProgressTracker().track_spinner(
-            f"Fetching jobs for dataset {dataset_rid} (branch: {branch})..."
-        ):
-            jobs = service.get_jobs(dataset_rid, branch)
+    cache_rid(dataset_rid)
+    service = _service(profile)
 
-        formatter.format_jobs(jobs, format, output)
+    with _spinner(f"Fetching jobs for dataset {dataset_rid} (branch: {branch})..."):
+        jobs = service.get_jobs(dataset_rid, branch)
 
-        if output:
-            formatter.print_success(f"Jobs information saved to {output}")
+    _formatter().format_jobs(jobs, format, output)
 
-    except (ProfileNotFoundError, MissingCredentialsError) as e:
-        formatter.print_error(f"Authentication error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        formatter.print_error(f"Failed to get jobs: {e}")
-        raise typer.Exit(1)
+    if output:
+        _formatter().print_success(f"Jobs information saved to {output}")
 
 
 # Add subcommands to main app
@@ -16,6 +16,7 @@ from ..utils.completion import (
     complete_profile,
     complete_output_format,
     cache_rid,
+    cache_rids,
 )
 
 app = typer.Typer()
@@ -48,8 +49,7 @@ def get_media_item(
 ):
     """Get detailed information about a specific media item."""
     try:
-        cache_rid(media_set_rid)
-        cache_rid(media_item_rid)
+        cache_rids(media_set_rid, media_item_rid)
         service = MediaSetsService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner(
@@ -325,8 +325,7 @@ def download_media(
             formatter.print_info("Use --overwrite to replace existing file")
             raise typer.Exit(1)
 
-        cache_rid(media_set_rid)
-        cache_rid(media_item_rid)
+        cache_rids(media_set_rid, media_item_rid)
         service = MediaSetsService(profile=profile)
 
         version_type = "original" if original else "processed"
@@ -381,8 +380,7 @@ def get_media_reference(
 ):
     """Get a reference to a media item (e.g., for embedding)."""
     try:
-        cache_rid(media_set_rid)
-        cache_rid(media_item_rid)
+        cache_rids(media_set_rid, media_item_rid)
         service = MediaSetsService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner(
@@ -430,8 +428,7 @@ def thumbnail_calculate(
 ):
     """Initiate thumbnail generation for an image."""
     try:
-        cache_rid(media_set_rid)
-        cache_rid(media_item_rid)
+        cache_rids(media_set_rid, media_item_rid)
         service = MediaSetsService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner(
@@ -486,8 +483,7 @@ def thumbnail_retrieve(
             formatter.print_info("Use --overwrite to replace existing file")
             raise typer.Exit(1)
 
-        cache_rid(media_set_rid)
-        cache_rid(media_item_rid)
+        cache_rids(media_set_rid, media_item_rid)
         service = MediaSetsService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner("Downloading thumbnail..."):
@@ -3,14 +3,15 @@ SQL commands for the pltr CLI.
 Provides commands for executing SQL queries against Foundry datasets.
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 
 from ..services.sql import SqlService
-from ..utils.formatting import OutputFormatter
 from ..utils.progress import SpinnerProgressTracker
 from ..utils.completion import (
     complete_profile,
@@ -18,9 +19,30 @@ from ..utils.completion import (
     complete_sql_query,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..utils.formatting import OutputFormatter
+
 app = typer.Typer(name="sql", help="Execute SQL queries against Foundry datasets")
 
 
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return rich's global console, which the spinners also draw on."""
+    from rich import get_console
+
+    return get_console()
+
+
+@lru_cache(maxsize=1)
+def _formatter() -> OutputFormatter:
+    """Return the output formatter shared by all SQL commands."""
+    from ..utils.formatting import OutputFormatter
+
+    return OutputFormatter(_console())
+
+
 @app.command("execute")
 def execute_query(
     query: str = typer.Argument(
@@ -51,9 +73,6 @@ def execute_query(
     """Execute a SQL query and display results.
 
     Note: SQL queries are currently in preview and may be modified or removed at any time."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         # Parse fallback branches if provided
         fallback_branch_ids = (
@@ -77,17 +96,17 @@ def execute_query(
 
         # Display results
         if output_file:
-            formatter.save_to_file(query_results, output_file, output_format)
-            console.print(f"[green]Results saved to {output_file}[/green]")
+            _formatter().save_to_file(query_results, output_file, output_format)
+            _console().print(f"[green]Results saved to {output_file}[/green]")
         else:
-            formatter.display(query_results, output_format)
+            _formatter().display(query_results, output_format)
 
         # Show query metadata
         if "query_id" in result:
-            console.print(f"\n[dim]Query ID: {result['query_id']}[/dim]")
+            _console().print(f"\n[dim]Query ID: {result['query_id']}[/dim]")
 
     except Exception as e:
-        formatter.print_error(f"Failed to execute query: {e}")
+        _formatter().print_error(f"Failed to execute query: {e}")
         raise typer.Exit(1)
 
 
@@ -109,9 +128,6 @@ def submit_query(
     """Submit a SQL query without waiting for completion.
 
     Note: SQL queries are currently in preview and may be modified or removed at any time."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         # Parse fallback branches if provided
         fallback_branch_ids = (
@@ -126,22 +142,22 @@ def submit_query(
                 query=query, fallback_branch_ids=fallback_branch_ids, preview=preview
             )
 
-        console.print("[green]Query submitted successfully[/green]")
-        console.print(f"Query ID: [bold]{result.get('query_id', 'N/A')}[/bold]")
-        console.print(f"Status: [yellow]{result.get('status', 'unknown')}[/yellow]")
+        _console().print("[green]Query submitted successfully[/green]")
+        _console().print(f"Query ID: [bold]{result.get('query_id', 'N/A')}[/bold]")
+        _console().print(f"Status: [yellow]{result.get('status', 'unknown')}[/yellow]")
 
         if result.get("status") == "succeeded":
-            console.print("[green]Query completed immediately[/green]")
+            _console().print("[green]Query completed immediately[/green]")
         elif result.get("status") == "running":
-            console.print(
+            _console().print(
                 "Use [bold]pltr sql status <query-id>[/bold] to check progress"
             )
-            console.print(
+            _console().print(
                 "Use [bold]pltr sql results <query-id>[/bold] to get results when completed"
             )
 
     except Exception as e:
-        formatter.print_error(f"Failed to submit query: {e}")
+        _formatter().print_error(f"Failed to submit query: {e}")
         raise typer.Exit(1)
 
 
@@ -158,36 +174,35 @@ def get_query_status(
     ),
 ) -> None:
     """Get the status of a submitted query."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         service = SqlService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner("Checking query status..."):
             result = service.get_query_status(query_id, preview=preview)
 
-        console.print(f"Query ID: [bold]{query_id}[/bold]")
+        _console().print(f"Query ID: [bold]{query_id}[/bold]")
 
         status = result.get("status", "unknown")
         if status == "running":
-            console.print(f"Status: [yellow]{status}[/yellow]")
-            console.print("Query is still executing...")
+            _console().print(f"Status: [yellow]{status}[/yellow]")
+            _console().print("Query is still executing...")
         elif status == "succeeded":
-            console.print(f"Status: [green]{status}[/green]")
-            console.print("Use [bold]pltr sql results <query-id>[/bold] to get results")
+            _console().print(f"Status: [green]{status}[/green]")
+            _console().print(
+                "Use [bold]pltr sql results <query-id>[/bold] to get results"
+            )
         elif status == "failed":
-            console.print(f"Status: [red]{status}[/red]")
+            _console().print(f"Status: [red]{status}[/red]")
             error_msg = result.get("error_message", "Unknown error")
-            console.print(f"Error: {error_msg}")
+            _console().print(f"Error: {error_msg}")
         elif status == "canceled":
-            console.print(f"Status: [red]{status}[/red]")
-            console.print("Query was canceled")
+            _console().print(f"Status: [red]{status}[/red]")
+            _console().print("Query was canceled")
         else:
-            console.print(f"Status: [dim]{status}[/dim]")
+            _console().print(f"Status: [dim]{status}[/dim]")
 
     except Exception as e:
-        formatter.print_error(f"Failed to get query status: {e}")
+        _formatter().print_error(f"Failed to get query status: {e}")
         raise typer.Exit(1)
 
 
@@ -210,9 +225,6 @@ def get_query_results(
     ),
 ) -> None:
     """Get the results of a completed query."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         service = SqlService(profile=profile)
 
@@ -225,15 +237,15 @@ def get_query_results(
 
         # Display or save results
         if output_file:
-            formatter.save_to_file(result, output_file, output_format)
-            console.print(f"[green]Results saved to {output_file}[/green]")
+            _formatter().save_to_file(result, output_file, output_format)
+            _console().print(f"[green]Results saved to {output_file}[/green]")
         else:
-            formatter.display(result, output_format)
+            _formatter().display(result, output_format)
 
-        console.print(f"\n[dim]Query ID: {query_id}[/dim]")
+        _console().print(f"\n[dim]Query ID: {query_id}[/dim]")
 
     except Exception as e:
-        formatter.print_error(f"Failed to get query results: {e}")
+        _formatter().print_error(f"Failed to get query results: {e}")
         raise typer.Exit(1)
 
 
@@ -250,27 +262,24 @@ def cancel_query(
     ),
 ) -> None:
     """Cancel a running query."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         service = SqlService(profile=profile)
 
         with SpinnerProgressTracker().track_spinner("Canceling query..."):
             result = service.cancel_query(query_id, preview=preview)
 
-        console.print(f"Query ID: [bold]{query_id}[/bold]")
+        _console().print(f"Query ID: [bold]{query_id}[/bold]")
 
         status = result.get("status", "unknown")
         if status == "canceled":
-            console.print(f"Status: [red]{status}[/red]")
-            console.print("Query has been canceled successfully")
+            _console().print(f"Status: [red]{status}[/red]")
+            _console().print("Query has been canceled successfully")
         else:
-            console.print(f"Status: [yellow]{status}[/yellow]")
-            console.print("Query may have already completed or was not running")
+            _console().print(f"Status: [yellow]{status}[/yellow]")
+            _console().print("Query may have already completed or was not running")
 
     except Exception as e:
-        formatter.print_error(f"Failed to cancel query: {e}")
+        _formatter().print_error(f"Failed to cancel query: {e}")
         raise typer.Exit(1)
 
 
@@ -299,9 +308,6 @@ def export_query_results(
     """Execute a SQL query and export results to a file.
 
     Note: SQL queries are currently in preview and may be modified or removed at any time."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         # Auto-detect format from file extension if not specified
         if output_format is None:
@@ -332,18 +338,18 @@ def export_query_results(
 
         # Save results to file
         query_results = result.get("results", {})
-        formatter.save_to_file(query_results, output_file, output_format)
+        _formatter().save_to_file(query_results, output_file, output_format)
 
-        console.print(
+        _console().print(
             f"[green]Query executed and results saved to {output_file}[/green]"
         )
 
         # Show query metadata
         if "query_id" in result:
-            console.print(f"[dim]Query ID: {result['query_id']}[/dim]")
+            _console().print(f"[dim]Query ID: {result['query_id']}[/dim]")
 
     except Exception as e:
-        formatter.print_error(f"Failed to export query results: {e}")
+        _formatter().print_error(f"Failed to export query results: {e}")
         raise typer.Exit(1)
 
 
@@ -367,9 +373,6 @@ def wait_for_query(
     ),
 ) -> None:
     """Wait for a query to complete and optionally display results."""
-    console = Console()
-    formatter = OutputFormatter()
-
     try:
         service = SqlService(profile=profile)
 
@@ -378,8 +381,8 @@ def wait_for_query(
                 query_id, timeout, preview=preview
             )
 
-        console.print(f"Query ID: [bold]{query_id}[/bold]")
-        console.print(
+        _console().print(f"Query ID: [bold]{query_id}[/bold]")
+        _console().print(
             f"Status: [green]{status_result.get('status', 'completed')}[/green]"
         )
 
@@ -393,13 +396,15 @@ def wait_for_query(
                 )
 
             if output_file:
-                formatter.save_to_file(result, output_file, output_format)
-                console.print(f"[green]Results saved to {output_file}[/green]")
+                _formatter().save_to_file(result, output_file, output_format)
+                _console().print(f"[green]Results saved to {output_file}[/green]")
             else:
-                formatter.display(result, output_format)
+                _formatter().display(result, output_format)
         else:
-            console.print("Use [bold]pltr sql results <query-id>[/bold] to get results")
+            _console().print(
+                "Use [bold]pltr sql results <query-id>[/bold] to get results"
+            )
 
     except Exception as e:
-        formatter.print_error(f"Failed while waiting for query: {e}")
+        _formatter().print_error(f"Failed while waiting for query: {e}")
         raise typer.Exit(1)
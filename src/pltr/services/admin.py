@@ -3,11 +3,11 @@ Admin service wrapper for Foundry SDK admin operations.
 Provides a high-level interface for user, group, role, and organization management.
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, Iterator, List, Optional, Callable
 import json
 
 from .base import BaseService
-from ..utils.pagination import PaginationConfig, PaginationResult
+from ..utils.pagination import PaginationConfig, PaginationMetadata, PaginationResult
 from ..config.settings import Settings
 
 
@@ -63,26 +63,53 @@ class AdminService(BaseService):
             >>> print(f"Fetched {result.metadata.items_fetched} users")
         """
         try:
-            settings = Settings()
-
-            def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
-                """Fetch a single page of users."""
-                iterator = self.service.User.list(
-                    page_size=config.page_size or settings.get("page_size", 20),
-                    page_token=page_token,
-                )
-                # ResourceIterator has .data and .next_page_token attributes
-                # Extract them properly for the pagination handler
-                return {
-                    "data": [self._serialize_response(user) for user in iterator.data],
-                    "next_page_token": iterator.next_page_token,
-                }
-
-            # Use response pagination handler
-            return self._paginate_response(fetch_page, config, progress_callback)
+            return self._paginate_response(
+                self._users_page_fetcher(config), config, progress_callback
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to list users: {str(e)}")
 
+    def iter_users_pages(
+        self, config: PaginationConfig, metadata: PaginationMetadata
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream users page by page without holding all pages in memory.
+
+        Args:
+            config: Pagination configuration (page_size, max_pages, etc.)
+            metadata: Metadata object updated with the final pagination state
+
+        Yields:
+            Lists of serialized users, one list per page
+        """
+        try:
+            yield from self._iter_response_pages(
+                self._users_page_fetcher(config), config, metadata
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to list users: {str(e)}")
+
+    def _users_page_fetcher(
+        self, config: PaginationConfig
+    ) -> Callable[[Optional[str]], Dict[str, Any]]:
+        """Build the page fetch function used by the user listing methods."""
+        settings = Settings()
+
+        def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+            """Fetch a single page of users."""
+            iterator = self.service.User.list(
+                page_size=config.page_size or settings.get("page_size", 20),
+                page_token=page_token,
+            )
+            # ResourceIterator has .data and .next_page_token attributes
+            # Extract them properly for the pagination handler
+            return {
+                "data": [self._serialize_response(user) for user in iterator.data],
+                "next_page_token": iterator.next_page_token,
+            }
+
+        return fetch_page
+
     def get_user(self, user_id: str) -> Dict[str, Any]:
         """
         Get a specific user by ID.
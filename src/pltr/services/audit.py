@@ -4,7 +4,8 @@ Provides access to audit log file operations for compliance and security monitor
 """
 
 from datetime import date
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 from .base import BaseService
 
@@ -103,3 +104,48 @@ class AuditService(BaseService):
             raise RuntimeError(
                 f"Failed to get audit log file content '{log_file_id}': {e}"
             ) from e
+
+    def download_log_file(
+        self,
+        organization_rid: str,
+        log_file_id: str,
+        output_path: Union[str, Path],
+        chunk_size: int = 1 << 20,
+    ) -> int:
+        """
+        Stream the content of an audit log file straight to disk.
+
+        The response is read in chunks, so memory use stays bounded no
+        matter how large the log file is.
+
+        Args:
+            organization_rid: Organization Resource Identifier
+            log_file_id: Log file identifier (from list_log_files)
+            output_path: Destination file path
+            chunk_size: Number of bytes read and written per chunk
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            RuntimeError: If the operation fails
+
+        Example:
+            >>> service = AuditService()
+            >>> size = service.download_log_file(
+            ...     organization_rid="ri.multipass..organization.abc123",
+            ...     log_file_id="2024-01-15",
+            ...     output_path="audit.log",
+            ... )
+        """
+        try:
+            log_file = self.service.Organization.LogFile
+            with log_file.with_streaming_response.content(
+                organization_rid=organization_rid,
+                log_file_id=log_file_id,
+            ) as response:
+                return self._stream_response_to_file(response, output_path, chunk_size)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to download audit log file '{log_file_id}': {e}"
+            ) from e
@@ -2,9 +2,22 @@
 Base service class for Foundry API wrappers.
 """
 
-from typing import Any, Optional, Dict, Callable, Iterator
+from typing import (
+    Any,
+    Optional,
+    Dict,
+    Callable,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+    Union,
+)
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
 import json
+import os
 import requests
 
 from ..auth.manager import AuthManager
@@ -12,12 +25,64 @@ from ..auth.storage import CredentialStorage
 from ..config.profiles import ProfileManager
 from ..utils.pagination import (
     PaginationConfig,
+    PaginationMetadata,
     PaginationResult,
     IteratorPaginationHandler,
     ResponsePaginationHandler,
 )
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by all direct API requests.
+
+    Reusing one session keeps TCP/TLS connections to the Foundry host alive
+    between requests made in the same process.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+ServiceT = TypeVar("ServiceT", bound="BaseService")
+
+
+def get_service(service_cls: Type[ServiceT], profile: Optional[str] = None) -> ServiceT:
+    """
+    Return a service for a profile, reusing it within the process.
+
+    Commands run from the interactive shell share one process, so caching
+    keeps each service's authenticated client and connection pool alive
+    between commands instead of rebuilding them on every invocation. The
+    active profile is resolved before the lookup, so switching profiles
+    never returns a service built for the previous one.
+
+    Args:
+        service_cls: Service class to instantiate
+        profile: Authentication profile name (uses active profile if not specified)
+
+    Returns:
+        Cached service instance
+    """
+    if profile is None:
+        profile = ProfileManager().get_active_profile()
+    return _cached_service(service_cls, profile)
+
+
+@lru_cache(maxsize=16)
+def _cached_service(service_cls: Type[ServiceT], profile: Optional[str]) -> ServiceT:
+    """Build a service instance; memoized by get_service()."""
+    return service_cls(profile=profile)
+
+
+def clear_service_cache() -> None:
+    """Drop all services cached by get_service()."""
+    _cached_service.cache_clear()
+
+
 class BaseService(ABC):
     """Base class for Foundry service wrappers."""
 
@@ -40,13 +105,23 @@ class BaseService(ABC):
         Returns:
             Configured FoundryClient instance
 
+        Raises:
+            ProfileNotFoundError: If profile doesn't exist
+            MissingCredentialsError: If credentials are incomplete
+        """
+        self.authenticate()
+        return self._client
+
+    def authenticate(self) -> None:
+        """
+        Build the authenticated client now rather than on first use.
+
         Raises:
             ProfileNotFoundError: If profile doesn't exist
             MissingCredentialsError: If credentials are incomplete
         """
         if self._client is None:
             self._client = self.auth_manager.get_client(self.profile)
-        return self._client
 
     @abstractmethod
     def _get_service(self) -> Any:
@@ -121,8 +196,8 @@ class BaseService(ABC):
         if headers:
             request_headers.update(headers)
 
-        # Make the request
-        response = requests.request(
+        # Make the request over the pooled session
+        response = _http_session().request(
             method=method,
             url=url,
             data=data,
@@ -186,6 +261,68 @@ class BaseService(ABC):
         handler = ResponsePaginationHandler()
         return handler.collect_pages(fetch_fn, config, progress_callback)
 
+    def _iter_response_pages(
+        self,
+        fetch_fn: Callable[[Optional[str]], Dict[str, Any]],
+        config: PaginationConfig,
+        metadata: PaginationMetadata,
+    ) -> Iterator[List[Any]]:
+        """
+        Stream pages for response-based SDK methods without buffering them.
+
+        Args:
+            fetch_fn: Function that accepts page_token and returns dict with
+                     'data' and 'next_page_token' keys
+            config: Pagination configuration
+            metadata: Metadata object updated with the final pagination state
+
+        Yields:
+            The items of each fetched page
+        """
+        handler = ResponsePaginationHandler()
+        return handler.iter_pages(fetch_fn, config, metadata)
+
+    @staticmethod
+    def _stream_response_to_file(
+        response: Any, path: Union[str, Path], chunk_size: int
+    ) -> int:
+        """
+        Write a streaming SDK response to a file chunk by chunk.
+
+        Args:
+            response: Response object from a ``with_streaming_response`` call
+            path: Destination file path
+            chunk_size: Number of bytes read and written per chunk
+
+        Returns:
+            Number of bytes written
+
+        Any existing file at path is only replaced once the whole response
+        has been written.
+        """
+        written = 0
+        # Stream into a temporary file next to the destination and move it
+        # into place at the end, so a failed download neither leaves a
+        # truncated file nor clobbers an existing one
+        tmp_file = f"{path}.{os.getpid()}"
+        try:
+            # Chunks are already large, so write them straight to the file
+            # descriptor rather than copying them through a buffer
+            with open(tmp_file, "wb", buffering=0) as f:
+                for chunk in response.iter_bytes(chunk_size=chunk_size):
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[f.write(view) :]
+                    written += len(chunk)
+            os.replace(tmp_file, path)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        return written
+
     def _serialize_response(self, response: Any) -> Dict[str, Any]:
         """
         Convert response object to serializable dictionary.
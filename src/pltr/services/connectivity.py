@@ -201,16 +201,15 @@ class ConnectivityService(BaseService):
 
         file_path_obj = Path(file_path)
 
-        if not file_path_obj.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         if not file_path_obj.suffix.lower() == ".jar":
             raise ValueError(f"File must be a JAR file: {file_path}")
 
         try:
-            with open(file_path_obj, "rb") as f:
-                file_content = f.read()
+            file_content = file_path_obj.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
+        try:
             connection = self.connections_service.Connection.upload_custom_jdbc_drivers(
                 connection_rid=connection_rid,
                 body=file_content,
@@ -2,12 +2,12 @@
 Dataset service wrapper for Foundry SDK.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from pathlib import Path
 import csv
 
 from ..config.settings import Settings
-from ..utils.pagination import PaginationConfig, PaginationResult
+from ..utils.pagination import PaginationConfig, PaginationMetadata, PaginationResult
 from .base import BaseService
 
 
@@ -372,14 +372,14 @@ class DatasetService(BaseService):
             Upload result information
         """
         file_path = Path(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
+        # The SDK validates the body as bytes, so the file cannot be passed
+        # as a stream; read it once and take the size from the content
         try:
-            # Read file content as bytes
-            with open(file_path, "rb") as f:
-                file_content = f.read()
+            file_content = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
+        try:
             # Use the correct method signature with body parameter
             result = self.service.Dataset.File.upload(
                 dataset_rid=dataset_rid,
@@ -393,7 +393,7 @@ class DatasetService(BaseService):
                 "dataset_rid": dataset_rid,
                 "file_path": str(file_path),
                 "branch": branch,
-                "size_bytes": file_path.stat().st_size,
+                "size_bytes": len(file_content),
                 "uploaded": True,
                 "transaction_rid": getattr(result, "transaction_rid", transaction_rid),
             }
@@ -492,15 +492,20 @@ class DatasetService(BaseService):
         file_path: str,
         output_path: Union[str, Path],
         branch: str = "master",
+        chunk_size: int = 1 << 20,
     ) -> Dict[str, Any]:
         """
         Download a file from a dataset.
 
+        The response is streamed to disk in chunks, so memory use stays
+        bounded no matter how large the file is.
+
         Args:
             dataset_rid: Dataset Resource Identifier
             file_path: Path of file within dataset
             output_path: Local path to save the downloaded file
             branch: Dataset branch name
+            chunk_size: Number of bytes read and written per chunk
 
         Returns:
             Download result information
@@ -511,22 +516,19 @@ class DatasetService(BaseService):
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Use Dataset.File.content() which returns bytes directly
-            # Note: In SDK v1.27.0, the method is 'content' not 'read'
-            file_content = self.service.Dataset.File.content(
+            with self.service.Dataset.File.with_streaming_response.content(
                 dataset_rid=dataset_rid, file_path=file_path, branch_name=branch
-            )
-
-            # Write file content to disk (file_content is bytes)
-            with open(output_path, "wb") as f:
-                f.write(file_content)
+            ) as response:
+                written = self._stream_response_to_file(
+                    response, output_path, chunk_size
+                )
 
             return {
                 "dataset_rid": dataset_rid,
                 "file_path": file_path,
                 "output_path": str(output_path),
                 "branch": branch,
-                "size_bytes": output_path.stat().st_size,
+                "size_bytes": written,
                 "downloaded": True,
             }
         except Exception as e:
@@ -554,15 +556,7 @@ class DatasetService(BaseService):
                 dataset_rid=dataset_rid, branch_name=branch
             )
 
-            return [
-                {
-                    "path": file.path,
-                    "size_bytes": getattr(file, "size_bytes", None),
-                    "last_modified": getattr(file, "last_modified", None),
-                    "transaction_rid": getattr(file, "transaction_rid", None),
-                }
-                for file in files
-            ]
+            return [self._format_file_info(file) for file in files]
         except Exception as e:
             raise RuntimeError(f"Failed to list files in dataset {dataset_rid}: {e}")
 
@@ -599,20 +593,61 @@ class DatasetService(BaseService):
             result = self._paginate_iterator(iterator, config, progress_callback)
 
             # Format file information
-            result.data = [
-                {
-                    "path": file.path,
-                    "size_bytes": getattr(file, "size_bytes", None),
-                    "last_modified": getattr(file, "last_modified", None),
-                    "transaction_rid": getattr(file, "transaction_rid", None),
-                }
-                for file in result.data
-            ]
+            result.data = [self._format_file_info(file) for file in result.data]
 
             return result
         except Exception as e:
             raise RuntimeError(f"Failed to list files: {e}")
 
+    def iter_files_pages(
+        self,
+        dataset_rid: str,
+        branch: str,
+        config: PaginationConfig,
+        metadata: PaginationMetadata,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream dataset files page by page without holding all pages in memory.
+
+        Args:
+            dataset_rid: Dataset Resource Identifier
+            branch: Dataset branch name
+            config: Pagination configuration
+            metadata: Metadata object updated with the final pagination state
+
+        Yields:
+            Lists of file information dictionaries, one list per page
+        """
+        settings = Settings()
+
+        def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+            """Fetch a single page of files."""
+            iterator = self.service.Dataset.File.list(
+                dataset_rid=dataset_rid,
+                branch_name=branch,
+                page_size=config.page_size or settings.get("page_size", 20),
+                page_token=page_token,
+            )
+            return {
+                "data": [self._format_file_info(file) for file in iterator.data],
+                "next_page_token": iterator.next_page_token,
+            }
+
+        try:
+            yield from self._iter_response_pages(fetch_page, config, metadata)
+        except Exception as e:
+            raise RuntimeError(f"Failed to list files: {e}")
+
+    @staticmethod
+    def _format_file_info(file: Any) -> Dict[str, Any]:
+        """Convert an SDK file object to the dictionary used for output."""
+        return {
+            "path": file.path,
+            "size_bytes": getattr(file, "size_bytes", None),
+            "last_modified": getattr(file, "last_modified", None),
+            "transaction_rid": getattr(file, "transaction_rid", None),
+        }
+
     def get_branches(self, dataset_rid: str) -> List[Dict[str, Any]]:
         """
         Get list of branches for a dataset.
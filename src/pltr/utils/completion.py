@@ -1,7 +1,8 @@
 """Shell completion utilities for pltr CLI."""
 
 import os
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from pathlib import Path
 import json
 
@@ -9,18 +10,42 @@ from pltr.config.profiles import ProfileManager
 from pltr.config.aliases import AliasManager
 
 
+def _rid_cache_file() -> Path:
+    """Return the path of the recently used RIDs cache."""
+    return Path.home() / ".cache" / "pltr" / "recent_rids.json"
+
+
+@lru_cache(maxsize=4)
+def _read_rid_cache(path: str, mtime_ns: int, size: int) -> Optional[Tuple[str, ...]]:
+    """
+    Parse the RID cache file.
+
+    Keyed on the file's mtime and size as well as its path, so repeated
+    lookups in one process (several cache_rid calls, or completing more
+    than one argument) parse the file once, and any rewrite is picked up.
+    """
+    try:
+        with open(path) as f:
+            return tuple(json.load(f).get("rids", []))
+    except Exception:
+        return None
+
+
+def _load_cached_rids(rid_cache_file: Path) -> Optional[List[str]]:
+    """Return the cached RIDs, or None if there is no readable cache file."""
+    try:
+        st = rid_cache_file.stat()
+    except OSError:
+        return None
+    cached = _read_rid_cache(str(rid_cache_file), st.st_mtime_ns, st.st_size)
+    return None if cached is None else list(cached)
+
+
 def get_cached_rids() -> List[str]:
     """Get recently used RIDs from cache."""
-    cache_dir = Path.home() / ".cache" / "pltr"
-    rid_cache_file = cache_dir / "recent_rids.json"
-
-    if rid_cache_file.exists():
-        try:
-            with open(rid_cache_file) as f:
-                data = json.load(f)
-                return data.get("rids", [])
-        except Exception:
-            pass
+    cached = _load_cached_rids(_rid_cache_file())
+    if cached is not None:
+        return cached
 
     # Return some example RIDs if no cache
     return [
@@ -32,29 +57,36 @@ def get_cached_rids() -> List[str]:
 
 def cache_rid(rid: str):
     """Cache a RID for future completions."""
-    cache_dir = Path.home() / ".cache" / "pltr"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    rid_cache_file = cache_dir / "recent_rids.json"
+    cache_rids(rid)
+
+
+def cache_rids(*rids: str):
+    """
+    Cache several RIDs for future completions with a single cache write.
+
+    The cache file is only rewritten if at least one RID is new, and the
+    write goes through a temporary file and os.replace so a concurrent
+    reader never sees a partial file.
+    """
+    rid_cache_file = _rid_cache_file()
+    cache_dir = rid_cache_file.parent
 
     # Load existing cache
-    rids = []
-    if rid_cache_file.exists():
-        try:
-            with open(rid_cache_file) as f:
-                data = json.load(f)
-                rids = data.get("rids", [])
-        except Exception:
-            pass
-
-    # Add new RID (keep last 50)
-    if rid not in rids:
-        rids.insert(0, rid)
-        rids = rids[:50]
+    cached = _load_cached_rids(rid_cache_file) or []
+
+    # Add new RIDs (keep last 50)
+    new_rids = [rid for rid in dict.fromkeys(rids) if rid and rid not in cached]
+    if not new_rids:
+        return
+    cached = (new_rids[::-1] + cached)[:50]
 
     # Save cache
     try:
-        with open(rid_cache_file, "w") as f:
-            json.dump({"rids": rids}, f)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = rid_cache_file.with_name(f"{rid_cache_file.name}.{os.getpid()}")
+        with open(tmp_file, "w") as f:
+            json.dump({"rids": cached}, f)
+        os.replace(tmp_file, rid_cache_file)
     except Exception:
         pass
 
@@ -0,0 +1,47 @@
+"""
+Helpers for commands that issue several independent API requests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+# Cap on concurrent requests issued by a single command. The SDK client
+# already retries failed calls with exponential backoff, so this only
+# bounds how hard one command hits the server.
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def run_each(
+    ids: List[str],
+    fn: Callable[[str], Any],
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    reraise: Tuple[Type[BaseException], ...] = (),
+) -> Dict[str, str]:
+    """
+    Apply a single-ID service call to every ID concurrently.
+
+    Failures do not stop the remaining calls; they are collected instead.
+
+    Args:
+        ids: IDs to process
+        fn: Service method taking one ID
+        concurrency: Maximum number of requests in flight
+        reraise: Exception types raised to the caller instead of collected,
+            e.g. authentication errors that would fail every call alike
+
+    Returns:
+        Mapping of failed IDs to their error messages
+    """
+
+    def call(item_id: str) -> Optional[str]:
+        try:
+            fn(item_id)
+        except reraise:
+            raise
+        except Exception as e:
+            return str(e)
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(ids))) as executor:
+        errors = executor.map(call, ids)
+        return {i: e for i, e in zip(ids, errors) if e is not None}
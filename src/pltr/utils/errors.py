@@ -0,0 +1,55 @@
+"""Shared error handling for pltr CLI commands."""
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+import click
+import typer
+
+from ..auth.base import MissingCredentialsError, ProfileNotFoundError
+
+if TYPE_CHECKING:
+    from .formatting import OutputFormatter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def handle_cli_errors(
+    failure_message: str,
+    formatter: Callable[[], "OutputFormatter"],
+    invalid_request_message: Optional[str] = "Invalid request",
+) -> Callable[[F], F]:
+    """
+    Report command errors through the formatter and exit with status 1.
+
+    Authentication errors and ValueErrors get their own prefixes; any other
+    exception is reported as ``"{failure_message}: {error}"``. Click
+    exceptions (``typer.Exit``, ``typer.BadParameter``, ...) pass through
+    untouched so Typer can handle them.
+
+    Args:
+        failure_message: Prefix for unexpected errors, e.g. "Failed to get agent"
+        formatter: Zero-argument callable returning the command's formatter
+        invalid_request_message: Prefix for ValueErrors; None reports them
+            with failure_message like any other error
+    """
+    value_error_message = invalid_request_message or failure_message
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except (click.exceptions.Exit, click.ClickException, click.Abort):
+                raise
+            except (ProfileNotFoundError, MissingCredentialsError) as e:
+                formatter().print_error(f"Authentication error: {e}")
+            except ValueError as e:
+                formatter().print_error(f"{value_error_message}: {e}")
+            except Exception as e:
+                formatter().print_error(f"{failure_message}: {e}")
+            raise typer.Exit(1)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
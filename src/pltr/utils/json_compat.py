@@ -0,0 +1,115 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install pltr-cli[fast]``); without it
+these fall back to the standard library and produce the same text.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+catching the stdlib exception.
+"""
+
+import json
+import math
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from str or bytes.
+
+    Args:
+        data: JSON text; bytes are parsed without decoding to str first
+            when orjson is available
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any) -> Optional[bytes]:
+    """Encode with orjson, or return None if it is missing or cannot encode obj."""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(
+            obj,
+            default=str,
+            # Hand datetimes and dataclasses to default=str, as the stdlib
+            # encoder does, instead of orjson's own encoding of them
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    except orjson.JSONEncodeError:
+        # e.g. integers wider than 64 bits, which the stdlib encoder handles
+        return None
+
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN and infinities with None, which orjson writes as null."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_encoder() -> json.JSONEncoder:
+    """Return a stdlib encoder whose output matches _orjson_dumps()."""
+    return json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a value as JSON indented by two spaces.
+
+    Values JSON cannot represent (datetimes included) are converted with
+    str(), NaN and infinities become null, and non-ASCII text is emitted
+    as-is. The output is the same with or without orjson.
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        JSON text
+    """
+    encoded = _orjson_dumps(obj)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return _stdlib_encoder().encode(_finite(obj))
+
+
+def dump_to_file(obj: Any, path: str, buffering: int = -1) -> None:
+    """
+    Write a value to a file as JSON, formatted as by dumps().
+
+    With orjson the encoded bytes are written in one call. Otherwise the
+    stdlib encoder's chunks are streamed to the file so the document is
+    never built as one string.
+
+    Args:
+        obj: Value to serialize
+        path: Output file path
+        buffering: Buffer size passed to open()
+    """
+    encoded = _orjson_dumps(obj)
+    if encoded is not None:
+        with open(path, "wb", buffering=buffering) as f:
+            f.write(encoded)
+        return
+
+    with open(path, "w", encoding="utf-8", buffering=buffering) as f:
+        f.writelines(_stdlib_encoder().iterencode(_finite(obj)))
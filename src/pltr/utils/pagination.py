@@ -5,8 +5,12 @@ This module provides a unified interface for pagination across different
 SDK patterns used by the Foundry platform.
 """
 
+import queue
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -146,6 +150,36 @@ class ResponsePaginationHandler:
             >>> result = handler.collect_pages(fetch, config)
         """
         all_items: List[Any] = []
+        metadata = PaginationMetadata()
+        for page_data in self.iter_pages(fetch_fn, config, metadata, progress_callback):
+            all_items.extend(page_data)
+        return PaginationResult(data=all_items, metadata=metadata)
+
+    def iter_pages(
+        self,
+        fetch_fn: Callable[[Optional[str]], Dict[str, Any]],
+        config: PaginationConfig,
+        metadata: PaginationMetadata,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[List[Any]]:
+        """
+        Yield pages one at a time as they are fetched.
+
+        Unlike collect_pages, items are never accumulated, so callers can
+        write each page out before the next one is requested. The supplied
+        metadata object is updated in place once iteration finishes.
+
+        Args:
+            fetch_fn: Function that accepts a page_token and returns a dict
+                     with 'data' and 'next_page_token' keys
+            config: Pagination configuration
+            metadata: Metadata object to fill in with the final state
+            progress_callback: Optional callback(page_num, items_count)
+
+        Yields:
+            The items of each fetched page
+        """
+        items_fetched = 0
         page_num = 0
         current_token = config.page_token
         max_pages = config.effective_max_pages()
@@ -154,66 +188,74 @@ class ResponsePaginationHandler:
             try:
                 # Fetch the current page
                 response = fetch_fn(current_token)
-                page_data = response.get("data", [])
-                next_token = response.get("next_page_token")
-
-                # Add items from this page
-                all_items.extend(page_data)
-                page_num += 1
+            except Exception as e:
+                # Error occurred while fetching - stop with partial results
+                # Include the error information in metadata for user awareness
+                if not items_fetched:
+                    # No data fetched yet - re-raise the error
+                    raise
 
-                # Update progress
-                if progress_callback:
-                    progress_callback(page_num, len(all_items))
+                import sys
 
-                # Check if we should continue
-                has_more = next_token is not None
-                should_stop = (
-                    not has_more  # No more pages
-                    or (
-                        max_pages is not None and page_num >= max_pages
-                    )  # Reached max pages
+                print(
+                    f"\nWarning: Error fetching page {page_num + 1}: {e}",
+                    file=sys.stderr,
                 )
+                print(
+                    f"Returning partial results ({items_fetched} items from {page_num} pages)",
+                    file=sys.stderr,
+                )
+                self._update_metadata(
+                    metadata,
+                    page_num,
+                    items_fetched,
+                    current_token,  # Token for retry
+                    True,  # Assume more pages exist
+                )
+                return
 
-                if should_stop:
-                    metadata = PaginationMetadata(
-                        current_page=page_num,
-                        items_fetched=len(all_items),
-                        next_page_token=next_token,
-                        has_more=has_more,
-                        total_pages_fetched=page_num,
-                    )
-                    return PaginationResult(data=all_items, metadata=metadata)
+            page_data = response.get("data", [])
+            next_token = response.get("next_page_token")
 
-                # Continue to next page
-                current_token = next_token
+            items_fetched += len(page_data)
+            page_num += 1
 
-            except Exception as e:
-                # Error occurred while fetching - return partial results
-                # Include the error information in metadata for user awareness
-                if all_items:
-                    # We have partial results - return what we got so far
-                    import sys
-
-                    print(
-                        f"\nWarning: Error fetching page {page_num + 1}: {e}",
-                        file=sys.stderr,
-                    )
-                    print(
-                        f"Returning partial results ({len(all_items)} items from {page_num} pages)",
-                        file=sys.stderr,
-                    )
-
-                    metadata = PaginationMetadata(
-                        current_page=page_num,
-                        items_fetched=len(all_items),
-                        next_page_token=current_token,  # Token for retry
-                        has_more=True,  # Assume more pages exist
-                        total_pages_fetched=page_num,
-                    )
-                    return PaginationResult(data=all_items, metadata=metadata)
-                else:
-                    # No data fetched yet - re-raise the error
-                    raise
+            # Update progress
+            if progress_callback:
+                progress_callback(page_num, items_fetched)
+
+            yield page_data
+
+            # Check if we should continue
+            has_more = next_token is not None
+            should_stop = (
+                not has_more  # No more pages
+                or (max_pages is not None and page_num >= max_pages)  # Reached max
+            )
+
+            if should_stop:
+                self._update_metadata(
+                    metadata, page_num, items_fetched, next_token, has_more
+                )
+                return
+
+            # Continue to next page
+            current_token = next_token
+
+    @staticmethod
+    def _update_metadata(
+        metadata: PaginationMetadata,
+        page_num: int,
+        items_fetched: int,
+        next_token: Optional[str],
+        has_more: bool,
+    ) -> None:
+        """Record the final pagination state on a metadata object."""
+        metadata.current_page = page_num
+        metadata.items_fetched = items_fetched
+        metadata.next_page_token = next_token
+        metadata.has_more = has_more
+        metadata.total_pages_fetched = page_num
 
 
 class IteratorPaginationHandler:
@@ -323,3 +365,54 @@ class IteratorPaginationHandler:
         )
 
         return PaginationResult(data=all_items, metadata=metadata)
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """
+    Iterate in a background thread, keeping up to `depth` items ready.
+
+    Token-based pagination cannot fetch pages in parallel because each
+    request needs the previous page's token, but the next page can be
+    requested while the caller is still processing the current one.
+
+    Args:
+        iterable: Source of items (e.g. a page generator)
+        depth: Maximum number of items fetched ahead of the consumer
+
+    Yields:
+        Items from the iterable, in order. Exceptions raised by the
+        iterable are re-raised in the consuming thread.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
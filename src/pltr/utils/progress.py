@@ -2,10 +2,12 @@
 Progress bar utilities for long-running operations.
 """
 
-from typing import Optional, Iterator, Any, Union
+import os
+from typing import Callable, ContextManager, Optional, Iterator, Any, Union
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
+from rich import get_console
 from rich.progress import (
     Progress,
     TextColumn,
@@ -16,8 +18,23 @@ from rich.progress import (
     TotalFileSizeColumn,
     TransferSpeedColumn,
     SpinnerColumn,
+    TaskID,
 )
 
+# Redraws per second for spinners. A spinner only animates, so redrawing at
+# rich's default of 10/s just has the refresh thread compete for the GIL with
+# the request it is waiting on; frames are time-based, so the spin speed is
+# unchanged.
+SPINNER_REFRESH_PER_SECOND = 4
+
+# Set to any non-empty value to turn spinners off even on a terminal
+NO_SPINNER_ENV_VAR = "PLTR_NO_SPINNER"
+
+
+def _spinner_enabled() -> bool:
+    """Return whether spinners should be drawn at all."""
+    return get_console().is_terminal and not os.environ.get(NO_SPINNER_ENV_VAR)
+
 
 class FileProgressTracker:
     """Progress tracker for file operations."""
@@ -169,31 +186,65 @@ class SpinnerProgressTracker:
     def __init__(self):
         """Initialize spinner tracker."""
         self._progress: Optional[Progress] = None
+        self._task_id: Optional[TaskID] = None
 
     @contextmanager
-    def track_spinner(self, description: str) -> Iterator[None]:
+    def track_spinner(
+        self, description: Union[str, Callable[[], str]]
+    ) -> Iterator[None]:
         """
         Context manager for showing a spinner during operations.
 
+        The spinner is transient, so when output is not a terminal nothing
+        would be rendered; in that case, or when PLTR_NO_SPINNER is set, no
+        progress display is started and a callable description is never
+        evaluated.
+
         Args:
-            description: Description of the operation
+            description: Description of the operation, or a callable
+                returning it
 
         Yields:
             None (operation runs in context)
         """
+        if not _spinner_enabled():
+            yield
+            return
+
+        if callable(description):
+            description = description()
+
         columns = [
             SpinnerColumn(),
             TextColumn("[bold cyan]{task.description}"),
         ]
 
-        with Progress(*columns, transient=True) as progress:
+        with Progress(
+            *columns,
+            transient=True,
+            refresh_per_second=SPINNER_REFRESH_PER_SECOND,
+        ) as progress:
             self._progress = progress
-            progress.add_task(description)
+            self._task_id = progress.add_task(description)
 
             try:
                 yield
             finally:
                 self._progress = None
+                self._task_id = None
+
+    def update(self, description: str) -> None:
+        """
+        Change the description of the running spinner.
+
+        Does nothing outside track_spinner or when no spinner is drawn, so a
+        loop can reuse one spinner instead of starting one per item.
+
+        Args:
+            description: New description of the operation
+        """
+        if self._progress is not None and self._task_id is not None:
+            self._progress.update(self._task_id, description=description)
 
 
 def create_file_chunks(
@@ -300,6 +351,27 @@ def with_spinner(description: str = "Working...") -> SpinnerProgressTracker:
     return SpinnerProgressTracker()
 
 
+def spinner(
+    description: Union[str, Callable[[], str]],
+) -> ContextManager[None]:
+    """
+    Show a spinner while the block runs, if output is a terminal.
+
+    When output is redirected nothing can be drawn, so a no-op context is
+    returned without creating a tracker at all. Setting PLTR_NO_SPINNER does
+    the same on a terminal.
+
+    Args:
+        description: Description of the operation, or a callable returning it
+
+    Returns:
+        Context manager wrapping the operation
+    """
+    if not _spinner_enabled():
+        return nullcontext()
+    return SpinnerProgressTracker().track_spinner(description)
+
+
 # Example usage patterns
 """
 # File upload with progress
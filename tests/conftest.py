@@ -8,9 +8,23 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 from typing import Generator
 
+from pltr.auth.manager import AuthManager
 from pltr.auth.storage import CredentialStorage
 from pltr.config.settings import Settings
 from pltr.config.profiles import ProfileManager
+from pltr.services.base import clear_service_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_service_cache():
+    """Drop services, clients and credentials cached by earlier tests."""
+    clear_service_cache()
+    AuthManager.clear_cache()
+    CredentialStorage.clear_cache()
+    yield
+    clear_service_cache()
+    AuthManager.clear_cache()
+    CredentialStorage.clear_cache()
 
 
 @pytest.fixture
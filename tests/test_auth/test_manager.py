@@ -67,6 +67,35 @@ class TestAuthManager:
             # Verify client was returned
             assert result == mock_client
 
+    @patch("pltr.auth.manager.CredentialStorage")
+    @patch("pltr.auth.manager.ProfileManager")
+    def test_get_client_shared_per_credentials(
+        self, mock_profile_class, mock_storage_class
+    ):
+        """Test one client is built per set of credentials."""
+        mock_storage = Mock()
+        mock_storage_class.return_value = mock_storage
+        credentials = {
+            "auth_type": "token",
+            "host": "https://test.palantirfoundry.com",
+            "token": "test_token",
+        }
+        mock_storage.get_profile.side_effect = lambda profile: dict(credentials)
+
+        with patch("pltr.auth.manager.TokenAuthProvider") as mock_token_provider_class:
+            mock_token_provider_class.return_value.get_client.side_effect = lambda: (
+                Mock()
+            )
+
+            first = AuthManager().get_client("test_profile")
+            second = AuthManager().get_client("test_profile")
+            credentials["token"] = "rotated_token"
+            third = AuthManager().get_client("test_profile")
+
+        assert first is second
+        assert third is not first
+        assert mock_token_provider_class.call_count == 2
+
     @patch("pltr.auth.manager.CredentialStorage")
     @patch("pltr.auth.manager.ProfileManager")
     def test_get_client_with_default_profile(
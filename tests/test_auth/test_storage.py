@@ -157,3 +157,24 @@ class TestCredentialStorage:
         # Verify both exist
         assert storage.profile_exists("profile1") is True
         assert storage.profile_exists("profile2") is True
+
+    def test_get_profile_reads_keyring_once(self, mock_keyring):
+        """Test repeated lookups are served from the in-process cache."""
+        storage = CredentialStorage()
+        credentials = {"auth_type": "token", "token": "token1"}
+        storage.save_profile("cached", credentials)
+
+        assert storage.get_profile("cached") == credentials
+        assert CredentialStorage().get_profile("cached") == credentials
+
+        assert mock_keyring["get"].call_count == 1
+
+    def test_save_profile_refreshes_cache(self, mock_keyring):
+        """Test saving new credentials replaces the cached ones."""
+        storage = CredentialStorage()
+        storage.save_profile("cached", {"token": "old"})
+        assert storage.get_profile("cached") == {"token": "old"}
+
+        storage.save_profile("cached", {"token": "new"})
+
+        assert storage.get_profile("cached") == {"token": "new"}
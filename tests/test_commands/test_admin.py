@@ -38,7 +38,7 @@ class TestAdminCommands:
         )
         mock_service.list_users_paginated.return_value = pagination_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "list", "--format", "json"])
@@ -63,7 +63,7 @@ class TestAdminCommands:
         )
         mock_service.list_users_paginated.return_value = pagination_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -86,7 +86,7 @@ class TestAdminCommands:
         }
         mock_service.get_user.return_value = user_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "get", user_id])
@@ -105,7 +105,7 @@ class TestAdminCommands:
         }
         mock_service.get_current_user.return_value = user_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "current", "--format", "table"])
@@ -124,7 +124,7 @@ class TestAdminCommands:
         }
         mock_service.search_users.return_value = search_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "search", query])
@@ -145,7 +145,7 @@ class TestAdminCommands:
         }
         mock_service.get_user_markings.return_value = markings_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "markings", user_id])
@@ -164,7 +164,7 @@ class TestAdminCommands:
         }
         mock_service.revoke_user_tokens.return_value = revoke_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "revoke-tokens", user_id, "--confirm"])
@@ -186,7 +186,7 @@ class TestAdminCommands:
         }
         mock_service.list_groups.return_value = group_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "list"])
@@ -208,7 +208,7 @@ class TestAdminCommands:
         }
         mock_service.get_group.return_value = group_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "get", group_id])
@@ -227,7 +227,7 @@ class TestAdminCommands:
         }
         mock_service.search_groups.return_value = search_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "search", query, "--page-size", "5"])
@@ -251,7 +251,7 @@ class TestAdminCommands:
         }
         mock_service.create_group.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -280,7 +280,7 @@ class TestAdminCommands:
         create_result = {"id": "simple_group_id", "name": group_name}
         mock_service.create_group.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "create", group_name])
@@ -301,7 +301,7 @@ class TestAdminCommands:
         }
         mock_service.delete_group.return_value = delete_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "delete", group_id, "--confirm"])
@@ -322,7 +322,7 @@ class TestAdminCommands:
         }
         mock_service.get_role.return_value = role_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["role", "get", role_id])
@@ -343,7 +343,7 @@ class TestAdminCommands:
         }
         mock_service.get_organization.return_value = org_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["org", "get", org_id])
@@ -358,14 +358,14 @@ class TestAdminCommands:
         # Setup
         mock_service.list_users.side_effect = RuntimeError("API Error")
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "list"])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
 
     def test_user_get_command_error(self, runner, mock_service):
         """Test user get command error handling."""
@@ -373,14 +373,14 @@ class TestAdminCommands:
         user_id = "user123"
         mock_service.get_user.side_effect = RuntimeError("User not found")
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "get", user_id])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
 
     def test_group_create_command_error(self, runner, mock_service):
         """Test group create command error handling."""
@@ -388,14 +388,14 @@ class TestAdminCommands:
         group_name = "Bad Group"
         mock_service.create_group.side_effect = RuntimeError("Validation error")
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "create", group_name])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
 
     # Profile Parameter Tests
     def test_user_list_with_profile(self, runner, mock_service):
@@ -409,7 +409,7 @@ class TestAdminCommands:
         )
         mock_service.list_users_paginated.return_value = pagination_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "list", "--profile", profile_name])
@@ -426,7 +426,7 @@ class TestAdminCommands:
         group_result = {"id": group_id, "name": "Test Group"}
         mock_service.get_group.return_value = group_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -450,8 +450,8 @@ class TestAdminCommands:
         mock_service.list_users_paginated.return_value = pagination_result
 
         with (
-            patch("pltr.commands.admin.AdminService") as mock_service_class,
-            patch("pltr.commands.admin.OutputFormatter") as mock_formatter,
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+            patch("pltr.commands.admin._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
             mock_formatter_instance = Mock()
@@ -463,6 +463,64 @@ class TestAdminCommands:
         assert result.exit_code == 0
         mock_formatter_instance.format_paginated_output.assert_called_once()
 
+    def test_user_list_streams_to_output_file(self, runner, mock_service):
+        """Test user list writes pages straight to the output file."""
+        # Setup
+        import json
+
+        def iter_users_pages(config, metadata):
+            yield [{"id": "user1", "username": "john"}]
+            yield [{"id": "user2", "username": "jane"}]
+            metadata.current_page = 2
+            metadata.items_fetched = 2
+            metadata.total_pages_fetched = 2
+
+        mock_service.iter_users_pages.side_effect = iter_users_pages
+
+        with (
+            runner.isolated_filesystem(),
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+        ):
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app,
+                ["user", "list", "--all", "--format", "json", "--output", "users.json"],
+            )
+            with open("users.json") as f:
+                written = json.load(f)
+
+        # Assert
+        assert result.exit_code == 0
+        mock_service.list_users_paginated.assert_not_called()
+        assert [user["id"] for user in written["data"]] == ["user1", "user2"]
+        assert written["pagination"]["items_count"] == 2
+
+    def test_user_list_stream_failure_leaves_no_file(self, runner, mock_service):
+        """Test a failed page fetch does not leave a truncated output file."""
+        import os
+
+        def iter_users_pages(config, metadata):
+            yield [{"id": "user1", "username": "john"}]
+            raise RuntimeError("Failed to list users: boom")
+
+        mock_service.iter_users_pages.side_effect = iter_users_pages
+
+        with (
+            runner.isolated_filesystem(),
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+        ):
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app,
+                ["user", "list", "--all", "--format", "json", "--output", "users.json"],
+            )
+            leftovers = os.listdir(".")
+
+        assert result.exit_code == 1
+        assert leftovers == []
+
     def test_group_create_csv_format(self, runner, mock_service):
         """Test group create command with CSV format."""
         # Setup
@@ -471,8 +529,8 @@ class TestAdminCommands:
         mock_service.create_group.return_value = create_result
 
         with (
-            patch("pltr.commands.admin.AdminService") as mock_service_class,
-            patch("pltr.commands.admin.OutputFormatter") as mock_formatter,
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+            patch("pltr.commands.admin._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
             mock_formatter_instance = Mock()
@@ -497,7 +555,7 @@ class TestAdminCommands:
         }
         mock_service.delete_user.return_value = delete_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "delete", user_id, "--confirm"])
@@ -506,20 +564,44 @@ class TestAdminCommands:
         assert result.exit_code == 0
         mock_service.delete_user.assert_called_once_with(user_id)
 
+    def test_user_delete_command_no_stdin_requires_confirm(self, runner, mock_service):
+        """Test a prompt with nothing on stdin fails with a --confirm hint."""
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(app, ["user", "delete", "user123"])
+
+        # Assert
+        assert result.exit_code == 1
+        assert "--confirm is required" in result.stderr
+        mock_service.delete_user.assert_not_called()
+
+    def test_user_delete_command_declined(self, runner, mock_service):
+        """Test answering no on stdin cancels without an error."""
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(app, ["user", "delete", "user123"], input="n\n")
+
+        # Assert
+        assert result.exit_code == 0
+        assert "Operation cancelled." in result.stdout
+        mock_service.delete_user.assert_not_called()
+
     def test_user_delete_command_error(self, runner, mock_service):
         """Test user delete command error handling."""
         # Setup
         user_id = "user123"
         mock_service.delete_user.side_effect = RuntimeError("User not found")
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "delete", user_id, "--confirm"])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
 
     def test_user_batch_get_command_success(self, runner, mock_service):
         """Test successful user batch get command."""
@@ -532,7 +614,7 @@ class TestAdminCommands:
         }
         mock_service.get_batch_users.return_value = batch_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "batch-get", "user1", "user2"])
@@ -548,14 +630,214 @@ class TestAdminCommands:
             "Maximum batch size is 500 users"
         )
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["user", "batch-get", "user1"])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
+
+    def test_user_batch_get_command_splits_large_batches(self, runner, mock_service):
+        """Test user batch get splits more than 500 IDs into concurrent batches."""
+        # Setup
+        user_ids = [f"user{i}" for i in range(501)]
+        mock_service.get_batch_users.side_effect = lambda ids: {
+            "data": {user_id: {"id": user_id} for user_id in ids}
+        }
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app, ["user", "batch-get", *user_ids, "--format", "json"]
+            )
+
+        # Assert
+        assert result.exit_code == 0
+        assert mock_service.get_batch_users.call_count == 2
+        batch_sizes = sorted(
+            len(call.args[0]) for call in mock_service.get_batch_users.call_args_list
+        )
+        assert batch_sizes == [1, 500]
+        assert '"user500"' in result.stdout
+
+    def test_user_batch_get_command_dedupes_ids(self, runner, mock_service):
+        """Test user batch get drops blank and duplicate IDs before fetching."""
+        # Setup
+        mock_service.get_batch_users.return_value = {"data": {}}
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app, ["user", "batch-get", "user1", " user2 ", "user1", ""]
+            )
+
+        # Assert
+        assert result.exit_code == 0
+        mock_service.get_batch_users.assert_called_once_with(["user1", "user2"])
+
+    def test_user_batch_get_command_blank_ids(self, runner):
+        """Test user batch get fails before building the service for blank IDs."""
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            result = runner.invoke(app, ["user", "batch-get", " ", ""])
+
+        # Assert
+        assert result.exit_code == 1
+        assert "No user IDs provided" in result.stderr
+        mock_service_class.assert_not_called()
+
+    def test_user_batch_get_command_ids_file(self, runner, mock_service):
+        """Test user batch get reads IDs from --ids-file alongside arguments."""
+        # Setup
+        mock_service.get_batch_users.return_value = {"data": {}}
+
+        with (
+            runner.isolated_filesystem(),
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+        ):
+            mock_service_class.return_value = mock_service
+            with open("ids.txt", "w") as f:
+                f.write("user2\n\nuser3\nuser1\n")
+
+            result = runner.invoke(
+                app, ["user", "batch-get", "user1", "--ids-file", "ids.txt"]
+            )
+
+        # Assert
+        assert result.exit_code == 0
+        mock_service.get_batch_users.assert_called_once_with(
+            ["user1", "user2", "user3"]
+        )
+
+    def test_user_batch_get_command_missing_ids_file(self, runner):
+        """Test user batch get reports an unreadable --ids-file."""
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            result = runner.invoke(
+                app, ["user", "batch-get", "--ids-file", "does-not-exist.txt"]
+            )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "Error:" in result.stderr
+        mock_service_class.assert_not_called()
+
+    def test_user_batch_delete_command_single_prompt(self, runner, mock_service):
+        """Test user batch delete prompts once and deletes every user."""
+        # Setup
+        mock_service.delete_user.return_value = {"success": True}
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app, ["user", "batch-delete", "user1", "user2", "user3"], input="y\n"
+            )
+
+        # Assert
+        assert result.exit_code == 0
+        assert result.stdout.count("Are you sure") == 1
+        assert "Deleted 3 of 3 users" in result.stdout
+        deleted = sorted(
+            call.args[0] for call in mock_service.delete_user.call_args_list
+        )
+        assert deleted == ["user1", "user2", "user3"]
+
+    def test_group_batch_delete_command_partial_failure(self, runner, mock_service):
+        """Test group batch delete reports failed IDs and exits with an error."""
+
+        # Setup
+        def delete_group(group_id):
+            if group_id == "group2":
+                raise RuntimeError("Group not found")
+            return {"success": True}
+
+        mock_service.delete_group.side_effect = delete_group
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(
+                app, ["group", "batch-delete", "group1", "group2", "--confirm"]
+            )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "Deleted 1 of 2 groups" in result.stdout
+        assert "group2: Group not found" in result.stderr
+
+    def test_explicit_profile_skips_active_profile_lookup(self, runner, mock_service):
+        """Test --profile on a subcommand never reads the active profile."""
+        mock_service.get_user.return_value = {"id": "user1"}
+
+        with (
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+            patch(
+                "pltr.config.profiles.ProfileManager.get_active_profile"
+            ) as mock_active,
+        ):
+            mock_service_class.return_value = mock_service
+
+            result = runner.invoke(app, ["user", "get", "user1", "--profile", "dev"])
+
+        # Assert
+        assert result.exit_code == 0
+        mock_service_class.assert_called_once_with(profile="dev")
+        mock_active.assert_not_called()
+
+    def test_active_profile_resolved_before_cache_lookup(self, runner, mock_service):
+        """Test switching the active profile does not reuse the old service."""
+        mock_service.get_user.return_value = {"id": "user1"}
+
+        with (
+            patch("pltr.services.admin.AdminService") as mock_service_class,
+            patch(
+                "pltr.config.profiles.ProfileManager.get_active_profile",
+                side_effect=["dev", "prod"],
+            ),
+        ):
+            mock_service_class.return_value = mock_service
+
+            runner.invoke(app, ["user", "get", "user1"])
+            runner.invoke(app, ["user", "get", "user1"])
+
+        # Assert
+        assert [c.kwargs["profile"] for c in mock_service_class.call_args_list] == [
+            "dev",
+            "prod",
+        ]
+
+    def test_authentication_error_reported(self, runner):
+        """Test missing credentials are reported as an authentication error."""
+        from pltr.auth.base import ProfileNotFoundError
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.side_effect = ProfileNotFoundError(
+                "Profile 'missing' not found"
+            )
+
+            result = runner.invoke(app, ["user", "get", "user1"])
+
+        # Assert
+        assert result.exit_code == 1
+        assert "Authentication error: Profile 'missing' not found" in result.stderr
+
+    def test_admin_service_reused_across_commands(self, runner, mock_service):
+        """Test the service is built once per profile within a process."""
+        mock_service.get_user.return_value = {"id": "user1"}
+
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
+            mock_service_class.return_value = mock_service
+
+            runner.invoke(app, ["user", "get", "user1", "--profile", "dev"])
+            runner.invoke(app, ["user", "get", "user2", "--profile", "dev"])
+            runner.invoke(app, ["user", "get", "user3", "--profile", "prod"])
+
+        # Assert
+        assert mock_service_class.call_count == 2
+        assert mock_service.get_user.call_count == 3
 
     # New Group Commands Tests
     def test_group_batch_get_command_success(self, runner, mock_service):
@@ -569,7 +851,7 @@ class TestAdminCommands:
         }
         mock_service.get_batch_groups.return_value = batch_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["group", "batch-get", "group1", "group2"])
@@ -591,7 +873,7 @@ class TestAdminCommands:
         }
         mock_service.list_markings.return_value = marking_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["marking", "list"])
@@ -608,7 +890,7 @@ class TestAdminCommands:
         marking_result = {"data": [], "nextPageToken": "next123"}
         mock_service.list_markings.return_value = marking_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -632,7 +914,7 @@ class TestAdminCommands:
         }
         mock_service.get_marking.return_value = marking_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["marking", "get", marking_id])
@@ -652,7 +934,7 @@ class TestAdminCommands:
         }
         mock_service.get_batch_markings.return_value = batch_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -675,7 +957,7 @@ class TestAdminCommands:
         }
         mock_service.create_marking.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -696,7 +978,7 @@ class TestAdminCommands:
         create_result = {"id": "simple_marking_id", "name": marking_name}
         mock_service.create_marking.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["marking", "create", marking_name])
@@ -718,7 +1000,7 @@ class TestAdminCommands:
         }
         mock_service.replace_marking.return_value = replace_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -736,14 +1018,14 @@ class TestAdminCommands:
         # Setup
         mock_service.create_marking.side_effect = RuntimeError("Permission denied")
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["marking", "create", "Test Marking"])
 
         # Assert
         assert result.exit_code == 1
-        assert "Error:" in result.stdout
+        assert "Error:" in result.stderr
 
     # New Organization Commands Tests
     def test_org_create_command_success(self, runner, mock_service):
@@ -757,7 +1039,7 @@ class TestAdminCommands:
         }
         mock_service.create_organization.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -782,7 +1064,7 @@ class TestAdminCommands:
         }
         mock_service.create_organization.return_value = create_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -815,7 +1097,7 @@ class TestAdminCommands:
         }
         mock_service.replace_organization.return_value = replace_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(
@@ -841,7 +1123,7 @@ class TestAdminCommands:
         }
         mock_service.list_available_roles.return_value = roles_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["org", "available-roles", org_rid])
@@ -862,7 +1144,7 @@ class TestAdminCommands:
         }
         mock_service.get_batch_roles.return_value = batch_result
 
-        with patch("pltr.commands.admin.AdminService") as mock_service_class:
+        with patch("pltr.services.admin.AdminService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(app, ["role", "batch-get", "role1", "role2"])
@@ -22,7 +22,7 @@ class TestAuditCommands:
     @pytest.fixture
     def mock_service(self):
         """Create mock AuditService."""
-        with patch("pltr.commands.audit.AuditService") as MockService:
+        with patch("pltr.services.audit.AuditService") as MockService:
             mock_svc = Mock()
             MockService.return_value = mock_svc
             yield mock_svc
@@ -158,6 +158,19 @@ class TestAuditCommands:
         # Check output (combined stdout/stderr in CliRunner)
         assert "Invalid date format" in result.output or result.exit_code == 2
 
+    @pytest.mark.parametrize(
+        "value", ["2024-1-5", "20240115", "2024-W03-1", "2024-02-30", "2024/01/15"]
+    )
+    def test_parse_date_rejects_non_yyyy_mm_dd(self, value) -> None:
+        """Test only calendar dates in YYYY-MM-DD form are accepted."""
+        import typer
+
+        from pltr.commands.audit import parse_date
+
+        assert parse_date("2024-01-15") == date(2024, 1, 15)
+        with pytest.raises(typer.BadParameter, match="Invalid date format"):
+            parse_date(value)
+
     def test_list_command_error(self, runner, mock_service) -> None:
         """Test list command with service error."""
         # Setup
@@ -207,7 +220,7 @@ class TestAuditCommands:
     def test_get_command_with_file_output(self, runner, mock_service, tmp_path) -> None:
         """Test get command with file output."""
         # Setup
-        mock_service.get_log_file_content.return_value = b"binary content here"
+        mock_service.download_log_file.return_value = 19
         output_file = tmp_path / "audit.log"
 
         result = runner.invoke(
@@ -224,8 +237,14 @@ class TestAuditCommands:
 
         # Assert
         assert result.exit_code == 0
-        assert output_file.read_bytes() == b"binary content here"
+        mock_service.download_log_file.assert_called_once_with(
+            organization_rid="ri.multipass..organization.abc123",
+            log_file_id="2024-01-15",
+            output_path=str(output_file),
+        )
+        mock_service.get_log_file_content.assert_not_called()
         assert "saved to" in result.stdout
+        assert "(19" in result.stdout
 
     def test_get_command_binary_content_no_output(self, runner, mock_service) -> None:
         """Test get command with binary content but no output file."""
@@ -246,6 +265,49 @@ class TestAuditCommands:
         assert result.exit_code == 1
         assert "binary content" in result.stdout.lower()
 
+    def test_get_command_gzip_content_not_decoded(self, runner, mock_service) -> None:
+        """Test compressed content is rejected from its magic bytes alone."""
+        mock_service.get_log_file_content.return_value = b"\x1f\x8bplain ascii"
+
+        with patch("pltr.commands.audit._print_text") as mock_print_text:
+            result = runner.invoke(
+                app,
+                ["audit", "get", "ri.multipass..organization.abc123", "2024-01-15"],
+            )
+
+        assert result.exit_code == 1
+        assert "binary content" in result.stdout.lower()
+        mock_print_text.assert_not_called()
+
+    def test_get_command_invalid_byte_mid_file_prints_nothing(
+        self, runner, mock_service
+    ) -> None:
+        """Test a bad byte after valid text gives the error without partial output."""
+        valid = b"2024-01-15 event\n" * 10000
+        mock_service.get_log_file_content.return_value = valid + b"\xff" + valid
+
+        result = runner.invoke(
+            app,
+            ["audit", "get", "ri.multipass..organization.abc123", "2024-01-15"],
+        )
+
+        assert result.exit_code == 1
+        assert "binary content" in result.stdout.lower()
+        assert "event" not in result.stdout
+
+    def test_get_command_decodes_across_chunks(self, runner, mock_service) -> None:
+        """Test multi-byte characters split across display chunks survive."""
+        text = "é€" * 40000
+        mock_service.get_log_file_content.return_value = text.encode("utf-8")
+
+        result = runner.invoke(
+            app,
+            ["audit", "get", "ri.multipass..organization.abc123", "2024-01-15"],
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == text + "\n"
+
     def test_get_command_with_profile(self, runner, mock_service) -> None:
         """Test get command with custom profile."""
         # Setup
@@ -318,7 +380,8 @@ class TestAuditCommands:
         mock_service.list_log_files.return_value = logs_result
         output_file = tmp_path / "audit_logs.json"
 
-        with patch("pltr.commands.audit.formatter") as mock_formatter:
+        with patch("pltr.commands.audit._formatter") as mock_get_formatter:
+            mock_formatter = mock_get_formatter.return_value
             result = runner.invoke(
                 app,
                 [
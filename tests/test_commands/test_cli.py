@@ -0,0 +1,71 @@
+"""
+Tests for the top-level CLI app.
+"""
+
+import subprocess
+import sys
+
+import click
+from typer.main import get_command
+from typer.testing import CliRunner
+
+from pltr.cli import LAZY_COMMANDS, LAZY_PLAIN_COMMANDS, app
+
+
+def test_every_lazy_command_loads():
+    """Test each lazy entry resolves to a command with its registered help."""
+    group = get_command(app)
+    ctx = click.Context(group)
+
+    for name, (_, _, help_text) in LAZY_COMMANDS.items():
+        command = group.get_command(ctx, name)
+        assert command is not None, name
+        assert command.name == name
+        assert command.help == help_text
+
+    assert set(LAZY_COMMANDS) <= set(group.list_commands(ctx))
+
+
+def test_subcommand_help_imports_only_its_module():
+    """Test running one sub-app does not import the other command modules."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from pltr.cli import app\n"
+        "result = CliRunner().invoke(app, ['audit', 'list', '--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('pltr.commands.'))\n"
+        "print(','.join(loaded))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert output.split(",") == ["pltr.commands.audit"]
+
+
+def test_top_level_help_lists_all_commands():
+    """Test --help still shows every command."""
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_COMMANDS:
+        assert name in result.stdout
+
+
+def test_command_order_matches_eager_registration():
+    """Test --help order is the one Typer gave the eagerly registered app."""
+    group = get_command(app)
+    ctx = click.Context(group)
+    expected = ["cp", "hello"] + [
+        name for name in LAZY_COMMANDS if name not in LAZY_PLAIN_COMMANDS
+    ]
+
+    assert group.list_commands(ctx) == expected
+    assert expected[2:5] == ["configure", "verify", "dataset"]
+    assert expected[-1] == "alias"
+
+    # Loading a command must not move it
+    group.get_command(ctx, "alias")
+    group.get_command(ctx, "cp")
+    assert group.list_commands(ctx) == expected
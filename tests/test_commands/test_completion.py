@@ -1,5 +1,6 @@
 """Tests for completion commands."""
 
+import json
 import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,7 @@ from pltr.commands import completion
 from pltr.utils.completion import (
     get_cached_rids,
     cache_rid,
+    cache_rids,
     complete_rid,
     complete_profile,
     complete_output_format,
@@ -151,6 +153,39 @@ class TestCompletionFunctions:
                 rids = get_cached_rids()
                 assert test_rid in rids
 
+    def test_cache_rids_single_write(self):
+        """Test several RIDs are cached newest-first with one write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, "home", return_value=Path(tmpdir)):
+                cache_rid("ri.a")
+                with patch("pltr.utils.completion.os.replace") as mock_replace:
+                    cache_rids("ri.a")
+                mock_replace.assert_not_called()
+
+                with patch(
+                    "pltr.utils.completion.os.replace", wraps=os.replace
+                ) as mock_replace:
+                    cache_rids("ri.b", "ri.c", "ri.b", "")
+                mock_replace.assert_called_once()
+
+                assert get_cached_rids() == ["ri.c", "ri.b", "ri.a"]
+
+    def test_cached_rids_parsed_once_until_rewritten(self):
+        """Test repeated lookups reuse the parsed cache until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, "home", return_value=Path(tmpdir)):
+                cache_rid("ri.a")
+                with patch(
+                    "pltr.utils.completion.json.load", wraps=json.load
+                ) as mock_load:
+                    get_cached_rids()
+                    cache_rid("ri.a")
+                    assert complete_rid("ri.") == ["ri.a"]
+                    assert mock_load.call_count == 1
+
+                    cache_rid("ri.b")
+                    assert get_cached_rids() == ["ri.b", "ri.a"]
+
     def test_complete_rid(self):
         """Test RID completion."""
         with patch("pltr.utils.completion.get_cached_rids") as mock_get:
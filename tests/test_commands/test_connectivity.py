@@ -2,10 +2,14 @@
 Tests for connectivity commands.
 """
 
+from pathlib import Path
 from unittest.mock import Mock, patch
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
-from pltr.commands.connectivity import app
+from pltr.commands.connectivity import _load_json_param, app
 from pltr.auth.base import ProfileNotFoundError
 
 
@@ -16,7 +20,7 @@ class TestConnectivityCommands:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_connections_success(self, mock_service_class):
         """Test successful connection listing command."""
         mock_service = Mock()
@@ -35,7 +39,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.list_connections.assert_called_once()
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_connections_empty(self, mock_service_class):
         """Test connection listing with no results."""
         mock_service = Mock()
@@ -47,7 +51,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         assert "No connections found" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_connections_with_profile(self, mock_service_class):
         """Test connection listing with specific profile."""
         mock_service = Mock()
@@ -59,7 +63,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service_class.assert_called_once_with(profile="test")
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_connections_auth_error(self, mock_service_class):
         """Test connection listing with authentication error."""
         mock_service = Mock()
@@ -73,7 +77,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Authentication error" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_connections_general_error(self, mock_service_class):
         """Test connection listing with general error."""
         mock_service = Mock()
@@ -83,9 +87,22 @@ class TestConnectivityCommands:
         result = self.runner.invoke(app, ["connection", "list"])
 
         assert result.exit_code == 1
-        assert "Error listing connections" in result.stdout
+        assert "❌ Error listing connections: API Error" in result.stdout
+
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_list_connections_value_error_keeps_action(self, mock_service_class):
+        """Test a ValueError is still reported under the failing action."""
+        mock_service = Mock()
+        mock_service_class.return_value = mock_service
+        mock_service.list_connections.side_effect = ValueError("bad page size")
+
+        result = self.runner.invoke(app, ["connection", "list"])
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+        assert result.exit_code == 1
+        assert "❌ Error listing connections: bad page size" in result.stdout
+        assert "Invalid request" not in result.stdout
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_connection_success(self, mock_service_class):
         """Test successful connection get command."""
         mock_service = Mock()
@@ -106,7 +123,7 @@ class TestConnectivityCommands:
             "ri.conn.main.connection.123"
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_connection_error(self, mock_service_class):
         """Test connection get with error."""
         mock_service = Mock()
@@ -118,9 +135,9 @@ class TestConnectivityCommands:
         )
 
         assert result.exit_code == 1
-        assert "Error getting connection" in result.stdout
+        assert "❌ Error getting connection: Connection not found" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_file_success(self, mock_service_class):
         """Test successful file import command."""
         mock_service = Mock()
@@ -150,7 +167,35 @@ class TestConnectivityCommands:
             import_config=None,
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.commands.connectivity.cache_rids")
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_import_file_caches_rids_once(self, mock_service_class, mock_cache_rids):
+        """Test the input RIDs and the new import RID are cached together."""
+        mock_service = Mock()
+        mock_service_class.return_value = mock_service
+        mock_service.create_file_import.return_value = {
+            "rid": "ri.import.main.file.123"
+        }
+
+        result = self.runner.invoke(
+            app,
+            [
+                "import",
+                "file",
+                "ri.conn.main.connection.123",
+                "/path/to/file.csv",
+                "ri.foundry.main.dataset.456",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_cache_rids.assert_called_once_with(
+            "ri.conn.main.connection.123",
+            "ri.foundry.main.dataset.456",
+            "ri.import.main.file.123",
+        )
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_file_with_config(self, mock_service_class):
         """Test file import command with configuration."""
         mock_service = Mock()
@@ -184,7 +229,7 @@ class TestConnectivityCommands:
             import_config=expected_config,
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_file_with_execution(self, mock_service_class):
         """Test file import command with immediate execution."""
         mock_service = Mock()
@@ -218,7 +263,34 @@ class TestConnectivityCommands:
         )
         assert "File import executed" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_import_file_with_execution_uses_one_spinner(self, mock_service_class):
+        """Test create and execute share one spinner that is relabelled."""
+        mock_service = mock_service_class.return_value
+        mock_service.create_file_import.return_value = {
+            "rid": "ri.import.main.file.123"
+        }
+        mock_service.execute_file_import.return_value = {"status": "RUNNING"}
+
+        with patch("pltr.utils.progress.SpinnerProgressTracker") as mock_tracker:
+            result = self.runner.invoke(
+                app,
+                [
+                    "import",
+                    "file",
+                    "ri.conn.main.connection.123",
+                    "/path/to/file.csv",
+                    "ri.foundry.main.dataset.456",
+                    "--execute",
+                ],
+            )
+
+        assert result.exit_code == 0
+        tracker = mock_tracker.return_value
+        tracker.track_spinner.assert_called_once_with("Creating file import...")
+        tracker.update.assert_called_once_with("Executing file import...")
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_file_invalid_config(self, mock_service_class):
         """Test file import command with invalid JSON configuration."""
         mock_service = Mock()
@@ -238,9 +310,36 @@ class TestConnectivityCommands:
         )
 
         assert result.exit_code == 1
-        assert "Invalid JSON configuration" in result.stdout
+        assert "Invalid JSON for config" in result.stdout
+
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_import_file_with_config_file(self, mock_service_class, tmp_path):
+        """Test file import command reading configuration from a file."""
+        mock_service = Mock()
+        mock_service_class.return_value = mock_service
+        mock_service.create_file_import.return_value = {"rid": "ri.import.main.file.1"}
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"format": "CSV"}')
+
+        result = self.runner.invoke(
+            app,
+            [
+                "import",
+                "file",
+                "ri.conn.main.connection.123",
+                "/path/to/file.csv",
+                "ri.foundry.main.dataset.456",
+                "--config-file",
+                str(config_file),
+            ],
+        )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+        assert result.exit_code == 0
+        assert mock_service.create_file_import.call_args.kwargs["import_config"] == {
+            "format": "CSV"
+        }
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_table_success(self, mock_service_class):
         """Test successful table import command."""
         mock_service = Mock()
@@ -270,7 +369,7 @@ class TestConnectivityCommands:
             import_config=None,
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_table_with_execution(self, mock_service_class):
         """Test table import command with immediate execution."""
         mock_service = Mock()
@@ -304,7 +403,7 @@ class TestConnectivityCommands:
         )
         assert "Table import executed" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_file_imports_success(self, mock_service_class):
         """Test successful file imports listing command."""
         mock_service = Mock()
@@ -322,7 +421,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.list_file_imports.assert_called_once_with(connection_rid=None)
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_file_imports_filtered(self, mock_service_class):
         """Test file imports listing with connection filter."""
         mock_service = Mock()
@@ -338,7 +437,7 @@ class TestConnectivityCommands:
             connection_rid="ri.conn.main.connection.123"
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_file_imports_empty(self, mock_service_class):
         """Test file imports listing with no results."""
         mock_service = Mock()
@@ -350,7 +449,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         assert "No file imports found" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_list_table_imports_success(self, mock_service_class):
         """Test successful table imports listing command."""
         mock_service = Mock()
@@ -368,7 +467,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.list_table_imports.assert_called_once_with(connection_rid=None)
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_file_import_success(self, mock_service_class):
         """Test successful file import get command."""
         mock_service = Mock()
@@ -386,7 +485,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.get_file_import.assert_called_once_with("ri.import.main.file.123")
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_table_import_success(self, mock_service_class):
         """Test successful table import get command."""
         mock_service = Mock()
@@ -406,7 +505,7 @@ class TestConnectivityCommands:
             "ri.import.main.table.123"
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_file_execution_missing_rid(self, mock_service_class):
         """Test file import execution when RID is missing."""
         mock_service = Mock()
@@ -435,7 +534,7 @@ class TestConnectivityCommands:
         mock_service.execute_file_import.assert_not_called()
         assert "Warning: Could not execute" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_import_error_handling(self, mock_service_class):
         """Test import command error handling."""
         mock_service = Mock()
@@ -456,7 +555,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Error creating file import" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_create_connection_success(self, mock_service_class):
         """Test successful connection creation command."""
         mock_service = Mock()
@@ -489,7 +588,7 @@ class TestConnectivityCommands:
             worker={"type": "direct"},
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_create_connection_with_config_file(self, mock_service_class, tmp_path):
         """Test connection creation with config files."""
         mock_service = Mock()
@@ -522,7 +621,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.create_connection.assert_called_once()
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_create_connection_invalid_json(self, mock_service_class):
         """Test connection creation with invalid JSON."""
         result = self.runner.invoke(
@@ -540,7 +639,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Invalid JSON" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_create_connection_error(self, mock_service_class):
         """Test connection creation error handling."""
         mock_service = Mock()
@@ -562,7 +661,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Error creating connection" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_connection_configuration_success(self, mock_service_class):
         """Test successful connection configuration retrieval command."""
         mock_service = Mock()
@@ -582,7 +681,7 @@ class TestConnectivityCommands:
             "ri.conn.main.connection.123"
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_get_connection_configuration_error(self, mock_service_class):
         """Test connection configuration retrieval error handling."""
         mock_service = Mock()
@@ -597,7 +696,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Error getting connection configuration" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_connection_secrets_success(self, mock_service_class, tmp_path):
         """Test successful connection secrets update command."""
         mock_service = Mock()
@@ -629,7 +728,7 @@ class TestConnectivityCommands:
             {"password": "newpass"},
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_connection_secrets_file_not_found(self, mock_service_class):
         """Test secrets update with non-existent file."""
         result = self.runner.invoke(
@@ -646,7 +745,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Secrets file not found" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_connection_secrets_invalid_json(self, mock_service_class, tmp_path):
         """Test secrets update with invalid JSON."""
         secrets_file = tmp_path / "secrets.json"
@@ -666,7 +765,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Invalid JSON" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_export_settings_success(self, mock_service_class):
         """Test successful export settings update command."""
         mock_service = Mock()
@@ -693,7 +792,7 @@ class TestConnectivityCommands:
             {"exportsEnabled": True},
         )
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_export_settings_with_file(self, mock_service_class, tmp_path):
         """Test export settings update with file."""
         mock_service = Mock()
@@ -720,7 +819,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         mock_service.update_export_settings.assert_called_once()
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_update_export_settings_error(self, mock_service_class):
         """Test export settings update error handling."""
         mock_service = Mock()
@@ -740,7 +839,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "Error updating export settings" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_upload_jdbc_drivers_success(self, mock_service_class, tmp_path):
         """Test successful JDBC driver upload command."""
         mock_service = Mock()
@@ -768,7 +867,7 @@ class TestConnectivityCommands:
         assert "Uploaded" in result.stdout
         mock_service.upload_custom_jdbc_drivers.assert_called_once()
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_upload_jdbc_drivers_file_not_found(self, mock_service_class):
         """Test JDBC driver upload with non-existent file."""
         result = self.runner.invoke(
@@ -784,7 +883,7 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "File not found" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_upload_jdbc_drivers_invalid_extension(self, mock_service_class, tmp_path):
         """Test JDBC driver upload with non-JAR file."""
         txt_file = tmp_path / "file.txt"
@@ -803,7 +902,30 @@ class TestConnectivityCommands:
         assert result.exit_code == 1
         assert "must be a JAR file" in result.stdout
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_upload_jdbc_drivers_empty_file(self, mock_service_class, tmp_path):
+        """Test empty JAR files are rejected before any upload starts."""
+        jar_file = tmp_path / "driver.jar"
+        jar_file.write_bytes(b"fake jar content")
+        empty_file = tmp_path / "empty.jar"
+        empty_file.touch()
+
+        result = self.runner.invoke(
+            app,
+            [
+                "connection",
+                "upload-jdbc-drivers",
+                "ri.conn.main.connection.123",
+                str(jar_file),
+                str(empty_file),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "File is empty" in result.stdout
+        mock_service_class.return_value.upload_custom_jdbc_drivers.assert_not_called()
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_upload_jdbc_drivers_multiple_files(self, mock_service_class, tmp_path):
         """Test JDBC driver upload with multiple files."""
         mock_service = Mock()
@@ -833,7 +955,44 @@ class TestConnectivityCommands:
         assert result.exit_code == 0
         assert mock_service.upload_custom_jdbc_drivers.call_count == 2
 
-    @patch("pltr.commands.connectivity.ConnectivityService")
+    @patch("pltr.services.connectivity.ConnectivityService")
+    def test_upload_jdbc_drivers_parallel_keeps_order(
+        self, mock_service_class, tmp_path
+    ):
+        """Test concurrent uploads report results in the order given."""
+        mock_service = Mock()
+        mock_service_class.return_value = mock_service
+        mock_service.upload_custom_jdbc_drivers.side_effect = lambda rid, path: {
+            "rid": rid,
+            "display_name": Path(path).name,
+        }
+        jar_files = []
+        for i in range(5):
+            jar_file = tmp_path / f"driver{i}.jar"
+            jar_file.write_bytes(b"fake jar content")
+            jar_files.append(str(jar_file))
+
+        result = self.runner.invoke(
+            app,
+            [
+                "connection",
+                "upload-jdbc-drivers",
+                "ri.conn.main.connection.123",
+                *jar_files,
+                "--parallel",
+                "3",
+                "--format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert mock_service.upload_custom_jdbc_drivers.call_count == 5
+        names = [f"driver{i}.jar" for i in range(5)]
+        positions = [result.stdout.index(f'"display_name": "{n}"') for n in names]
+        assert positions == sorted(positions)
+
+    @patch("pltr.services.connectivity.ConnectivityService")
     def test_upload_jdbc_drivers_error(self, mock_service_class, tmp_path):
         """Test JDBC driver upload error handling."""
         mock_service = Mock()
@@ -855,3 +1014,38 @@ class TestConnectivityCommands:
 
         assert result.exit_code == 1
         assert "Error uploading JDBC drivers" in result.stdout
+
+
+class TestLoadJsonParam:
+    """Test cases for _load_json_param."""
+
+    def test_inline_json(self):
+        """Test an inline JSON string is parsed."""
+        assert _load_json_param('{"a": 1}', None, "configuration") == {"a": 1}
+
+    def test_json_file(self, tmp_path):
+        """Test a JSON file is parsed."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"a": 1}')
+
+        assert _load_json_param(None, str(config_file), "configuration") == {"a": 1}
+
+    def test_optional_without_sources(self):
+        """Test an optional parameter with no source loads as None."""
+        assert _load_json_param(None, None, "config", required=False) is None
+
+    @pytest.mark.parametrize(
+        "json_str, file_path, message",
+        [
+            ('{"a": 1}', "config.json", "Cannot specify both"),
+            (None, None, "Must specify either"),
+            ("", "", "Must specify either"),
+        ],
+    )
+    def test_requires_exactly_one_source(self, json_str, file_path, message):
+        """Test giving both sources or neither is rejected."""
+        with patch("pltr.commands.connectivity._print_error") as mock_print_error:
+            with pytest.raises(typer.Exit):
+                _load_json_param(json_str, file_path, "configuration")
+
+        assert message in mock_print_error.call_args[0][0]
@@ -18,7 +18,7 @@ class TestDataHealthCommands:
     @pytest.fixture
     def mock_service(self):
         """Create mock DataHealthService."""
-        with patch("pltr.commands.data_health.DataHealthService") as MockService:
+        with patch("pltr.services.data_health.DataHealthService") as MockService:
             mock_svc = Mock()
             MockService.return_value = mock_svc
             yield mock_svc
@@ -57,6 +57,19 @@ class TestDataHealthCommands:
             preview=False,
         )
 
+    def test_service_reused_across_commands(self, runner):
+        """Test commands for the same profile share one service instance."""
+        with patch("pltr.services.data_health.DataHealthService") as MockService:
+            MockService.return_value.get_check.return_value = {"rid": "ri.x"}
+            for _ in range(2):
+                result = runner.invoke(
+                    app,
+                    ["data-health", "check", "get", "ri.x", "--profile", "prod"],
+                )
+                assert result.exit_code == 0
+
+        MockService.assert_called_once_with(profile="prod")
+
     def test_check_get_with_preview(self, runner, mock_service):
         """Test check retrieval with preview mode."""
         # Setup
@@ -103,6 +116,18 @@ class TestDataHealthCommands:
         assert result.exit_code == 1
         assert "Error" in result.output
 
+    def test_check_get_value_error_keeps_action(self, runner, mock_service):
+        """Test a ValueError is reported under the command's failure message."""
+        mock_service.get_check.side_effect = ValueError("bad check RID")
+
+        result = runner.invoke(
+            app, ["data-health", "check", "get", "ri.data-health.main.check.x"]
+        )
+
+        assert result.exit_code == 1
+        assert "Error getting check: bad check RID" in result.output
+        assert "Invalid request" not in result.output
+
     # ===== Check Create Tests =====
 
     def test_check_create_success(self, runner, mock_service):
@@ -147,6 +172,22 @@ class TestDataHealthCommands:
         )
         assert "Created check" in result.output
 
+    def test_check_create_from_file(self, runner, mock_service, tmp_path):
+        """Test check creation with a config read from an @file."""
+        config = {"type": "buildStatus", "intent": "Überwachung"}
+        config_file = tmp_path / "check.json"
+        config_file.write_text(json.dumps(config, ensure_ascii=False), "utf-8")
+        mock_service.create_check.return_value = {"rid": "ri.x"}
+
+        result = runner.invoke(
+            app, ["data-health", "check", "create", f"@{config_file}"]
+        )
+
+        assert result.exit_code == 0
+        mock_service.create_check.assert_called_once_with(
+            config=config, intent=None, preview=False
+        )
+
     def test_check_create_invalid_json(self, runner, mock_service):
         """Test check creation with invalid JSON."""
         # Execute
@@ -313,6 +354,27 @@ class TestDataHealthCommands:
         assert result.exit_code == 1
         assert "Error" in result.output
 
+    def test_check_delete_multiple(self, runner, mock_service):
+        """Test several checks are deleted and failures do not stop the rest."""
+        rids = [f"ri.data-health.main.check.{i}" for i in range(3)]
+
+        def delete_check(check_rid, preview):
+            if check_rid == rids[1]:
+                raise Exception("Permission denied")
+
+        mock_service.delete_check.side_effect = delete_check
+
+        result = runner.invoke(
+            app, ["data-health", "check", "delete", *rids, rids[0]], input="y\n"
+        )
+
+        assert result.exit_code == 1
+        assert "delete 3 checks?" in result.output
+        assert mock_service.delete_check.call_count == 3
+        assert f"Deleted check: {rids[0]}" in result.output
+        assert f"Error deleting {rids[1]}: Permission denied" in result.output
+        assert f"Deleted check: {rids[2]}" in result.output
+
     # ===== Report Get Tests =====
 
     def test_report_get_success(self, runner, mock_service):
@@ -2,6 +2,7 @@
 Tests for dataset CLI commands.
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from typer.testing import CliRunner
@@ -15,7 +16,7 @@ runner = CliRunner()
 @pytest.fixture
 def mock_dataset_service():
     """Mock DatasetService for command tests."""
-    with patch("pltr.commands.dataset.DatasetService") as mock_service_class:
+    with patch("pltr.services.dataset.DatasetService") as mock_service_class:
         mock_service = Mock()
         mock_service_class.return_value = mock_service
         yield mock_service
@@ -117,6 +118,17 @@ def test_get_dataset_error(mock_dataset_service):
     assert "Failed to get dataset" in result.stdout
 
 
+def test_get_dataset_value_error_keeps_action(mock_dataset_service):
+    """Test a ValueError is reported under the command's failure message."""
+    mock_dataset_service.get_dataset.side_effect = ValueError("bad dataset RID")
+
+    result = runner.invoke(app, ["get", "ri.foundry.main.dataset.test"])
+
+    assert result.exit_code == 1
+    assert "Failed to get dataset: bad dataset RID" in result.stdout
+    assert "Invalid request" not in result.stdout
+
+
 # Tests for 'create' command
 def test_create_dataset_success(mock_dataset_service, sample_dataset):
     """Test successful dataset creation."""
@@ -378,3 +390,106 @@ def test_preview_dataset_error(mock_dataset_service):
 
     assert result.exit_code == 1
     assert "Failed to preview dataset" in result.stdout
+
+
+# Tests for 'files upload' command
+def test_upload_file_success(mock_dataset_service, tmp_path):
+    """Test file upload reports the uploaded file."""
+    local_file = tmp_path / "data.csv"
+    local_file.write_text("a,b\n1,2\n")
+    mock_dataset_service.upload_file.return_value = {
+        "file_path": str(local_file),
+        "size_bytes": 8,
+    }
+
+    result = runner.invoke(
+        app, ["files", "upload", str(local_file), "ri.foundry.main.dataset.test"]
+    )
+
+    assert result.exit_code == 0
+    assert "File uploaded successfully" in result.stdout
+    mock_dataset_service.upload_file.assert_called_once_with(
+        "ri.foundry.main.dataset.test", str(local_file), "master", None
+    )
+
+
+def test_upload_file_missing_or_not_a_file(mock_dataset_service, tmp_path):
+    """Test missing paths and directories are rejected once, before uploading."""
+    for path, message in (
+        (tmp_path / "missing.csv", "File not found"),
+        (tmp_path, "Not a regular file"),
+    ):
+        result = runner.invoke(
+            app, ["files", "upload", str(path), "ri.foundry.main.dataset.test"]
+        )
+
+        assert result.exit_code == 1
+        assert message in result.stdout
+        assert "Upload failed" not in result.stdout
+
+    mock_dataset_service.upload_file.assert_not_called()
+
+
+def test_list_files_streams_json_to_file(mock_dataset_service, tmp_path):
+    """Test JSON file output is written page by page from the page generator."""
+
+    def iter_pages(dataset_rid, branch, config, metadata):
+        yield [{"path": "a.csv"}]
+        metadata.current_page = 1
+        metadata.items_fetched = 1
+        metadata.total_pages_fetched = 1
+
+    mock_dataset_service.iter_files_pages.side_effect = iter_pages
+    output = tmp_path / "files.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "files",
+            "list",
+            "ri.foundry.main.dataset.test",
+            "--format",
+            "json",
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(output.read_text()) == {
+        "data": [{"path": "a.csv"}],
+        "pagination": {
+            "page": 1,
+            "items_count": 1,
+            "has_more": False,
+            "total_pages_fetched": 1,
+        },
+    }
+    mock_dataset_service.list_files_paginated.assert_not_called()
+
+
+def test_list_files_stream_failure_leaves_no_file(mock_dataset_service, tmp_path):
+    """Test a failed page fetch removes the partly written CSV file."""
+
+    def iter_pages(dataset_rid, branch, config, metadata):
+        yield [{"path": "a.csv"}]
+        raise RuntimeError("Failed to list files: boom")
+
+    mock_dataset_service.iter_files_pages.side_effect = iter_pages
+
+    result = runner.invoke(
+        app,
+        [
+            "files",
+            "list",
+            "ri.foundry.main.dataset.test",
+            "--all",
+            "--format",
+            "csv",
+            "--output",
+            str(tmp_path / "files.csv"),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert list(tmp_path.iterdir()) == []
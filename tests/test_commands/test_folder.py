@@ -330,7 +330,9 @@ def test_create_folder_with_profile(runner, mock_folder_service, sample_folder):
     assert "Successfully created folder 'Test Folder'" in result.stdout
 
 
-def test_get_folder_with_output_file(runner, mock_folder_service, sample_folder):
+def test_get_folder_with_output_file(
+    runner, mock_folder_service, sample_folder, tmp_path
+):
     """Test getting folder with output file."""
     mock_folder_service.get_folder.return_value = sample_folder
 
@@ -341,17 +343,20 @@ def test_get_folder_with_output_file(runner, mock_folder_service, sample_folder)
             "get",
             "ri.compass.main.folder.test-folder",
             "--output",
-            "folder_info.json",
+            str(tmp_path / "folder_info.json"),
             "--format",
             "json",
         ],
     )
 
     assert result.exit_code == 0
-    assert "Folder information saved to folder_info.json" in result.stdout
+    assert "Folder information saved to" in result.stdout
+    assert (tmp_path / "folder_info.json").exists()
 
 
-def test_list_children_with_output_file(runner, mock_folder_service, sample_children):
+def test_list_children_with_output_file(
+    runner, mock_folder_service, sample_children, tmp_path
+):
     """Test listing children with output file."""
     mock_folder_service.list_children.return_value = sample_children
 
@@ -362,17 +367,20 @@ def test_list_children_with_output_file(runner, mock_folder_service, sample_chil
             "list",
             "ri.compass.main.folder.parent",
             "--output",
-            "children.csv",
+            str(tmp_path / "children.csv"),
             "--format",
             "csv",
         ],
     )
 
     assert result.exit_code == 0
-    assert "Folder children saved to children.csv" in result.stdout
+    assert "Folder children saved to" in result.stdout
+    assert (tmp_path / "children.csv").exists()
 
 
-def test_batch_get_with_output_file(runner, mock_folder_service, sample_folder):
+def test_batch_get_with_output_file(
+    runner, mock_folder_service, sample_folder, tmp_path
+):
     """Test batch get with output file."""
     mock_folder_service.get_folders_batch.return_value = [sample_folder]
 
@@ -383,11 +391,12 @@ def test_batch_get_with_output_file(runner, mock_folder_service, sample_folder):
             "batch-get",
             "ri.compass.main.folder.folder1",
             "--output",
-            "folders.json",
+            str(tmp_path / "folders.json"),
             "--format",
             "json",
         ],
     )
 
     assert result.exit_code == 0
-    assert "Folders information saved to folders.json" in result.stdout
+    assert "Folders information saved to" in result.stdout
+    assert (tmp_path / "folders.json").exists()
@@ -603,7 +603,7 @@ class TestFunctionsCommands:
 
     # ===== File Output Tests =====
 
-    def test_query_get_with_output_file(self, runner, mock_service):
+    def test_query_get_with_output_file(self, runner, mock_service, tmp_path):
         """Test query get with output file."""
         # Setup
         query_result = {"rid": "ri.functions.main.query.abc123", "apiName": "myQuery"}
@@ -618,7 +618,7 @@ class TestFunctionsCommands:
                 "get",
                 "myQuery",
                 "--output",
-                "output.json",
+                str(tmp_path / "output.json"),
                 "--format",
                 "json",
             ],
@@ -626,4 +626,5 @@ class TestFunctionsCommands:
 
         # Assert
         assert result.exit_code == 0
-        assert "saved to output.json" in result.stdout
+        assert "saved to" in result.stdout
+        assert (tmp_path / "output.json").exists()
@@ -102,11 +102,11 @@ class TestSqlCommands:
 
         with (
             patch("pltr.commands.sql.SqlService") as mock_service_class,
-            patch("pltr.commands.sql.OutputFormatter") as mock_formatter_class,
+            patch("pltr.commands.sql._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
-            mock_formatter = Mock()
-            mock_formatter_class.return_value = mock_formatter
+            mock_formatter_instance = Mock()
+            mock_formatter.return_value = mock_formatter_instance
 
             result = runner.invoke(
                 app,
@@ -122,7 +122,7 @@ class TestSqlCommands:
 
         # Assert
         assert result.exit_code == 0
-        mock_formatter.save_to_file.assert_called_once()
+        mock_formatter_instance.save_to_file.assert_called_once()
 
     def test_execute_command_error(self, runner, mock_service):
         """Test execute command with service error."""
@@ -251,11 +251,11 @@ class TestSqlCommands:
 
         with (
             patch("pltr.commands.sql.SqlService") as mock_service_class,
-            patch("pltr.commands.sql.OutputFormatter") as mock_formatter_class,
+            patch("pltr.commands.sql._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
-            mock_formatter = Mock()
-            mock_formatter_class.return_value = mock_formatter
+            mock_formatter_instance = Mock()
+            mock_formatter.return_value = mock_formatter_instance
 
             result = runner.invoke(
                 app,
@@ -271,7 +271,7 @@ class TestSqlCommands:
 
         # Assert
         assert result.exit_code == 0
-        mock_formatter.save_to_file.assert_called_once()
+        mock_formatter_instance.save_to_file.assert_called_once()
 
     def test_cancel_command_success(self, runner, mock_service):
         """Test cancel command success."""
@@ -301,11 +301,11 @@ class TestSqlCommands:
 
         with (
             patch("pltr.commands.sql.SqlService") as mock_service_class,
-            patch("pltr.commands.sql.OutputFormatter") as mock_formatter_class,
+            patch("pltr.commands.sql._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
-            mock_formatter = Mock()
-            mock_formatter_class.return_value = mock_formatter
+            mock_formatter_instance = Mock()
+            mock_formatter.return_value = mock_formatter_instance
 
             result = runner.invoke(
                 app,
@@ -322,7 +322,7 @@ class TestSqlCommands:
         assert result.exit_code == 0
         assert "Query executed and results saved" in result.stdout
         mock_service.execute_query.assert_called_once()
-        mock_formatter.save_to_file.assert_called_once()
+        mock_formatter_instance.save_to_file.assert_called_once()
 
     def test_export_command_auto_format_detection(self, runner, mock_service):
         """Test export command with auto format detection."""
@@ -336,11 +336,11 @@ class TestSqlCommands:
 
         with (
             patch("pltr.commands.sql.SqlService") as mock_service_class,
-            patch("pltr.commands.sql.OutputFormatter") as mock_formatter_class,
+            patch("pltr.commands.sql._formatter") as mock_formatter,
         ):
             mock_service_class.return_value = mock_service
-            mock_formatter = Mock()
-            mock_formatter_class.return_value = mock_formatter
+            mock_formatter_instance = Mock()
+            mock_formatter.return_value = mock_formatter_instance
 
             # Test .csv extension
             result = runner.invoke(
@@ -349,7 +349,7 @@ class TestSqlCommands:
 
             # Assert CSV format was detected
             assert result.exit_code == 0
-            mock_formatter.save_to_file.assert_called_once()
+            mock_formatter_instance.save_to_file.assert_called_once()
             # Check that CSV format was used (through service call)
             args, kwargs = mock_service.execute_query.call_args
             assert kwargs["format"] == "table"  # table format for CSV output
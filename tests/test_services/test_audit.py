@@ -0,0 +1,98 @@
+"""Tests for Audit service."""
+
+from datetime import date
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from pltr.services.audit import AuditService
+
+
+class TestAuditService:
+    """Test Audit service functionality."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock Foundry client."""
+        client = Mock()
+        client.audit = Mock()
+        client.audit.Organization = Mock()
+        client.audit.Organization.LogFile = Mock()
+        return client
+
+    @pytest.fixture
+    def service(self, mock_client):
+        """Create AuditService with mocked client."""
+        with patch("pltr.services.base.AuthManager") as mock_auth:
+            mock_auth.return_value.get_client.return_value = mock_client
+            return AuditService()
+
+    def test_list_log_files_filters_server_side(self, service, mock_client):
+        """Test date range and page size are sent to the API, not applied locally."""
+        log_file = Mock()
+        log_file.dict.return_value = {"fileId": "2024-01-15"}
+        mock_client.audit.Organization.LogFile.list.return_value = iter([log_file])
+
+        result = service.list_log_files(
+            organization_rid="ri.multipass..organization.abc123",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            page_size=50,
+        )
+
+        mock_client.audit.Organization.LogFile.list.assert_called_once_with(
+            organization_rid="ri.multipass..organization.abc123",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            page_size=50,
+        )
+        assert result == [{"fileId": "2024-01-15"}]
+
+    def test_list_log_files_omits_unset_filters(self, service, mock_client):
+        """Test unset optional filters are not sent to the API."""
+        mock_client.audit.Organization.LogFile.list.return_value = iter([])
+
+        service.list_log_files(
+            organization_rid="ri.multipass..organization.abc123",
+            start_date=date(2024, 1, 1),
+        )
+
+        mock_client.audit.Organization.LogFile.list.assert_called_once_with(
+            organization_rid="ri.multipass..organization.abc123",
+            start_date=date(2024, 1, 1),
+        )
+
+    def test_download_log_file_streams_to_disk(self, service, mock_client, tmp_path):
+        """Test log file content is written chunk by chunk."""
+        response = Mock()
+        response.iter_bytes.return_value = iter([b"abc", b"def"])
+        streaming = MagicMock()
+        streaming.__enter__.return_value = response
+        log_file_api = mock_client.audit.Organization.LogFile
+        log_file_api.with_streaming_response.content.return_value = streaming
+        output = tmp_path / "audit.log"
+
+        size = service.download_log_file(
+            organization_rid="ri.multipass..organization.abc123",
+            log_file_id="2024-01-15",
+            output_path=output,
+            chunk_size=3,
+        )
+
+        assert size == 6
+        assert output.read_bytes() == b"abcdef"
+        response.iter_bytes.assert_called_once_with(chunk_size=3)
+
+    def test_download_log_file_error(self, service, mock_client, tmp_path):
+        """Test download failures name the download operation."""
+        log_file_api = mock_client.audit.Organization.LogFile
+        log_file_api.with_streaming_response.content.side_effect = Exception("boom")
+
+        with pytest.raises(
+            RuntimeError, match="Failed to download audit log file '2024-01-15'"
+        ):
+            service.download_log_file(
+                organization_rid="ri.multipass..organization.abc123",
+                log_file_id="2024-01-15",
+                output_path=tmp_path / "audit.log",
+            )
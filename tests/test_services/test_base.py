@@ -131,3 +131,116 @@ def test_invalid_service_missing_implementation():
     """Test that service without _get_service implementation fails."""
     with pytest.raises(TypeError):
         InvalidService()
+
+
+def test_make_request_reuses_shared_session():
+    """Test direct API requests go through one pooled HTTP session."""
+    service = MockService(profile="test")
+    credentials = {"host": "https://test.palantirfoundry.com/", "token": "abc"}
+
+    with (
+        patch("pltr.services.base.CredentialStorage") as mock_storage,
+        patch("pltr.services.base._http_session") as mock_session,
+    ):
+        mock_storage.return_value.get_profile.return_value = credentials
+        service._make_request("GET", "/api/v1/first")
+        service._make_request("GET", "/api/v1/second")
+
+    mock_session.return_value.request.assert_called_with(
+        method="GET",
+        url="https://test.palantirfoundry.com/api/v1/second",
+        data=None,
+        json=None,
+        headers={
+            "Authorization": "Bearer abc",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        },
+    )
+    assert mock_session.return_value.request.call_count == 2
+
+
+def test_get_service_caches_per_resolved_profile():
+    """Test services are reused per profile and None resolves to the active one."""
+    from pltr.services.base import get_service
+
+    with patch(
+        "pltr.services.base.ProfileManager.get_active_profile",
+        side_effect=["dev", "prod"],
+    ):
+        first = get_service(MockService, "dev")
+        assert get_service(MockService, "dev") is first
+        assert get_service(MockService) is first
+        assert get_service(MockService) is not first
+
+    assert first.profile == "dev"
+
+
+def test_get_service_rebuilt_after_profile_reconfigured(mock_keyring):
+    """Test re-configuring a profile drops services built from the old credentials."""
+    from pltr.auth.storage import CredentialStorage
+    from pltr.services.base import get_service
+
+    storage = CredentialStorage()
+    storage.save_profile(
+        "dev", {"auth_type": "token", "host": "https://old.example.com", "token": "a"}
+    )
+    with patch("pltr.auth.manager.TokenAuthProvider") as mock_provider_class:
+        first = get_service(MockService, "dev")
+        first.authenticate()
+        storage.save_profile(
+            "dev",
+            {"auth_type": "token", "host": "https://new.example.com", "token": "b"},
+        )
+        second = get_service(MockService, "dev")
+        second.authenticate()
+
+    assert second is not first
+    assert mock_provider_class.call_args_list[-1].kwargs == {
+        "token": "b",
+        "host": "https://new.example.com",
+    }
+
+
+@patch("pltr.services.base.AuthManager")
+def test_base_service_authenticate_builds_client_once(mock_auth_manager):
+    """Test authenticate() builds the client that the client property returns."""
+    service = MockService(profile="test")
+
+    service.authenticate()
+    service.authenticate()
+
+    mock_auth_manager.return_value.get_client.assert_called_once_with("test")
+    assert service.client is mock_auth_manager.return_value.get_client.return_value
+
+
+def test_stream_response_to_file_writes_every_chunk(tmp_path):
+    """Test streamed chunks are written in order and their size returned."""
+    response = Mock()
+    response.iter_bytes.return_value = iter([b"abc", b"", b"defg"])
+    output = tmp_path / "out.bin"
+
+    written = MockService._stream_response_to_file(response, output, 4)
+
+    assert written == 7
+    assert output.read_bytes() == b"abcdefg"
+    response.iter_bytes.assert_called_once_with(chunk_size=4)
+
+
+def test_stream_response_to_file_failure_keeps_existing_file(tmp_path):
+    """Test a mid-stream error leaves the old file intact and no partial file."""
+
+    def chunks(chunk_size):
+        yield b"new"
+        raise ConnectionError("connection reset")
+
+    response = Mock()
+    response.iter_bytes.side_effect = chunks
+    output = tmp_path / "out.bin"
+    output.write_bytes(b"old content")
+
+    with pytest.raises(ConnectionError):
+        MockService._stream_response_to_file(response, output, 4)
+
+    assert output.read_bytes() == b"old content"
+    assert list(tmp_path.iterdir()) == [output]
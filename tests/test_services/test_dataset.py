@@ -3,9 +3,10 @@ Tests for dataset service.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from pltr.services.dataset import DatasetService
+from pltr.utils.pagination import PaginationConfig, PaginationMetadata
 
 
 @pytest.fixture
@@ -423,6 +424,34 @@ def test_delete_file_success(mock_dataset_service):
     assert result["success"] is True
 
 
+def test_download_file_streams_to_disk(mock_dataset_service, tmp_path):
+    """Test file content is written chunk by chunk."""
+    service, mock_dataset_class = mock_dataset_service
+
+    response = Mock()
+    response.iter_bytes.return_value = iter([b"abc", b"def"])
+    streaming = MagicMock()
+    streaming.__enter__.return_value = response
+    mock_dataset_class.File.with_streaming_response.content.return_value = streaming
+    output = tmp_path / "nested" / "data.csv"
+
+    result = service.download_file(
+        "ri.foundry.main.dataset.test-dataset",
+        "data.csv",
+        output,
+        chunk_size=3,
+    )
+
+    assert result["size_bytes"] == 6
+    assert output.read_bytes() == b"abcdef"
+    response.iter_bytes.assert_called_once_with(chunk_size=3)
+    mock_dataset_class.File.with_streaming_response.content.assert_called_once_with(
+        dataset_rid="ri.foundry.main.dataset.test-dataset",
+        file_path="data.csv",
+        branch_name="master",
+    )
+
+
 def test_get_file_info_success(mock_dataset_service):
     """Test successful file info retrieval."""
     service, mock_dataset_class = mock_dataset_service
@@ -523,3 +552,34 @@ def test_add_backing_datasets_success(mock_dataset_service):
     mock_view_class.add_backing_datasets.assert_called_once_with(
         dataset_rid="ri.foundry.main.view.test", backing_datasets=dataset_rids
     )
+
+
+def test_iter_files_pages_follows_page_tokens(mock_dataset_service):
+    """Test files are yielded one page at a time using the page tokens."""
+    service, mock_dataset_class = mock_dataset_service
+
+    def file(path):
+        return Mock(path=path, size_bytes=1, last_modified=None, transaction_rid=None)
+
+    mock_dataset_class.File.list.side_effect = [
+        Mock(data=[file("a.csv"), file("b.csv")], next_page_token="token-2"),
+        Mock(data=[file("c.csv")], next_page_token=None),
+    ]
+    metadata = PaginationMetadata()
+
+    pages = service.iter_files_pages(
+        "ri.foundry.main.dataset.test-dataset",
+        "master",
+        PaginationConfig(page_size=2, fetch_all=True),
+        metadata,
+    )
+
+    assert [[f["path"] for f in page] for page in pages] == [
+        ["a.csv", "b.csv"],
+        ["c.csv"],
+    ]
+    assert metadata.items_fetched == 3
+    assert metadata.has_more is False
+    assert mock_dataset_class.File.list.call_args_list[1].kwargs["page_token"] == (
+        "token-2"
+    )
@@ -343,8 +343,12 @@ def test_upload_file_with_transaction(mock_dataset_service):
         assert result["branch"] == "master"
         assert result["uploaded"] is True
         assert result["transaction_rid"] == "ri.foundry.main.transaction.test"
+        assert result["size_bytes"] == len("test,data\n1,2\n")
 
         mock_dataset_class.File.upload.assert_called_once()
+        assert mock_dataset_class.File.upload.call_args.kwargs["body"] == (
+            b"test,data\n1,2\n"
+        )
 
     finally:
         # Clean up temp file
@@ -0,0 +1,33 @@
+"""
+Tests for concurrency helpers.
+"""
+
+import pytest
+
+from src.pltr.auth.base import ProfileNotFoundError
+from src.pltr.utils.concurrency import run_each
+
+
+class TestRunEach:
+    """Tests for run_each."""
+
+    def test_collects_failures_without_stopping(self):
+        """Test every ID is attempted and only failures are returned."""
+        seen = []
+
+        def fn(item_id):
+            seen.append(item_id)
+            if item_id == "b":
+                raise RuntimeError("boom")
+
+        assert run_each(["a", "b", "c"], fn, concurrency=2) == {"b": "boom"}
+        assert sorted(seen) == ["a", "b", "c"]
+
+    def test_reraise_types_propagate(self):
+        """Test exceptions listed in reraise reach the caller."""
+
+        def fn(item_id):
+            raise ProfileNotFoundError("missing")
+
+        with pytest.raises(ProfileNotFoundError):
+            run_each(["a"], fn, reraise=(ProfileNotFoundError,))
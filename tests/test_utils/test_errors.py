@@ -0,0 +1,80 @@
+"""
+Tests for CLI error handling utilities.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import typer
+
+from src.pltr.auth.base import ProfileNotFoundError
+from src.pltr.utils.errors import handle_cli_errors
+
+
+@pytest.fixture
+def formatter():
+    return MagicMock()
+
+
+def _command(formatter, error):
+    @handle_cli_errors("Failed to do thing", lambda: formatter)
+    def command(value: str) -> str:
+        """Do the thing."""
+        if error is not None:
+            raise error
+        return value
+
+    return command
+
+
+class TestHandleCliErrors:
+    """Tests for handle_cli_errors."""
+
+    def test_returns_result_and_keeps_metadata(self, formatter):
+        """Test the wrapped command runs normally and keeps its signature."""
+        command = _command(formatter, None)
+
+        assert command("ok") == "ok"
+        assert command.__name__ == "command"
+        assert command.__doc__ == "Do the thing."
+        formatter.print_error.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error,message",
+        [
+            (ProfileNotFoundError("missing"), "Authentication error: missing"),
+            (ValueError("bad"), "Invalid request: bad"),
+            (RuntimeError("boom"), "Failed to do thing: boom"),
+        ],
+    )
+    def test_reports_errors_and_exits(self, formatter, error, message):
+        """Test each error class is reported with its prefix."""
+        with pytest.raises(typer.Exit) as exc_info:
+            _command(formatter, error)("x")
+
+        assert exc_info.value.exit_code == 1
+        formatter.print_error.assert_called_once_with(message)
+
+    @pytest.mark.parametrize(
+        "error", [typer.Exit(2), typer.BadParameter("nope"), typer.Abort()]
+    )
+    def test_click_exceptions_pass_through(self, formatter, error):
+        """Test Typer's own exceptions are re-raised without reporting."""
+        with pytest.raises(type(error)):
+            _command(formatter, error)("x")
+
+        formatter.print_error.assert_not_called()
+
+    def test_value_errors_can_keep_failure_message(self, formatter):
+        """Test invalid_request_message=None reports ValueErrors like other errors."""
+
+        @handle_cli_errors(
+            "Failed to do thing", lambda: formatter, invalid_request_message=None
+        )
+        def command() -> None:
+            raise ValueError("bad")
+
+        with pytest.raises(typer.Exit):
+            command()
+
+        formatter.print_error.assert_called_once_with("Failed to do thing: bad")
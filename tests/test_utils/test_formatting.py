@@ -0,0 +1,88 @@
+"""
+Tests for output formatting utilities.
+"""
+
+import json
+from datetime import datetime
+from io import StringIO
+from unittest.mock import patch
+
+from src.pltr.utils import formatting
+from src.pltr.utils.formatting import OutputFormatter
+
+
+class TestCsvOutput:
+    """Tests for CSV rendering."""
+
+    def test_write_csv_header_and_cells(self):
+        """Test columns are the sorted key union and cells are stringified."""
+        buf = StringIO()
+        OutputFormatter()._write_csv(
+            buf,
+            [
+                {"name": "a", "size": 1, "tags": ["x"]},
+                {"name": "b", "extra": None, "meta": {"k": 1.5}},
+            ],
+        )
+
+        assert buf.getvalue().splitlines() == [
+            "extra,meta,name,size,tags",
+            ',,a,1,"[""x""]"',
+            ',"{""k"": 1.5}",b,,',
+        ]
+
+    def test_stream_csv_uses_first_page_columns(self):
+        """Test keys that only appear on later pages are dropped."""
+        buf = StringIO()
+        OutputFormatter()._stream_csv([[], [{"id": 1}], [{"id": 2, "late": True}]], buf)
+
+        assert buf.getvalue().splitlines() == ["id", "1", "2"]
+
+
+class TestJsonOutput:
+    """Tests for JSON rendering."""
+
+    def test_json_file_matches_printed_output(self, tmp_path, capsys):
+        """Test streamed file output is identical to the printed document."""
+        data = [{"id": i, "tags": ["a", "b"], "meta": {"n": None}} for i in range(3)]
+        output_file = tmp_path / "out.json"
+
+        formatter = OutputFormatter()
+        printed = formatter._format_json(data)
+        formatter._format_json(data, str(output_file))
+
+        assert output_file.read_text() == printed
+
+    def test_json_list_file_written_item_by_item(self, tmp_path):
+        """Test list output is serialized per item with the dumps() layout."""
+        data = [{"id": i, "at": datetime(2024, 1, i + 1)} for i in range(3)]
+        output_file = tmp_path / "out.json"
+
+        with patch(
+            "src.pltr.utils.formatting.dumps", wraps=formatting.dumps
+        ) as mock_dumps:
+            OutputFormatter()._format_json(data, str(output_file))
+
+        assert mock_dumps.call_count == 3
+        expected = [{"id": i, "at": f"2024-01-0{i + 1}T00:00:00"} for i in range(3)]
+        assert output_file.read_text() == json.dumps(expected, indent=2)
+
+        OutputFormatter()._format_json([], str(output_file))
+        assert output_file.read_text() == "[]"
+
+
+class TestSaveToFile:
+    """Tests for saving results to files."""
+
+    def test_json_and_csv_never_build_a_table(self, tmp_path):
+        """Test file output serializes the data without rendering a Table."""
+        data = [{"id": i, "name": f"item-{i}"} for i in range(5)]
+        formatter = OutputFormatter()
+
+        with patch("src.pltr.utils.formatting.Table") as mock_table:
+            formatter.save_to_file(data, tmp_path / "out.json", "json")
+            formatter.save_to_file(data, tmp_path / "out.csv", "csv")
+            formatter.save_to_file(data[0], tmp_path / "one.json", "json")
+
+        mock_table.assert_not_called()
+        assert (tmp_path / "out.csv").read_text().splitlines()[1] == "0,item-0"
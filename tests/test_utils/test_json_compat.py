@@ -0,0 +1,108 @@
+"""
+Tests for JSON compatibility helpers.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.pltr.utils import json_compat
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestLoads:
+    """Tests for loads with and without orjson."""
+
+    def _patched(self, use_orjson):
+        orjson = json_compat.orjson if use_orjson else None
+        if use_orjson and orjson is None:
+            pytest.skip("orjson is not installed")
+        return patch.object(json_compat, "orjson", orjson)
+
+    def test_parses_str_and_bytes(self, use_orjson):
+        """Test str and bytes documents parse to the same value."""
+        with self._patched(use_orjson):
+            assert json_compat.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+            assert json_compat.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_invalid_json_raises_stdlib_error(self, use_orjson):
+        """Test parse errors are catchable as json.JSONDecodeError."""
+        with self._patched(use_orjson):
+            with pytest.raises(json.JSONDecodeError):
+                json_compat.loads("{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestDumps:
+    """Tests for dumps and dump_to_file with and without orjson."""
+
+    def _patched(self, use_orjson):
+        orjson = json_compat.orjson if use_orjson else None
+        if use_orjson and orjson is None:
+            pytest.skip("orjson is not installed")
+        return patch.object(json_compat, "orjson", orjson)
+
+    def test_matches_stdlib_layout(self, use_orjson):
+        """Test output is indented like json.dumps(indent=2)."""
+        data = {"a": [1, 2.5, None, True], "b": {}, "c": [], 1: "x"}
+        with self._patched(use_orjson):
+            assert json_compat.dumps(data) == json.dumps(data, indent=2)
+
+    def test_unsupported_values_use_str(self, use_orjson):
+        """Test values JSON cannot represent fall back to str()."""
+        with self._patched(use_orjson):
+            assert json.loads(json_compat.dumps({"s": {1}})) == {"s": "{1}"}
+
+    def test_wide_integers(self, use_orjson):
+        """Test integers beyond 64 bits are still serialized."""
+        with self._patched(use_orjson):
+            assert json_compat.dumps([2**70]) == json.dumps([2**70], indent=2)
+
+    def test_dump_to_file_matches_dumps(self, use_orjson, tmp_path):
+        """Test the file contents equal dumps() for the same value."""
+        data = [{"name": "café", "size": 1}]
+        output = tmp_path / "out.json"
+        with self._patched(use_orjson):
+            json_compat.dump_to_file(data, str(output))
+            assert output.read_text(encoding="utf-8") == json_compat.dumps(data)
+
+
+def test_orjson_and_stdlib_paths_match(tmp_path):
+    """Test datetimes, NaN and non-ASCII text come out the same on both paths."""
+    if json_compat.orjson is None:
+        pytest.skip("orjson is not installed")
+    data = {
+        "when": datetime(2024, 1, 1, 12, 0),
+        "score": float("nan"),
+        "limits": [float("inf"), 1.5],
+        "name": "café",
+    }
+
+    outputs = []
+    for orjson in (json_compat.orjson, None):
+        output = tmp_path / f"{orjson is None}.json"
+        with patch.object(json_compat, "orjson", orjson):
+            json_compat.dump_to_file(data, str(output))
+            outputs.append((json_compat.dumps(data), output.read_text("utf-8")))
+
+    assert outputs[0] == outputs[1]
+    assert json.loads(outputs[0][0]) == {
+        "when": "2024-01-01 12:00:00",
+        "score": None,
+        "limits": [None, 1.5],
+        "name": "café",
+    }
+    assert "café" in outputs[0][0]
+
+
+def test_stdlib_fallback_writes_null_and_unescaped_text():
+    """Test the fallback writes NaN as null and keeps non-ASCII text as-is."""
+    data = {"score": float("nan"), "limits": [float("-inf")], "name": "café"}
+    with patch.object(json_compat, "orjson", None):
+        output = json_compat.dumps(data)
+
+    assert output == (
+        '{\n  "score": null,\n  "limits": [\n    null\n  ],\n  "name": "café"\n}'
+    )
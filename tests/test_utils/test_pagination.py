@@ -2,12 +2,15 @@
 Tests for pagination utilities.
 """
 
+import pytest
+
 from src.pltr.utils.pagination import (
     PaginationConfig,
     PaginationMetadata,
     PaginationResult,
     ResponsePaginationHandler,
     IteratorPaginationHandler,
+    prefetch,
 )
 
 
@@ -213,6 +216,27 @@ class TestResponsePaginationHandler:
         assert len(result.data) == 4
         assert result.data == [3, 4, 5, 6]
 
+    def test_iter_pages_yields_each_page(self):
+        """Test pages are yielded one at a time and metadata filled at the end."""
+        page_data = {
+            None: {"data": [1, 2], "next_page_token": "token1"},
+            "token1": {"data": [3], "next_page_token": "token2"},
+        }
+
+        def fetch_fn(token):
+            return page_data[token]
+
+        handler = ResponsePaginationHandler()
+        config = PaginationConfig(max_pages=2)
+        metadata = PaginationMetadata()
+        pages = list(handler.iter_pages(fetch_fn, config, metadata))
+
+        assert pages == [[1, 2], [3]]
+        assert metadata.current_page == 2
+        assert metadata.items_fetched == 3
+        assert metadata.has_more is True
+        assert metadata.next_page_token == "token2"
+
 
 class MockIterator:
     """Mock iterator that mimics SDK's ResourceIterator with next_page_token property."""
@@ -319,3 +343,23 @@ class TestIteratorPaginationHandler:
         assert len(result.data) == 25
         assert result.metadata.current_page == 2  # page 1 (20 items) + page 2 (5 items)
         assert result.metadata.items_fetched == 25
+
+
+class TestPrefetch:
+    """Tests for the prefetch helper."""
+
+    def test_yields_items_in_order(self):
+        """Test all items are yielded in their original order."""
+        assert list(prefetch(iter(range(10)), depth=2)) == list(range(10))
+
+    def test_reraises_source_errors(self):
+        """Test errors from the source are raised in the consumer."""
+
+        def pages():
+            yield [1]
+            raise RuntimeError("page fetch failed")
+
+        consumer = prefetch(pages())
+        assert next(consumer) == [1]
+        with pytest.raises(RuntimeError, match="page fetch failed"):
+            next(consumer)
@@ -0,0 +1,106 @@
+"""
+Tests for progress utilities.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+from src.pltr.utils.progress import (
+    SPINNER_REFRESH_PER_SECOND,
+    SpinnerProgressTracker,
+    spinner,
+)
+
+
+class TestSpinnerProgressTracker:
+    """Tests for SpinnerProgressTracker."""
+
+    def test_track_spinner_skipped_when_not_terminal(self):
+        """Test no progress display is built and the message is never built."""
+        describe = MagicMock(return_value="Working...")
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = False
+            with patch("src.pltr.utils.progress.Progress") as mock_progress:
+                with SpinnerProgressTracker().track_spinner(describe):
+                    pass
+
+        mock_progress.assert_not_called()
+        describe.assert_not_called()
+
+    def test_track_spinner_resolves_callable_when_terminal(self):
+        """Test a callable description is evaluated once for the spinner."""
+        describe = MagicMock(return_value="Working...")
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = True
+            with patch("src.pltr.utils.progress.Progress") as mock_progress:
+                with SpinnerProgressTracker().track_spinner(describe):
+                    pass
+
+        describe.assert_called_once_with()
+        assert (
+            mock_progress.call_args.kwargs["refresh_per_second"]
+            == SPINNER_REFRESH_PER_SECOND
+        )
+        progress = mock_progress.return_value.__enter__.return_value
+        progress.add_task.assert_called_once_with("Working...")
+
+    def test_update_changes_running_description(self):
+        """Test update relabels the running spinner and is a no-op otherwise."""
+        tracker = SpinnerProgressTracker()
+        tracker.update("Ignored")
+
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = True
+            with patch("src.pltr.utils.progress.Progress") as mock_progress:
+                with tracker.track_spinner("Working..."):
+                    tracker.update("Step 2")
+
+        tracker.update("Ignored")
+        progress = mock_progress.return_value.__enter__.return_value
+        progress.update.assert_called_once_with(
+            progress.add_task.return_value, description="Step 2"
+        )
+
+
+class TestSpinner:
+    """Tests for the spinner helper."""
+
+    def test_spinner_is_noop_when_not_terminal(self):
+        """Test no tracker is created when output is not a terminal."""
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = False
+            with patch(
+                "src.pltr.utils.progress.SpinnerProgressTracker"
+            ) as mock_tracker:
+                with spinner("Working..."):
+                    pass
+
+        mock_tracker.assert_not_called()
+
+    def test_spinner_uses_tracker_when_terminal(self):
+        """Test the spinner tracker is used when output is a terminal."""
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = True
+            with patch(
+                "src.pltr.utils.progress.SpinnerProgressTracker"
+            ) as mock_tracker:
+                spinner("Working...")
+
+        mock_tracker.return_value.track_spinner.assert_called_once_with("Working...")
+
+    def test_spinner_disabled_by_environment(self):
+        """Test PLTR_NO_SPINNER turns spinners off even on a terminal."""
+        with patch("src.pltr.utils.progress.get_console") as mock_get_console:
+            mock_get_console.return_value.is_terminal = True
+            with (
+                patch.dict(os.environ, {"PLTR_NO_SPINNER": "1"}),
+                patch("src.pltr.utils.progress.SpinnerProgressTracker") as mock_tracker,
+                patch("src.pltr.utils.progress.Progress") as mock_progress,
+            ):
+                with spinner("Working..."):
+                    pass
+                with SpinnerProgressTracker().track_spinner("Working..."):
+                    pass
+
+        mock_tracker.assert_not_called()
+        mock_progress.assert_not_called()